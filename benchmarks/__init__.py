@@ -0,0 +1,4 @@
+"""
+Performance benchmarks for the Yahoo Finance MCP Server.
+Run from the repository root, e.g. ``python -m benchmarks.bench_indicators``.
+"""
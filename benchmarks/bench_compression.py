@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Measure bandwidth and latency savings of HTTP response compression.
+
+Starts benchmarks.fake_server in stateless mode and calls large and small
+tools over plain JSON-RPC POSTs to /mcp, once per Accept-Encoding (identity
+and every encoding the server can produce), recording the bytes on the wire
+and the client-side latency including decompression. The loopback latency is
+then projected onto WAN links (--link MBIT:RTT_MS): latency + RTT + wire
+bytes / bandwidth, which is what a remote client pays per call.
+
+Usage:
+    python -m benchmarks.bench_compression [--repeat 20] [--link 10:80 50:40 200:10]
+    python -m benchmarks.bench_compression --min-size 4096 --output compression.json
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import httpx
+
+from benchmarks.fake_upstream import expiration_dates
+from benchmarks.load_http import start_server
+from src.compression import available_encoders
+
+# Representative calls: full option chains and statements are the large ones, quotes the small
+CALLS: dict[str, dict] = {
+    "get_option_chain": {"ticker": "AAPL", "expiration_date": expiration_dates(1)[0], "option_type": "calls"},
+    "get_financial_statement": {"ticker": "AAPL", "financial_type": "quarterly_balance_sheet"},
+    "get_historical_stock_prices": {"ticker": "AAPL", "period": "1y", "interval": "1d"},
+    "get_stock_info": {"ticker": "AAPL"},
+}
+
+
+@dataclass
+class Measurement:
+    tool: str
+    encoding: str
+    content_encoding: str
+    body_bytes: int
+    wire_bytes: int
+    p50_ms: float
+    wan_ms: dict[str, float] = field(default_factory=dict)
+
+
+async def measure(client: httpx.AsyncClient, url: str, tool: str, encoding: str, repeat: int) -> Measurement:
+    payload = {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": tool, "arguments": CALLS[tool]}}
+    headers = {"Accept": "application/json, text/event-stream", "Accept-Encoding": encoding}
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        async with client.stream("POST", url, json=payload, headers=headers) as response:
+            response.raise_for_status()
+            body = b"".join([chunk async for chunk in response.aiter_bytes()])
+            wire = response.num_bytes_downloaded
+            content_encoding = response.headers.get("content-encoding", "identity")
+        timings.append((time.perf_counter() - started) * 1000)
+    return Measurement(tool, encoding, content_encoding, len(body), wire, statistics.median(timings))
+
+
+def project(measurement: Measurement, links: list[tuple[float, float]]) -> None:
+    for mbit, rtt_ms in links:
+        transfer_ms = measurement.wire_bytes * 8 / (mbit * 1e6) * 1000
+        measurement.wan_ms[f"{mbit:g}Mbit/{rtt_ms:g}ms"] = measurement.p50_ms + rtt_ms + transfer_ms
+
+
+async def run(url: str, encodings: list[str], args: argparse.Namespace) -> list[Measurement]:
+    results = []
+    async with httpx.AsyncClient(timeout=60) as client:
+        for tool in CALLS:
+            await measure(client, url, tool, "identity", 1)  # fill the server's caches
+            for encoding in encodings:
+                measurement = await measure(client, url, tool, encoding, args.repeat)
+                project(measurement, args.link)
+                results.append(measurement)
+    return results
+
+
+def format_ascii(results: list[Measurement]) -> str:
+    links = list(results[0].wan_ms) if results else []
+    header = f"{'tool':<28} {'encoding':<9} {'body KiB':>9} {'wire KiB':>9} {'ratio':>6} {'p50 ms':>8}" + "".join(f" {link:>15}" for link in links)
+    lines = [header, "-" * len(header)]
+    identity = {result.tool: result for result in results if result.encoding == "identity"}
+    for result in results:
+        reference = identity.get(result.tool)
+        ratio = result.wire_bytes / reference.wire_bytes if reference and reference.wire_bytes else 1.0
+        encoding = result.encoding if result.content_encoding != "identity" else f"{result.encoding}*" if result.encoding != "identity" else "identity"
+        wan = ""
+        for link in links:
+            cell = f"{result.wan_ms[link]:.1f}"
+            if reference and result is not reference:
+                cell += f" ({result.wan_ms[link] - reference.wan_ms[link]:+.0f})"
+            wan += f" {cell:>15}"
+        lines.append(
+            f"{result.tool:<28} {encoding:<9} {result.body_bytes / 1024:>9.1f} {result.wire_bytes / 1024:>9.1f} "
+            f"{ratio:>6.2f} {result.p50_ms:>8.2f}{wan}"
+        )
+    lines.append("* below the size threshold, sent uncompressed; WAN columns are projected ms (change vs identity)")
+    return "\n".join(lines)
+
+
+def parse_link(spec: str) -> tuple[float, float]:
+    mbit, _, rtt = spec.partition(":")
+    return float(mbit), float(rtt or 0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="Calls per tool and encoding")
+    parser.add_argument("--link", type=parse_link, nargs="+", default=[(10, 80), (50, 40), (200, 10)],
+                        help="WAN links as MBIT:RTT_MS")
+    parser.add_argument("--min-size", type=int, default=1024, help="Server compression threshold in bytes")
+    parser.add_argument("--output", type=Path, help="Also write the results as JSON")
+    args = parser.parse_args()
+
+    encodings = ["identity", *(name for name in ("zstd", "br", "gzip") if name in available_encoders())]
+    server_args = argparse.Namespace(stateless=True, history_rows=252, upstream_latency_ms=0.0, workers=1, server_log=None)
+    server, url = start_server(server_args, {"YF_MCP_HTTP__COMPRESSION_MIN_SIZE": str(args.min_size)})
+    try:
+        results = asyncio.run(run(url, encodings, args))
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+    print(format_ascii(results))
+
+    if args.output:
+        args.output.write_text(json.dumps([asdict(result) for result in results], indent=2) + "\n", encoding="utf-8")
+        print(f"results written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Bulk history through export_dataset against the same data as JSON tool results.
+
+For --tickers tickers of --rows daily bars from the fake upstream, the
+export is written as Parquet and as an Arrow IPC file. The JSON baseline
+calls get_historical_stock_prices once per ticker and serializes each
+result as the server would. Reported per path:
+
+* seconds, and the bytes of the file or the summed JSON results;
+* peak traced Python memory (tracemalloc) and the peak of pyarrow's memory
+  pool, which tracemalloc does not see. Both should stay flat as tickers
+  are added, because the writer holds one row group at a time.
+
+Usage:
+    python -m benchmarks.bench_export [--tickers 20 100] [--rows 2500]
+"""
+import argparse
+import asyncio
+import shutil
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable
+
+import pyarrow as pa
+
+from benchmarks.bench_tools import clear_state
+from benchmarks.fake_upstream import FakeUpstream
+from src import serialization
+from src.config import config
+from src.server import mcp
+
+
+async def run_tool(name: str, arguments: dict[str, Any]) -> Any:
+    return await mcp._tool_manager.get_tool(name).run(arguments, context=None, convert_result=False)
+
+
+async def json_results(tickers: list[str]) -> int:
+    metadata = mcp._tool_manager.get_tool("get_historical_stock_prices").fn_metadata
+    size = 0
+    for ticker in tickers:
+        result = await run_tool("get_historical_stock_prices", {"ticker": ticker, "period": "max", "interval": "1d"})
+        blocks, _ = serialization.convert_result(metadata, result)
+        size += len(blocks[0].text.encode())
+    return size
+
+
+async def export(tickers: list[str], file_format: str) -> int:
+    result = await run_tool("export_dataset", {
+        "tickers": tickers, "dataset": "history", "file_format": file_format, "period": "max", "file_name": f"bench-{len(tickers)}",
+    })
+    return result.size_bytes
+
+
+async def measure(action: Callable[[], Awaitable[int]]) -> tuple[float, int, float, float]:
+    """(seconds, bytes, peak traced MiB, peak pyarrow pool MiB)."""
+    clear_state()
+    pool = pa.default_memory_pool()
+    pool_base = pool.bytes_allocated()
+    tracemalloc.start()
+    start = time.perf_counter()
+    size = await action()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, size, peak / 2**20, (pool.max_memory() - pool_base) / 2**20
+
+
+async def run(args: argparse.Namespace) -> None:
+    directory = tempfile.mkdtemp(prefix="yf-mcp-export-")
+    config.export.directory = directory
+    config.analytics.max_tickers = max(config.analytics.max_tickers, max(args.tickers))
+    header = f"{'tickers':>8} {'path':<8} {'seconds':>8} {'MiB':>8} {'traced MiB':>11} {'arrow MiB':>10}"
+    print(header)
+    print("-" * len(header))
+    try:
+        with FakeUpstream(history_rows=args.rows).patch():
+            for count in args.tickers:
+                tickers = [f"T{i:04d}" for i in range(count)]
+                for name, action in (
+                    ("json", lambda tickers=tickers: json_results(tickers)),
+                    ("parquet", lambda tickers=tickers: export(tickers, "parquet")),
+                    ("arrow", lambda tickers=tickers: export(tickers, "arrow")),
+                ):
+                    seconds, size, traced, arrow = await measure(action)
+                    print(f"{count:>8} {name:<8} {seconds:>8.2f} {size / 2**20:>8.1f} {traced:>11.1f} {arrow:>10.1f}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tickers", type=int, nargs="+", default=[20, 100], help="Tickers per export")
+    parser.add_argument("--rows", type=int, default=2_500, help="Daily bars per ticker (10 years is ~2500)")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Memory-mapped history store against the SQLite shared cache.
+
+One history of --rows hourly bars from the fake upstream is written to a
+MappedHistoryCache directory and to a SharedTTLCache file. Then:
+
+* lookup: a fresh cache instance (as in another worker, nothing in
+  process) reads the entry back, for the stored period and for a slice of
+  it ('1mo' of a 'max' history);
+* workers: --workers processes read the entry at the same time and touch
+  every column, reporting the anonymous memory each gained and its
+  proportional set size (Pss; pages shared through the page cache are
+  split between the processes mapping them).
+
+Usage:
+    python -m benchmarks.bench_history_store [--rows 100000 1000000] [--workers 4]
+"""
+import argparse
+import multiprocessing
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.fake_upstream import price_history
+from src.cache import SharedTTLCache
+from src.history_store import MappedHistoryCache
+
+KEY = ("BENCH", "max", "1h")
+SLICE = ("BENCH", "1mo", "1h")
+
+
+def open_cache(kind: str, path: str):
+    if kind == "mapped":
+        return MappedHistoryCache("history", ttl=3600, path=path)
+    return SharedTTLCache("history", ttl=3600, path=path)
+
+
+def smaps() -> dict[str, int]:
+    """This process's memory totals in KiB, from /proc/self/smaps_rollup."""
+    totals = {}
+    for line in Path("/proc/self/smaps_rollup").read_text().splitlines()[1:]:
+        name, value, *_ = line.split()
+        totals[name.rstrip(":")] = int(value)
+    return totals
+
+
+def lookup_ms(kind: str, path: str, key: tuple, iterations: int) -> float:
+    durations = []
+    for _ in range(iterations):
+        cache = open_cache(kind, path)
+        start = time.perf_counter()
+        frame = cache.get(key)
+        durations.append((time.perf_counter() - start) * 1000)
+        assert frame is not None
+    return statistics.median(durations)
+
+
+def worker(kind: str, path: str, barrier) -> tuple[float, float]:
+    """Anonymous MiB gained by reading and touching the history, and Pss MiB while holding it."""
+    cache = open_cache(kind, path)
+    before = smaps()["Anonymous"]
+    frame = cache.get(KEY)
+    for name in frame.columns:
+        float(np.nansum(frame[name].to_numpy()))
+    barrier.wait()
+    after = smaps()
+    barrier.wait()
+    return (after["Anonymous"] - before) / 1024, after["Pss"] / 1024
+
+
+def workers(kind: str, path: str, count: int) -> tuple[float, float]:
+    context = multiprocessing.get_context("spawn")
+    with context.Manager() as manager:
+        barrier = manager.Barrier(count)
+        with context.Pool(count) as pool:
+            results = pool.starmap(worker, [(kind, path, barrier)] * count)
+    return statistics.mean(r[0] for r in results), statistics.mean(r[1] for r in results)
+
+
+def run(args: argparse.Namespace) -> None:
+    header = (
+        f"{'rows':>9} {'store':<7} {'MiB':>7} {'lookup ms':>10} {'1mo slice ms':>13} "
+        f"{'anon MiB/worker':>16} {'Pss MiB/worker':>15}"
+    )
+    print(header)
+    print("-" * len(header))
+    for rows in args.rows:
+        frame = price_history(rows, seed=1, interval="1h")
+        with tempfile.TemporaryDirectory(prefix="yf-mcp-store-") as directory:
+            paths = {"mapped": str(Path(directory) / "history"), "sqlite": str(Path(directory) / "cache.sqlite3")}
+            for kind, path in paths.items():
+                open_cache(kind, path).set(KEY, frame)
+                size = sum(file.stat().st_size for file in Path(path).rglob("*") if file.is_file()) if kind == "mapped" else Path(path).stat().st_size
+                full = lookup_ms(kind, path, KEY, args.iterations)
+                sliced = lookup_ms(kind, path, SLICE, args.iterations) if kind == "mapped" else float("nan")
+                anon, pss = workers(kind, path, args.workers)
+                print(
+                    f"{rows:>9} {kind:<7} {size / 2**20:>7.1f} {full:>10.2f} {sliced:>13.2f} "
+                    f"{anon:>16.1f} {pss:>15.1f}"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000], help="Bars in the stored history")
+    parser.add_argument("--workers", type=int, default=4, help="Processes reading the history at once")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed lookups per store")
+    args = parser.parse_args()
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Measure the effect of each HTTP server tuning option with the load harness.
+
+Every variant starts its own benchmarks.fake_server with one HTTPConfig
+option changed (YF_MCP_HTTP__* variables), runs the load_http steps against
+it, then stops it with SIGTERM while requests are in flight and times the
+drain. Variants whose optional package (uvloop, httptools) is not installed
+are skipped.
+
+Usage:
+    python -m benchmarks.bench_http_options [--concurrency 8 32] [--mix mixed] [--duration 10]
+    python -m benchmarks.bench_http_options --only baseline loop=uvloop http=httptools
+"""
+import argparse
+import asyncio
+import importlib.util
+import json
+import logging
+import signal
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from benchmarks.load_http import LoadTest, Step, parse_mix, start_server
+
+# Variant name -> (server settings, package the variant needs)
+VARIANTS: dict[str, tuple[dict[str, str], str | None]] = {
+    "baseline": ({}, None),
+    "loop=asyncio": ({"YF_MCP_HTTP__LOOP": "asyncio"}, None),
+    "loop=uvloop": ({"YF_MCP_HTTP__LOOP": "uvloop"}, "uvloop"),
+    "http=h11": ({"YF_MCP_HTTP__HTTP_PARSER": "h11"}, None),
+    "http=httptools": ({"YF_MCP_HTTP__HTTP_PARSER": "httptools"}, "httptools"),
+    "keep-alive=1": ({"YF_MCP_HTTP__KEEP_ALIVE_TIMEOUT": "1"}, None),
+    "keep-alive=60": ({"YF_MCP_HTTP__KEEP_ALIVE_TIMEOUT": "60"}, None),
+    "backlog=16": ({"YF_MCP_HTTP__BACKLOG": "16"}, None),
+    # A stateful session holds about two connections (its GET stream and a POST)
+    "max-connections=48": ({"YF_MCP_HTTP__MAX_CONNECTIONS": "48"}, None),
+    "drain=2": ({"YF_MCP_HTTP__GRACEFUL_SHUTDOWN_TIMEOUT": "2"}, None),
+}
+
+
+@dataclass
+class VariantResult:
+    variant: str
+    settings: dict[str, str]
+    steps: list[Step] = field(default_factory=list)
+    shutdown_s: float | None = None
+    skipped: str | None = None
+
+
+async def load_then_stop(test: LoadTest, server, args: argparse.Namespace) -> tuple[list[Step], float]:
+    """Run every step, then SIGTERM the server under load and time its exit."""
+    mix = parse_mix(args.mix)
+    await test.warm_up(mix)
+    steps = [await test.step(concurrency, args.mix, mix, args.duration) for concurrency in args.concurrency]
+
+    # Keep requests in flight while the server drains; their broken streams are expected
+    logging.getLogger("mcp.client.streamable_http").setLevel(logging.CRITICAL)
+    load = asyncio.create_task(test.step(max(args.concurrency), args.mix, mix, args.drain_load))
+    await asyncio.sleep(min(1.0, args.drain_load / 2))
+    stopping = time.perf_counter()
+    server.send_signal(signal.SIGTERM)
+    while server.poll() is None and time.perf_counter() - stopping < args.shutdown_timeout:
+        await asyncio.sleep(0.05)
+    shutdown = time.perf_counter() - stopping
+    load.cancel()
+    await asyncio.gather(load, return_exceptions=True)
+    logging.getLogger("mcp.client.streamable_http").setLevel(logging.NOTSET)
+    return steps, shutdown
+
+
+def run_variant(name: str, args: argparse.Namespace) -> VariantResult:
+    settings, package = VARIANTS[name]
+    result = VariantResult(name, settings)
+    if package and importlib.util.find_spec(package) is None:
+        result.skipped = f"{package} not installed"
+        return result
+
+    server, url = start_server(args, settings)
+    try:
+        test = LoadTest(url, server.pid, [f"L{i:03d}" for i in range(args.tickers)], args.call_timeout, args.seed)
+        result.steps, result.shutdown_s = asyncio.run(load_then_stop(test, server, args))
+    finally:
+        if server.poll() is None:
+            server.kill()
+        server.wait(timeout=10)
+    return result
+
+
+def format_ascii(results: list[VariantResult]) -> str:
+    header = f"{'variant':<20} {'sessions':>8} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'err %':>7} {'connect ms':>10} {'drain s':>8}"
+    lines = [header, "-" * len(header)]
+    baseline = {step.concurrency: step for result in results if result.variant == "baseline" for step in result.steps}
+    for result in results:
+        if result.skipped:
+            lines.append(f"{result.variant:<20} skipped: {result.skipped}")
+            continue
+        for step in result.steps:
+            change = ""
+            reference = baseline.get(step.concurrency)
+            if reference and reference.throughput and result.variant != "baseline":
+                change = f"  ({(step.throughput - reference.throughput) / reference.throughput:+.1%} req/s)"
+            drain = f"{result.shutdown_s:8.2f}" if result.shutdown_s is not None else f"{'n/a':>8}"
+            lines.append(
+                f"{result.variant:<20} {step.concurrency:>8} {step.throughput:>9.1f} {step.p50_ms:>9.1f} {step.p99_ms:>9.1f} "
+                f"{step.error_rate * 100:>7.2f} {step.connect_p50_ms:>10.1f} {drain}{change}"
+            )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="+", choices=list(VARIANTS), help="Variants to run (default: all)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[8, 32], help="Concurrent sessions per step")
+    parser.add_argument("--mix", default="mixed", help="Tool mix (see benchmarks.load_http)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load per step")
+    parser.add_argument("--drain-load", type=float, default=4.0, help="Seconds of load started before SIGTERM")
+    parser.add_argument("--shutdown-timeout", type=float, default=30.0, help="Seconds to wait for the server to exit")
+    parser.add_argument("--tickers", type=int, default=50, help="Distinct symbols requested")
+    parser.add_argument("--call-timeout", type=float, default=60.0, help="Seconds before a call counts as failed")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Also write the results as JSON")
+    server_options = parser.add_argument_group("started server")
+    server_options.add_argument("--stateless", action="store_true", help="Run the server in stateless HTTP mode")
+    server_options.add_argument("--workers", type=int, default=1, help="Server worker processes")
+    server_options.add_argument("--history-rows", type=int, default=252, help="Bars per fake price history")
+    server_options.add_argument("--upstream-latency-ms", type=float, default=0.0, help="Delay of every fake upstream access")
+    server_options.add_argument("--server-log", help="File for the server's output")
+    args = parser.parse_args()
+
+    results = []
+    for name in args.only or VARIANTS:
+        print(f"  {name}", file=sys.stderr)
+        results.append(run_variant(name, args))
+    print(format_ascii(results))
+
+    if args.output:
+        args.output.write_text(json.dumps([asdict(result) for result in results], indent=2) + "\n", encoding="utf-8")
+        print(f"results written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark get_technical_indicators over a universe of synthetic tickers.
+
+Measures three paths per ticker:
+  - kernels: compute_indicators() on an in-memory frame
+  - cold:    full tool call (cache miss, fake upstream fetch + compute)
+  - warm:    full tool call served from the indicator memo cache
+
+Usage:
+    python -m benchmarks.bench_indicators [--tickers 500] [--bars 2520]
+"""
+import argparse
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from src.analytics import compute_indicators
+from src.market_data import history_cache, indicator_cache
+from src.models.enums import IndicatorType
+from src.server import get_technical_indicators
+
+
+ALL_INDICATORS = list(IndicatorType)
+
+
+def synthetic_frame(bars: int, seed: int) -> pd.DataFrame:
+    """Deterministic geometric random walk with OHLCV columns."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, bars)))
+    spread = np.abs(rng.normal(0, 0.005, bars)) * close
+    index = pd.date_range(end="2025-10-24", periods=bars, freq="B")
+    return pd.DataFrame({
+        "Open": close + rng.normal(0, 0.002, bars) * close,
+        "High": close + spread,
+        "Low": close - spread,
+        "Close": close,
+        "Volume": rng.integers(1_000_000, 50_000_000, bars),
+    }, index=index)
+
+
+def report(label: str, durations: list[float]) -> None:
+    ms = np.array(durations) * 1000
+    print(
+        f"{label:<8} total={ms.sum():9.1f} ms  per-ticker p50={np.percentile(ms, 50):7.3f} ms  "
+        f"p99={np.percentile(ms, 99):7.3f} ms  throughput={len(ms) / (ms.sum() / 1000):8.0f} tickers/s"
+    )
+
+
+async def run(tickers: int, bars: int) -> None:
+    symbols = [f"T{i:04d}" for i in range(tickers)]
+    frames = {symbol: synthetic_frame(bars, seed) for seed, symbol in enumerate(symbols)}
+
+    def fake_ticker(symbol):
+        mock = MagicMock()
+        mock.isin = "US0000000000"
+        mock.history.return_value = frames[symbol]
+        return mock
+
+    params = dict(period="10y", interval="1d", window=20, rsi_period=14, macd_fast=12, macd_slow=26,
+                  macd_signal=9, bollinger_std=2.0, atr_period=14, limit=100)
+
+    kernel = []
+    for symbol in symbols:
+        start = time.perf_counter()
+        compute_indicators(frames[symbol], ALL_INDICATORS, "1d")
+        kernel.append(time.perf_counter() - start)
+
+    history_cache.clear()
+    indicator_cache.clear()
+    cold, warm = [], []
+    with patch("yfinance.Ticker", side_effect=fake_ticker):
+        for timings in (cold, warm):
+            for symbol in symbols:
+                start = time.perf_counter()
+                await get_technical_indicators(ticker=symbol, indicators=ALL_INDICATORS, **params)
+                timings.append(time.perf_counter() - start)
+
+    print(f"Indicators: {', '.join(i.value for i in ALL_INDICATORS)} | {tickers} tickers x {bars} bars")
+    report("kernels", kernel)
+    report("cold", cold)
+    report("warm", warm)
+    print(f"indicator cache hit ratio: {indicator_cache.hit_ratio:.2%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tickers", type=int, default=500, help="Number of synthetic tickers")
+    parser.add_argument("--bars", type=int, default=2520, help="Bars per ticker (2520 = 10y daily)")
+    args = parser.parse_args()
+    asyncio.run(run(args.tickers, args.bars))
+
+
+if __name__ == "__main__":
+    main()
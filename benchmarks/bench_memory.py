@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Peak memory of one get_historical_stock_prices request, under tracemalloc.
+
+The history is fetched into the cache first, so both pipelines start from
+the same cached DataFrame (the typical hit). "records" is the conversion the
+tool used before src.series: reset_index(), to_dict(orient="records"), one
+normalized dict and one HistoricalPricePoint per bar. "series" is the tool
+as it is now, holding a PriceSeries over the frame's arrays. Each is
+measured once for building the response ("build") and once for building
+and converting it into MCP content ("request"), with the default
+src.serialization conversion.
+
+Usage:
+    python -m benchmarks.bench_memory [--rows 10000 100000 1000000]
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable
+
+import pandas as pd
+
+from benchmarks.bench_tools import TICKER, clear_state
+from benchmarks.fake_upstream import FakeUpstream
+from src import serialization
+from src.config import config
+from src.market_data import fetch_history
+from src.models import HistoricalPricePoint, HistoricalPriceResponse
+from src.models.base import construct
+from src.server import mcp
+
+TOOL = "get_historical_stock_prices"
+ARGUMENTS = {"ticker": TICKER, "period": "max", "interval": "1h"}
+
+
+async def records_tool(ticker: str, period: str, interval: str) -> HistoricalPriceResponse:
+    """The tool's conversion before src.series (trusted construction, as by default)."""
+    hist_data = fetch_history(ticker, period, interval).reset_index(names="Date")
+    records = hist_data.to_dict(orient="records")
+    data_points = [
+        construct(HistoricalPricePoint, dict(
+            date=str(rec["Date"]),
+            open=float(rec["Open"]) if rec.get("Open") and not pd.isna(rec["Open"]) else None,
+            high=float(rec["High"]) if rec.get("High") and not pd.isna(rec["High"]) else None,
+            low=float(rec["Low"]) if rec.get("Low") and not pd.isna(rec["Low"]) else None,
+            close=float(rec["Close"]) if rec.get("Close") and not pd.isna(rec["Close"]) else None,
+            volume=int(rec["Volume"]) if rec.get("Volume") and not pd.isna(rec["Volume"]) else None,
+            adj_close=float(rec.get("Adj Close")) if rec.get("Adj Close") and not pd.isna(rec.get("Adj Close")) else None
+        ))
+        for rec in records
+    ]
+    return HistoricalPriceResponse(ticker=ticker, period=period, interval=interval, data_points=data_points, count=len(data_points))
+
+
+async def series_tool(**arguments: Any) -> Any:
+    return await mcp._tool_manager.get_tool(TOOL).run(arguments, context=None, convert_result=False)
+
+
+async def peak(build: Callable[..., Awaitable[Any]], convert: bool) -> tuple[float, float]:
+    """Peak traced MiB above the starting point, and wall seconds (traced)."""
+    metadata = mcp._tool_manager.get_tool(TOOL).fn_metadata
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    result = await build(**ARGUMENTS)
+    if convert:
+        content = serialization.convert_result(metadata, result)
+        del content
+    elapsed = time.perf_counter() - start
+    del result
+    _, high = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (high - baseline) / 2**20, elapsed
+
+
+async def run(args: argparse.Namespace) -> None:
+    config.validate_models = False
+    header = f"{'rows':>9} {'stage':<8} {'records MiB':>12} {'series MiB':>11} {'ratio':>7} {'records s':>10} {'series s':>9}"
+    print(header)
+    print("-" * len(header))
+    for rows in args.rows:
+        with FakeUpstream(history_rows=rows).patch():
+            clear_state()
+            fetch_history(TICKER, ARGUMENTS["period"], ARGUMENTS["interval"])
+            for stage, convert in (("build", False), ("request", True)):
+                records_mib, records_s = await peak(records_tool, convert)
+                series_mib, series_s = await peak(series_tool, convert)
+                print(
+                    f"{rows:>9} {stage:<8} {records_mib:>12.2f} {series_mib:>11.2f} "
+                    f"{records_mib / series_mib:>6.1f}x {records_s:>10.2f} {series_s:>9.2f}"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000], help="Bars per price history")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Per-object cost of building response models in the tools' hot loops.
+
+The values are the normalized ones the tools produce against the fake
+upstream. Each model is built from them four ways: the validating
+constructor (one call per object, as the tools used to), model_construct(),
+one TypeAdapter pass over the whole list (``validate_models`` on) and
+src.models.base.construct (the default). Then the tools themselves are
+timed with validation on and off.
+
+Usage:
+    python -m benchmarks.bench_models [--rows 10000] [--iterations 10]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Callable
+
+from pydantic import BaseModel, TypeAdapter
+
+from benchmarks.bench_tools import TICKER, clear_state
+from benchmarks.fake_upstream import FakeUpstream
+from src.config import config
+from src.models.base import construct
+from src.server import mcp
+
+# Tool call -> attribute holding the list of models built in its loop
+SCENARIOS: dict[str, tuple[str, dict[str, Any], str]] = {
+    "HistoricalPricePoint": ("get_historical_stock_prices", {"period": "max", "interval": "1d"}, "data_points"),
+    "OptionContract": ("get_option_chain", {"option_type": "calls", "include_greeks": True}, "contracts"),
+    "NewsArticle": ("get_yahoo_finance_news", {}, "articles"),
+    "StockActionPoint": ("get_stock_actions", {}, "actions"),
+    "RecommendationPoint": ("get_recommendations", {"recommendation_type": "upgrades_downgrades", "months_back": 600}, "recommendations"),
+}
+
+
+def per_object_us(build: Callable[[], Any], count: int, iterations: int) -> float:
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        build()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations) / count * 1e6
+
+
+async def run_tool(tool: str, arguments: dict[str, Any]) -> Any:
+    clear_state()
+    return await mcp._tool_manager.get_tool(tool).run(arguments, context=None, convert_result=False)
+
+
+async def tool_ms(tool: str, arguments: dict[str, Any], iterations: int) -> float:
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await run_tool(tool, arguments)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations) * 1000
+
+
+async def run(args: argparse.Namespace) -> None:
+    upstream = FakeUpstream(history_rows=args.rows)
+    header = (
+        f"{'model':<22} {'objects':>8} {'per-object us':>14} {'model_construct':>16} {'TypeAdapter':>12} "
+        f"{'construct':>10} {'saved/obj':>10} | {'validated ms':>13} {'trusted ms':>11}"
+    )
+    print(header)
+    print("-" * len(header))
+    with upstream.patch():
+        for name, (tool, extra, attribute) in SCENARIOS.items():
+            arguments = {"ticker": TICKER, **extra}
+            if tool == "get_option_chain":
+                arguments["expiration_date"] = upstream.data(TICKER)["options"][0]
+
+            config.validate_models = True
+            response = await run_tool(tool, arguments)
+            objects: list[BaseModel] = getattr(response, attribute)
+            model = type(objects[0])
+            rows = [dict(obj.__dict__) for obj in objects]
+            adapter = TypeAdapter(list[model])
+
+            validate = per_object_us(lambda model=model, rows=rows: [model(**row) for row in rows], len(rows), args.iterations)
+            model_construct = per_object_us(
+                lambda model=model, rows=rows: [model.model_construct(**row) for row in rows], len(rows), args.iterations
+            )
+            bulk = per_object_us(lambda adapter=adapter, rows=rows: adapter.validate_python(rows), len(rows), args.iterations)
+            trusted = per_object_us(lambda model=model, rows=rows: [construct(model, dict(row)) for row in rows], len(rows), args.iterations)
+
+            validated_ms = await tool_ms(tool, arguments, args.iterations)
+            config.validate_models = False
+            trusted_ms = await tool_ms(tool, arguments, args.iterations)
+            print(
+                f"{name:<22} {len(rows):>8} {validate:>14.2f} {model_construct:>16.2f} {bulk:>12.2f} "
+                f"{trusted:>10.2f} {validate - trusted:>10.2f} | {validated_ms:>13.2f} {trusted_ms:>11.2f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000, help="Bars per fake price history")
+    parser.add_argument("--iterations", type=int, default=10, help="Timed builds per model")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
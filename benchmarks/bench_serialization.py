@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Compare FastMCP's result conversion with the fast path in src.serialization.
+
+Each tool runs once against the fake upstream to get its model result; then
+both conversions are timed on that same result, together with the transport
+step that writes the resulting CallToolResult as a JSON-RPC message (the
+fast path's compact text also makes that message smaller).
+
+Usage:
+    python -m benchmarks.bench_serialization [--rows 1000 10000] [--iterations 20]
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from mcp import types
+
+from benchmarks.bench_tools import TICKER, Scenario, clear_state
+from benchmarks.fake_upstream import FakeUpstream
+from src import serialization
+from src.server import mcp
+
+
+@dataclass
+class Result:
+    scenario: str
+    current_ms: float
+    fast_ms: float
+    current_wire_ms: float
+    fast_wire_ms: float
+    current_bytes: int
+    fast_bytes: int
+
+    @property
+    def speedup(self) -> float:
+        return (self.current_ms + self.current_wire_ms) / (self.fast_ms + self.fast_wire_ms)
+
+
+def scenarios(upstream: FakeUpstream, rows: list[int]) -> list[Scenario]:
+    expiration = upstream.data(TICKER)["options"][0]
+    chain = {"ticker": TICKER, "expiration_date": expiration, "option_type": "calls"}
+    return [
+        *(Scenario(f"historical_prices/{n}", "get_historical_stock_prices", {"ticker": TICKER, "period": "max", "interval": "1d"}, n) for n in rows),
+        Scenario("option_chain", "get_option_chain", chain),
+        Scenario("option_chain/greeks", "get_option_chain", {**chain, "include_greeks": True}),
+        Scenario("financial_statement/quarterly", "get_financial_statement", {"ticker": TICKER, "financial_type": "quarterly_balance_sheet"}),
+        Scenario("news", "get_yahoo_finance_news", {"ticker": TICKER}),
+        Scenario("stock_info", "get_stock_info", {"ticker": TICKER}),
+    ]
+
+
+def wire(content: Any) -> bytes:
+    """The JSON-RPC response the transport writes for converted tool output."""
+    blocks, structured = content
+    result = types.CallToolResult(content=list(blocks), structuredContent=structured, isError=False)
+    response = types.JSONRPCResponse(jsonrpc="2.0", id=1, result=result.model_dump(by_alias=True, mode="json", exclude_none=True))
+    return types.JSONRPCMessage(response).model_dump_json(by_alias=True, exclude_none=True).encode()
+
+
+def timed(fn: Callable[[], Any], iterations: int) -> tuple[float, Any]:
+    durations, value = [], None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        value = fn()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations), value
+
+
+async def measure(scenario: Scenario, iterations: int) -> Result:
+    clear_state()
+    tool = mcp._tool_manager.get_tool(scenario.tool)
+    result = await tool.run(scenario.arguments, context=None, convert_result=False)
+    metadata = tool.fn_metadata
+
+    current_ms, current = timed(lambda: metadata.convert_result(result), iterations)
+    fast_ms, fast = timed(lambda: serialization.convert_result(metadata, result), iterations)
+    current_wire_ms, current_message = timed(lambda: wire(current), iterations)
+    fast_wire_ms, fast_message = timed(lambda: wire(fast), iterations)
+    if json.loads(fast_message)["result"]["structuredContent"] != json.loads(current_message)["result"]["structuredContent"]:
+        raise AssertionError(f"{scenario.name}: structured content differs between the two paths")
+    return Result(scenario.name, current_ms, fast_ms, current_wire_ms, fast_wire_ms, len(current_message), len(fast_message))
+
+
+def format_ascii(results: list[Result]) -> str:
+    header = (
+        f"{'scenario':<32} {'convert ms':>11} {'fast ms':>9} {'wire ms':>9} {'fast wire':>10} "
+        f"{'KiB':>9} {'fast KiB':>9} {'speedup':>8}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r.scenario:<32} {r.current_ms:>11.3f} {r.fast_ms:>9.3f} {r.current_wire_ms:>9.3f} {r.fast_wire_ms:>10.3f} "
+            f"{r.current_bytes / 1024:>9.1f} {r.fast_bytes / 1024:>9.1f} {r.speedup:>7.2f}x"
+        )
+    return "\n".join(lines)
+
+
+async def run(args: argparse.Namespace) -> list[Result]:
+    results = []
+    for rows in args.rows:
+        upstream = FakeUpstream(history_rows=rows)
+        with upstream.patch():
+            for scenario in scenarios(upstream, [rows]):
+                if scenario.rows is None and rows != args.rows[0]:
+                    continue
+                print(f"  {scenario.name}", file=sys.stderr)
+                results.append(await measure(scenario, args.iterations))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000], help="Bars per price history")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed conversions per scenario")
+    parser.add_argument("--output", type=Path, help="Also write the results as JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print(f"parser: {serialization.loads.__module__}")
+    print(format_ascii(results))
+    if args.output:
+        rows = [{**asdict(result), "speedup": round(result.speedup, 3)} for result in results]
+        args.output.write_text(json.dumps(rows, indent=2) + "\n", encoding="utf-8")
+        print(f"results written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
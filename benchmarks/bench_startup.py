@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Benchmark server cold start and the import cost of each module.
+
+Every run is a fresh interpreter, so nothing is shared between runs except the
+operating system's file cache and the tool schema cache (the first run is
+discarded as a warm-up, and refreshes a stale schema cache).
+
+Three measurements:
+
+* import: ``python -X importtime -c "import src.server"``. The wall time of
+  the import and, per module, the self and cumulative import time reported
+  by the interpreter (median over runs).
+* deferred: the modules src.lazy leaves unloaded, imported after src.server
+  the way the warm-up thread does. This is the cost moved off the startup path.
+* handshake: spawn ``main.py`` over stdio and time until the initialize
+  response and the tools/list response arrive, as a client such as Claude
+  Desktop sees it.
+
+Results are written to benchmarks/results/startup-<commit>.json; pass
+--compare with an earlier file to print the change.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs 10] [--top 25]
+    python -m benchmarks.bench_startup --compare benchmarks/results/startup-8734768.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.bench_tools import RESULTS_DIR, change, git_revision
+
+ROOT = Path(__file__).resolve().parent.parent
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+IMPORT_SCRIPT = """
+import time
+start = time.perf_counter()
+import src.server
+print(time.perf_counter() - start)
+"""
+
+DEFERRED_SCRIPT = """
+import json, time
+import src.server
+from src.lazy import warm_up
+start = time.perf_counter()
+timings = warm_up()
+print(json.dumps({"total": time.perf_counter() - start, "modules": timings}))
+"""
+
+
+def python(script: str, importtime: bool = False) -> subprocess.CompletedProcess:
+    command = [sys.executable, *(["-X", "importtime"] if importtime else []), "-c", script]
+    # No warm-up thread, so it cannot compete with the measured imports
+    env = {**os.environ, "YF_MCP_WARM_UP": "false"}
+    return subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int, int]]:
+    """Module -> (self µs, cumulative µs, nesting depth) from -X importtime output."""
+    modules = {}
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules[name] = (int(self_us), int(cumulative_us), len(indent) // 2)
+    return modules
+
+
+def measure_import(runs: int) -> dict:
+    walls, samples = [], []
+    for _ in range(runs + 1):
+        completed = python(IMPORT_SCRIPT, importtime=True)
+        walls.append(float(completed.stdout.strip().splitlines()[-1]))
+        samples.append(parse_importtime(completed.stderr))
+    walls, samples = walls[1:], samples[1:]
+
+    modules = {}
+    for name in samples[0]:
+        values = [sample[name] for sample in samples if name in sample]
+        modules[name] = {
+            "self_ms": statistics.median(v[0] for v in values) / 1000,
+            "cumulative_ms": statistics.median(v[1] for v in values) / 1000,
+            "depth": values[0][2],
+        }
+    return {"wall_ms": statistics.median(walls) * 1000, "modules": modules}
+
+
+def measure_deferred(runs: int) -> dict:
+    totals, modules = [], {}
+    for _ in range(runs):
+        payload = json.loads(python(DEFERRED_SCRIPT).stdout.strip().splitlines()[-1])
+        totals.append(payload["total"])
+        for name, seconds in payload["modules"].items():
+            modules.setdefault(name, []).append(seconds)
+    return {
+        "total_ms": statistics.median(totals) * 1000 if totals else 0.0,
+        "modules": {name: statistics.median(values) * 1000 for name, values in modules.items()},
+    }
+
+
+async def handshake_once() -> tuple[float, float]:
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
+
+    params = StdioServerParameters(command=sys.executable, args=[str(ROOT / "main.py")], cwd=str(ROOT), env=dict(os.environ))
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull:
+        async with stdio_client(params, errlog=devnull) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                initialized = time.perf_counter() - start
+                await session.list_tools()
+                listed = time.perf_counter() - start
+    return initialized, listed
+
+
+def measure_handshake(runs: int) -> dict:
+    samples = [asyncio.run(handshake_once()) for _ in range(runs + 1)][1:]
+    return {
+        "initialize_ms": statistics.median(s[0] for s in samples) * 1000,
+        "list_tools_ms": statistics.median(s[1] for s in samples) * 1000,
+    }
+
+
+def top_packages(modules: dict) -> list[tuple[str, float]]:
+    """Cumulative import time of each top-level package imported directly or by src."""
+    packages = {}
+    for name, entry in modules.items():
+        root = name.split(".")[0]
+        if name == root or root == "src":
+            packages[name] = max(packages.get(name, 0.0), entry["cumulative_ms"])
+    return sorted(packages.items(), key=lambda item: item[1], reverse=True)
+
+
+def report(results: dict, top: int, baseline: dict | None) -> None:
+    def compared(value: float, key: str, section: str) -> str:
+        if not baseline:
+            return ""
+        return f"  ({change(value, baseline[section][key])})"
+
+    imported = results["import"]
+    print(f"import src.server       {imported['wall_ms']:9.1f} ms{compared(imported['wall_ms'], 'wall_ms', 'import')}")
+    deferred = results["deferred"]
+    print(f"deferred to warm-up     {deferred['total_ms']:9.1f} ms  "
+          + ", ".join(f"{name} {ms:.0f} ms" for name, ms in deferred["modules"].items()))
+    if "handshake" in results:
+        handshake = results["handshake"]
+        print(f"stdio initialize        {handshake['initialize_ms']:9.1f} ms"
+              f"{compared(handshake['initialize_ms'], 'initialize_ms', 'handshake') if baseline and 'handshake' in baseline else ''}")
+        print(f"stdio tools/list        {handshake['list_tools_ms']:9.1f} ms"
+              f"{compared(handshake['list_tools_ms'], 'list_tools_ms', 'handshake') if baseline and 'handshake' in baseline else ''}")
+
+    print(f"\n{'package':<40} {'cumulative':>12}")
+    for name, ms in top_packages(imported["modules"])[:top]:
+        print(f"{name:<40} {ms:9.1f} ms")
+
+    print(f"\n{'module (self time)':<40} {'self':>12} {'cumulative':>12}")
+    modules = sorted(imported["modules"].items(), key=lambda item: item[1]["self_ms"], reverse=True)
+    for name, entry in modules[:top]:
+        print(f"{name:<40} {entry['self_ms']:9.1f} ms {entry['cumulative_ms']:9.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="Fresh interpreters per measurement")
+    parser.add_argument("--top", type=int, default=25, help="Rows in the package and module tables")
+    parser.add_argument("--no-handshake", action="store_true", help="Skip the stdio handshake measurement")
+    parser.add_argument("--compare", type=Path, help="Earlier results file to compare against")
+    parser.add_argument("--output", type=Path, help="Results file (default: benchmarks/results/startup-<commit>.json)")
+    parser.add_argument("--no-save", action="store_true", help="Print the report without writing a results file")
+    args = parser.parse_args()
+
+    results = {"import": measure_import(args.runs), "deferred": measure_deferred(args.runs)}
+    if not args.no_handshake:
+        results["handshake"] = measure_handshake(args.runs)
+    baseline = json.loads(args.compare.read_text(encoding="utf-8"))["results"] if args.compare else None
+    report(results, args.top, baseline)
+
+    if not args.no_save:
+        commit, dirty = git_revision()
+        path = args.output or RESULTS_DIR / f"startup-{commit}{'-dirty' if dirty else ''}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "commit": commit,
+            "dirty": dirty,
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "parameters": {"runs": args.runs},
+            "results": results,
+        }
+        path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        print(f"\nresults written to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Benchmark every MCP tool against a deterministic fake upstream.
+
+Tools are called through mcp.call_tool, the path an MCP request takes:
+argument validation, the tool body and conversion of the result into MCP
+content inside a request trace, with the fast serializer, the slow-request
+log and the profiler as the server is configured (--no-telemetry turns the
+last two off). yfinance.Ticker is routed to benchmarks.fake_upstream. Caches are cleared before every call, so each
+iteration exercises the full fetch path.
+
+History-based tools are measured at every --rows size; batch tools only up
+to BATCH_MAX_ROWS bars per ticker. Option chains have 500 strikes and
+financial statements and holder tables 200 rows by default.
+
+For each scenario the report lists latency percentiles, throughput, peak
+traced memory of one extra call under tracemalloc, and the response size.
+Results are written to benchmarks/results/<commit>.json; pass --compare with
+an earlier file to print the change per scenario.
+
+Usage:
+    python -m benchmarks.bench_tools [--rows 1000 10000 100000 1000000] [--iterations 20]
+    python -m benchmarks.bench_tools --only option --compare benchmarks/results/1f0e122.json
+"""
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from mcp.server.lowlevel.server import request_ctx
+from mcp.shared.context import RequestContext
+
+from benchmarks.fake_upstream import FakeUpstream
+from src.market_data import CACHES, indicator_states
+from src.models.base import AppContext
+from src.models.enums import IndicatorType
+from src.server import mcp
+from src.telemetry import profiling, slowlog
+from src.telemetry.server import content_bytes
+
+RESULTS_DIR = Path(__file__).parent / "results"
+DEFAULT_ROWS = (1_000, 10_000, 100_000, 1_000_000)
+BATCH_MAX_ROWS = 100_000
+TICKER = "BENCH"
+
+
+@dataclass
+class Scenario:
+    name: str
+    tool: str
+    arguments: dict[str, Any]
+    rows: int | None = None
+
+
+@dataclass
+class Result:
+    scenario: str
+    tool: str
+    rows: int | None
+    iterations: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    throughput: float  # calls per second
+    peak_bytes: int
+    response_bytes: int
+    errors: int = 0
+
+
+def history_scenarios(rows: int, batch: int) -> list[Scenario]:
+    history = dict(period="max", interval="1h")
+    scenarios = [
+        Scenario(f"historical_prices/{rows}", "get_historical_stock_prices", {"ticker": TICKER, **history}, rows),
+        Scenario(f"price_summary/{rows}", "get_price_summary", {"ticker": TICKER, **history}, rows),
+        Scenario(
+            f"technical_indicators/{rows}", "get_technical_indicators",
+            {"ticker": TICKER, "indicators": [i.value for i in IndicatorType], **history}, rows,
+        ),
+    ]
+    if rows <= BATCH_MAX_ROWS:
+        tickers = [f"B{i:03d}" for i in range(batch)]
+        scenarios += [
+            Scenario(f"indicator_snapshot/{rows}x{batch}", "get_indicator_snapshot", {"tickers": tickers, "interval": "1h"}, rows),
+            Scenario(f"correlation_matrix/{rows}x{batch}", "get_correlation_matrix", {"tickers": tickers, **history}, rows),
+        ]
+    return scenarios
+
+
+def fixed_scenarios(upstream: FakeUpstream) -> list[Scenario]:
+    expiration = upstream.data(TICKER)["options"][0]
+    return [
+        Scenario("stock_info", "get_stock_info", {"ticker": TICKER}),
+        Scenario("news", "get_yahoo_finance_news", {"ticker": TICKER}),
+        Scenario("stock_actions", "get_stock_actions", {"ticker": TICKER}),
+        Scenario("financial_statement/annual", "get_financial_statement", {"ticker": TICKER, "financial_type": "income_stmt"}),
+        Scenario("financial_statement/quarterly", "get_financial_statement", {"ticker": TICKER, "financial_type": "quarterly_balance_sheet"}),
+        Scenario("holder_info/institutional", "get_holder_info", {"ticker": TICKER, "holder_type": "institutional_holders"}),
+        Scenario("holder_info/insider", "get_holder_info", {"ticker": TICKER, "holder_type": "insider_transactions"}),
+        Scenario("option_expirations", "get_option_expiration_dates", {"ticker": TICKER}),
+        Scenario("option_chain", "get_option_chain", {"ticker": TICKER, "expiration_date": expiration, "option_type": "calls"}),
+        Scenario(
+            "option_chain/greeks", "get_option_chain",
+            {"ticker": TICKER, "expiration_date": expiration, "option_type": "puts", "include_greeks": True},
+        ),
+        Scenario(
+            "option_chain/filtered", "get_option_chain",
+            {"ticker": TICKER, "expiration_date": expiration, "option_type": "calls", "moneyness_range": 0.1},
+        ),
+        Scenario("recommendations", "get_recommendations", {"ticker": TICKER, "recommendation_type": "recommendations"}),
+        Scenario(
+            "upgrades_downgrades", "get_recommendations",
+            {"ticker": TICKER, "recommendation_type": "upgrades_downgrades", "months_back": 60},
+        ),
+        Scenario("iv_surface", "get_iv_surface", {"ticker": TICKER, "max_expirations": upstream.expirations}),
+        Scenario("not_found", "get_stock_info", {"ticker": "MISSING"}),
+    ]
+
+
+def clear_state() -> None:
+    for cache in CACHES:
+        cache.clear()
+    indicator_states.clear()
+
+
+def is_error(content: Any) -> bool:
+    structured = content[1] if isinstance(content, tuple) else None
+    if isinstance(structured, dict):
+        # Union return types are wrapped as {"result": ...}
+        structured = structured.get("result", structured)
+    return isinstance(structured, dict) and "error" in structured
+
+
+class DiscardingSession:
+    """Session of the benchmark's request context; the tools' ctx.info messages go nowhere."""
+
+    async def send_log_message(self, **kwargs: Any) -> None:
+        pass
+
+
+async def call(scenario: Scenario) -> Any:
+    return await mcp.call_tool(scenario.tool, scenario.arguments)
+
+
+async def measure(scenario: Scenario, iterations: int) -> Result:
+    clear_state()
+    content = await call(scenario)  # warm-up: imports, lazy fake data
+    durations, errors = [], 0
+    for _ in range(iterations):
+        clear_state()
+        start = time.perf_counter()
+        content = await call(scenario)
+        durations.append(time.perf_counter() - start)
+        errors += is_error(content)
+
+    clear_state()
+    tracemalloc.start()
+    try:
+        await call(scenario)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    ms = np.array(durations) * 1000
+    return Result(
+        scenario=scenario.name,
+        tool=scenario.tool,
+        rows=scenario.rows,
+        iterations=iterations,
+        p50_ms=round(float(np.percentile(ms, 50)), 3),
+        p95_ms=round(float(np.percentile(ms, 95)), 3),
+        p99_ms=round(float(np.percentile(ms, 99)), 3),
+        mean_ms=round(float(ms.mean()), 3),
+        throughput=round(len(ms) / (ms.sum() / 1000), 3),
+        peak_bytes=peak,
+        response_bytes=content_bytes(content),
+        errors=errors,
+    )
+
+
+def iterations_for(rows: int | None, iterations: int, minimum: int) -> int:
+    """Fewer iterations for large histories, so a run at 1M bars stays in minutes."""
+    if rows is None:
+        return iterations
+    return max(minimum, min(iterations, iterations * 10_000 // rows))
+
+
+def report(result: Result, baseline: Result | None = None) -> None:
+    line = (
+        f"{result.scenario:<34} n={result.iterations:<4} p50={result.p50_ms:10.3f} ms  p95={result.p95_ms:10.3f} ms  "
+        f"p99={result.p99_ms:10.3f} ms  {result.throughput:9.2f}/s  peak={result.peak_bytes / 2**20:9.2f} MiB  "
+        f"resp={result.response_bytes / 1024:10.1f} KiB"
+    )
+    if result.errors:
+        line += f"  errors={result.errors}"
+    if baseline is not None:
+        line += f"  | p50 {change(result.p50_ms, baseline.p50_ms)}  peak {change(result.peak_bytes, baseline.peak_bytes)}"
+    print(line)
+
+
+def change(current: float, previous: float) -> str:
+    if not previous:
+        return "   n/a"
+    return f"{(current - previous) / previous:+6.1%}"
+
+
+def git_revision() -> tuple[str, bool]:
+    """Short commit hash of the working tree and whether it has uncommitted changes."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True, check=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+    return commit, dirty
+
+
+def load_baseline(path: Path) -> dict[str, Result]:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    return {entry["scenario"]: Result(**entry) for entry in payload["results"]}
+
+
+async def run(args: argparse.Namespace) -> list[Result]:
+    baseline = load_baseline(args.compare) if args.compare else {}
+    results = []
+    # What the MCP session sets for a request, so mcp.call_tool gives the tools a working Context
+    request_ctx.set(RequestContext(request_id=0, meta=None, session=DiscardingSession(), lifespan_context=AppContext()))
+
+    def selected(scenarios: list[Scenario]) -> list[Scenario]:
+        return [s for s in scenarios if not args.only or any(word in s.name for word in args.only)]
+
+    upstream = FakeUpstream(strikes=args.strikes, statement_rows=args.statement_rows, table_rows=args.statement_rows, missing=("MISSING",))
+    with upstream.patch():
+        for scenario in selected(fixed_scenarios(upstream)):
+            results.append(await measure(scenario, args.iterations))
+            report(results[-1], baseline.get(scenario.name))
+
+    for rows in args.rows:
+        upstream = FakeUpstream(history_rows=rows)
+        with upstream.patch():
+            for scenario in selected(history_scenarios(rows, args.batch)):
+                iterations = iterations_for(rows, args.iterations, args.min_iterations)
+                results.append(await measure(scenario, iterations))
+                report(results[-1], baseline.get(scenario.name))
+    return results
+
+
+def save(results: list[Result], args: argparse.Namespace) -> Path:
+    commit, dirty = git_revision()
+    path = args.output or RESULTS_DIR / f"{commit}{'-dirty' if dirty else ''}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "commit": commit,
+        "dirty": dirty,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "parameters": {
+            "rows": args.rows, "iterations": args.iterations, "min_iterations": args.min_iterations,
+            "strikes": args.strikes, "statement_rows": args.statement_rows, "batch": args.batch,
+            "telemetry": not args.no_telemetry,
+        },
+        "results": [asdict(result) for result in results],
+    }
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_ROWS), help="History sizes in bars")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed calls per scenario (scaled down above 10k bars)")
+    parser.add_argument("--min-iterations", type=int, default=3, help="Lower bound on timed calls for large histories")
+    parser.add_argument("--strikes", type=int, default=500, help="Strikes per option chain")
+    parser.add_argument("--statement-rows", type=int, default=200, help="Rows in financial statements and holder tables")
+    parser.add_argument("--batch", type=int, default=20, help="Tickers per batch tool call")
+    parser.add_argument("--only", nargs="+", help="Run only scenarios whose name contains one of these words")
+    parser.add_argument("--compare", type=Path, help="Earlier results file to compare against")
+    parser.add_argument("--output", type=Path, help="Results file (default: benchmarks/results/<commit>.json)")
+    parser.add_argument("--no-save", action="store_true", help="Print the report without writing a results file")
+    parser.add_argument("--no-telemetry", action="store_true", help="Measure without profiling and slow-request logging")
+    args = parser.parse_args()
+
+    if args.no_telemetry:
+        profiling.profiler = None
+        slowlog.slow_log = None
+
+    results = asyncio.run(run(args))
+    if not args.no_save:
+        print(f"results written to {save(results, args)}")
+
+
+if __name__ == "__main__":
+    main()
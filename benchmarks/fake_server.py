@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Run the Streamable HTTP server with yfinance routed to the fake upstream.
+
+Host, port and the other server settings come from the usual YF_MCP_*
+environment variables; the transport is always HTTP. With --workers above
+one, every worker process builds its own fake upstream from the same
+parameters (passed on through FAKE_UPSTREAM_ENV).
+
+Usage:
+    YF_MCP_HTTP__PORT=3100 python -m benchmarks.fake_server [--history-rows 252] [--latency-ms 20] [--workers 4]
+"""
+import argparse
+import json
+import os
+
+from benchmarks.fake_upstream import FakeUpstream
+
+FAKE_UPSTREAM_ENV = "BENCH_FAKE_UPSTREAM"
+APP_FACTORY = "benchmarks.fake_server:create_app"
+
+# Patch held open for the life of a worker process (closing it would restore yfinance.Ticker)
+_worker_patch = None
+
+
+def upstream_from_env() -> FakeUpstream:
+    return FakeUpstream(**json.loads(os.environ.get(FAKE_UPSTREAM_ENV, "{}")))
+
+
+def create_app():
+    """Worker application factory: the server's app with the fake upstream patched in for good."""
+    from src.http_app import create_app as create_server_app
+
+    global _worker_patch
+    _worker_patch = upstream_from_env().patch()
+    _worker_patch.__enter__()
+    return create_server_app()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--history-rows", type=int, default=252, help="Bars per price history (252 = 1y daily)")
+    parser.add_argument("--strikes", type=int, default=500, help="Strikes per option chain")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay of every fake upstream access")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: YF_MCP_HTTP__WORKERS)")
+    args = parser.parse_args()
+
+    os.environ[FAKE_UPSTREAM_ENV] = json.dumps(
+        {"history_rows": args.history_rows, "strikes": args.strikes, "latency": args.latency_ms / 1000}
+    )
+    if args.workers:
+        os.environ["YF_MCP_HTTP__WORKERS"] = str(args.workers)
+
+    # Imported after parsing so --help works without loading the server
+    from main import run_http
+
+    with upstream_from_env().patch():
+        run_http(app_factory=APP_FACTORY)
+
+
+if __name__ == "__main__":
+    main()
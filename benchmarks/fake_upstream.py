@@ -0,0 +1,331 @@
+"""
+Deterministic stand-in for ``yfinance.Ticker`` used by the benchmarks.
+
+Every symbol gets reproducible data derived from a seed, at a configurable
+scale: price histories, option chains with hundreds of strikes, long
+financial statements, holder tables, analyst ratings and news. Frames are
+generated once per symbol and copied on every access, as yfinance returns a
+fresh object per request.
+
+Usage:
+    upstream = FakeUpstream(history_rows=100_000)
+    with upstream.patch():
+        ...  # tools now read from the fake data
+"""
+import time
+import zlib
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Iterator
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+# Same shape as the object returned by yfinance's Ticker.option_chain()
+Options = namedtuple("Options", ["calls", "puts", "underlying"])
+
+INTERVAL_FREQ = {
+    "1m": "min", "2m": "2min", "5m": "5min", "15m": "15min", "30m": "30min", "60m": "h", "90m": "90min",
+    "1h": "h", "1d": "B", "5d": "5B", "1wk": "W-FRI", "1mo": "MS", "3mo": "QS",
+}
+END = pd.Timestamp("2025-10-24 16:00")
+FIRMS = [f"Firm {i:03d}" for i in range(60)]
+GRADES = ["Strong Buy", "Buy", "Outperform", "Hold", "Neutral", "Underperform", "Sell"]
+
+
+def seed_for(symbol: str, seed: int = 0) -> int:
+    return zlib.crc32(symbol.encode()) ^ seed
+
+
+def expiration_dates(count: int) -> tuple[str, ...]:
+    """Weekly expirations starting a week from today."""
+    today = date.today()
+    return tuple((today + timedelta(days=7 * (i + 1))).isoformat() for i in range(count))
+
+
+def price_history(rows: int, seed: int, interval: str = "1d") -> pd.DataFrame:
+    """Geometric random walk with yfinance's OHLCV columns."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    spread = np.abs(rng.normal(0, 0.005, rows)) * close
+    index = pd.date_range(end=END, periods=rows, freq=INTERVAL_FREQ.get(interval, "B"), name="Date")
+    return pd.DataFrame({
+        "Open": close + rng.normal(0, 0.002, rows) * close,
+        "High": close + spread,
+        "Low": close - spread,
+        "Close": close,
+        "Volume": rng.integers(1_000_000, 50_000_000, rows),
+        "Dividends": 0.0,
+        "Stock Splits": 0.0,
+    }, index=index)
+
+
+def option_chain(symbol: str, expiration: str, spot: float, strikes: int, seed: int) -> Options:
+    """Calls and puts over ``strikes`` strikes spanning 50%-150% of spot, with a quadratic smile."""
+    rng = np.random.default_rng(seed)
+    strike = np.round(np.linspace(0.5 * spot, 1.5 * spot, strikes), 2)
+    log_moneyness = np.log(strike / spot)
+    years = max((date.fromisoformat(expiration) - END.date()).days, 1) / 365.0
+    code = expiration.replace("-", "")[2:]
+
+    def side(kind: str) -> pd.DataFrame:
+        iv = 0.25 + 0.4 * log_moneyness ** 2 - 0.05 * log_moneyness + rng.normal(0, 0.005, strikes)
+        intrinsic = np.maximum(spot - strike, 0) if kind == "C" else np.maximum(strike - spot, 0)
+        mid = intrinsic + spot * iv * np.sqrt(years) * 0.4 * np.exp(-4 * log_moneyness ** 2)
+        return pd.DataFrame({
+            "contractSymbol": [f"{symbol}{code}{kind}{int(k * 1000):08d}" for k in strike],
+            "lastTradeDate": pd.Timestamp(END, tz="UTC"),
+            "strike": strike,
+            "lastPrice": np.round(mid, 2),
+            "bid": np.round(mid * 0.98, 2),
+            "ask": np.round(mid * 1.02 + 0.01, 2),
+            "change": 0.0,
+            "percentChange": 0.0,
+            "volume": rng.integers(0, 5_000, strikes).astype(float),
+            "openInterest": rng.integers(0, 50_000, strikes),
+            "impliedVolatility": iv,
+            "inTheMoney": intrinsic > 0,
+            "contractSize": "REGULAR",
+            "currency": "USD",
+        })
+
+    return Options(calls=side("C"), puts=side("P"), underlying={"regularMarketPrice": spot})
+
+
+def financial_statement(rows: int, periods: int, seed: int, freq: str = "YE") -> pd.DataFrame:
+    """Line items by reporting date, newest column first, like yfinance statements."""
+    rng = np.random.default_rng(seed)
+    columns = pd.date_range(end=END.normalize(), periods=periods, freq=freq)[::-1]
+    values = rng.normal(1e9, 3e8, (rows, periods))
+    values[rng.random((rows, periods)) < 0.05] = np.nan
+    return pd.DataFrame(values, index=[f"Line Item {i:03d}" for i in range(rows)], columns=columns)
+
+
+def holder_table(rows: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Date Reported": pd.date_range(end=END.normalize(), periods=rows, freq="D"),
+        "Holder": [f"Holder {i:04d}" for i in range(rows)],
+        "pctHeld": rng.random(rows) / 10,
+        "Shares": rng.integers(1_000, 500_000_000, rows),
+        "Value": rng.integers(1_000_000, 50_000_000_000, rows),
+        "pctChange": rng.normal(0, 0.05, rows),
+    })
+
+
+def insider_table(rows: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Shares": rng.integers(100, 1_000_000, rows),
+        "Value": rng.integers(10_000, 100_000_000, rows).astype(float),
+        "URL": "",
+        "Text": [f"Sale at price {p:.2f} per share." for p in rng.uniform(50, 300, rows)],
+        "Insider": [f"Insider {i:03d}" for i in range(rows)],
+        "Position": "Officer",
+        "Transaction": "",
+        "Start Date": pd.date_range(end=END.normalize(), periods=rows, freq="D"),
+        "Ownership": "D",
+    })
+
+
+def upgrades_downgrades(rows: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    grade_date = pd.date_range(end=pd.Timestamp.now().normalize(), periods=rows, freq="3D", name="GradeDate")
+    return pd.DataFrame({
+        "Firm": rng.choice(FIRMS, rows),
+        "ToGrade": rng.choice(GRADES, rows),
+        "FromGrade": rng.choice(GRADES, rows),
+        "Action": rng.choice(["up", "down", "main", "init"], rows),
+    }, index=grade_date)
+
+
+def news_items(symbol: str, count: int) -> list[dict]:
+    return [
+        {
+            "id": f"{symbol}-{i}",
+            "content": {
+                "contentType": "STORY" if i % 5 else "VIDEO",
+                "title": f"{symbol} headline {i}",
+                "provider": {"displayName": f"Publisher {i % 7}"},
+                "canonicalUrl": {"url": f"https://example.com/{symbol.lower()}/{i}"},
+                "thumbnail": {"resolutions": [{"url": f"https://example.com/{symbol.lower()}/{i}.jpg"}]},
+            },
+            "pubDate": (END - timedelta(hours=i)).isoformat(),
+            "relatedTickers": [symbol],
+        }
+        for i in range(count)
+    ]
+
+
+class FakeTicker:
+    """Read-only ``yfinance.Ticker`` look-alike backed by a FakeUpstream."""
+
+    def __init__(self, upstream: "FakeUpstream", symbol: str):
+        self._upstream = upstream
+        self._data = upstream.data(symbol)
+        self.ticker = symbol
+
+    def __getattr__(self, name: str):
+        self._upstream.wait()
+        try:
+            value = self._data[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        return value.copy() if isinstance(value, (pd.DataFrame, pd.Series, dict, list)) else value
+
+    def history(self, period: str = "1mo", interval: str = "1d", **kwargs) -> pd.DataFrame:
+        self._upstream.wait()
+        return self._upstream.history(self.ticker, interval)
+
+    def option_chain(self, date: str | None = None) -> Options:
+        self._upstream.wait()
+        return self._upstream.option_chain(self.ticker, date or self._data["options"][0])
+
+
+class FakeUpstream:
+    """
+    Generates and memoizes fake Yahoo Finance data per symbol.
+
+    Symbols in ``missing`` behave like unknown tickers (no ISIN, empty data).
+    ``latency`` seconds are slept on every upstream access, like a network
+    round trip that blocks the calling thread.
+    """
+
+    def __init__(
+        self,
+        history_rows: int = 1_000,
+        strikes: int = 500,
+        expirations: int = 12,
+        statement_rows: int = 200,
+        table_rows: int = 200,
+        news: int = 50,
+        seed: int = 0,
+        missing: tuple[str, ...] = (),
+        latency: float = 0.0,
+    ):
+        self.history_rows = history_rows
+        self.strikes = strikes
+        self.expirations = expirations
+        self.statement_rows = statement_rows
+        self.table_rows = table_rows
+        self.news = news
+        self.seed = seed
+        self.missing = frozenset(missing)
+        self.latency = latency
+        self._data: dict[str, dict] = {}
+        self._history: dict[tuple[str, str], pd.DataFrame] = {}
+        self._chains: dict[tuple[str, str], Options] = {}
+
+    def ticker(self, symbol: str) -> FakeTicker:
+        return FakeTicker(self, symbol)
+
+    @contextmanager
+    def patch(self) -> Iterator["FakeUpstream"]:
+        """Route ``yfinance.Ticker`` to this upstream for the enclosed block."""
+        with patch("yfinance.Ticker", new=self.ticker):
+            yield self
+
+    def wait(self) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+
+    def data(self, symbol: str) -> dict:
+        if symbol not in self._data:
+            self._data[symbol] = self._missing() if symbol in self.missing else self._generate(symbol)
+        return self._data[symbol]
+
+    def history(self, symbol: str, interval: str = "1d") -> pd.DataFrame:
+        if symbol in self.missing:
+            return pd.DataFrame()
+        key = (symbol, interval)
+        if key not in self._history:
+            self._history[key] = price_history(self.history_rows, seed_for(symbol, self.seed), interval)
+        return self._history[key].copy()
+
+    def option_chain(self, symbol: str, expiration: str) -> Options:
+        if expiration not in self.data(symbol)["options"]:
+            raise ValueError(f"Expiration `{expiration}` cannot be found. Available expirations are: {self.data(symbol)['options']}")
+        key = (symbol, expiration)
+        if key not in self._chains:
+            spot = self.data(symbol)["info"]["currentPrice"]
+            self._chains[key] = option_chain(symbol, expiration, spot, self.strikes, seed_for(symbol + expiration, self.seed))
+        chain = self._chains[key]
+        return Options(chain.calls.copy(), chain.puts.copy(), dict(chain.underlying))
+
+    def _missing(self) -> dict:
+        empty = pd.DataFrame()
+        data = {name: empty for name in _FRAME_ATTRIBUTES}
+        data.update(isin=None, info={}, news=[], options=())
+        return data
+
+    def _generate(self, symbol: str) -> dict:
+        seed = seed_for(symbol, self.seed)
+        rng = np.random.default_rng(seed)
+        spot = round(float(rng.uniform(20, 500)), 2)
+        options = expiration_dates(self.expirations)
+        actions = price_history(80, seed, "3mo")[["Dividends", "Stock Splits"]]
+        actions["Dividends"] = np.round(rng.uniform(0.1, 1.0, len(actions)), 2)
+        rows = self.statement_rows
+        upgrades = upgrades_downgrades(self.table_rows, seed)
+
+        return {
+            "isin": f"US{seed % 10**10:010d}",
+            "info": {
+                "symbol": symbol,
+                "shortName": f"{symbol} Inc.",
+                "longName": f"{symbol} Incorporated",
+                "currentPrice": spot,
+                "regularMarketPrice": spot,
+                "previousClose": round(spot * 0.99, 2),
+                "open": round(spot * 0.995, 2),
+                "dayLow": round(spot * 0.98, 2),
+                "dayHigh": round(spot * 1.02, 2),
+                "volume": int(rng.integers(1e6, 1e8)),
+                "averageVolume": int(rng.integers(1e6, 1e8)),
+                "marketCap": int(spot * 1e9),
+                "beta": round(float(rng.uniform(0.5, 2.0)), 2),
+                "trailingPE": round(float(rng.uniform(5, 60)), 2),
+                "trailingEps": round(spot / 25, 2),
+                "dividendRate": 1.0,
+                "dividendYield": round(1.0 / spot, 4),
+                "fiftyTwoWeekLow": round(spot * 0.7, 2),
+                "fiftyTwoWeekHigh": round(spot * 1.3, 2),
+                "sector": "Technology",
+                "industry": "Software",
+                "longBusinessSummary": f"{symbol} " + "makes things. " * 100,
+            },
+            "news": news_items(symbol, self.news),
+            "actions": actions,
+            "dividends": actions["Dividends"],
+            "splits": actions["Stock Splits"],
+            "options": options,
+            "income_stmt": financial_statement(rows, 5, seed),
+            "quarterly_income_stmt": financial_statement(rows, 8, seed + 1, "QE"),
+            "balance_sheet": financial_statement(rows, 5, seed + 2),
+            "quarterly_balance_sheet": financial_statement(rows, 8, seed + 3, "QE"),
+            "cashflow": financial_statement(rows, 5, seed + 4),
+            "quarterly_cashflow": financial_statement(rows, 8, seed + 5, "QE"),
+            "major_holders": pd.DataFrame(
+                {"Value": [0.02, 0.65, 0.66, 4000.0]},
+                index=pd.Index(["insidersPercentHeld", "institutionsPercentHeld", "institutionsFloatPercentHeld", "institutionsCount"], name="Breakdown"),
+            ),
+            "institutional_holders": holder_table(self.table_rows, seed),
+            "mutualfund_holders": holder_table(self.table_rows, seed + 1),
+            "insider_transactions": insider_table(self.table_rows, seed),
+            "insider_purchases": insider_table(self.table_rows, seed + 1),
+            "insider_roster_holders": insider_table(self.table_rows, seed + 2),
+            "recommendations": upgrades.reset_index().rename(columns={
+                "GradeDate": "Date", "ToGrade": "To Grade", "FromGrade": "From Grade"
+            }),
+            "upgrades_downgrades": upgrades,
+        }
+
+
+_FRAME_ATTRIBUTES = (
+    "actions", "income_stmt", "quarterly_income_stmt", "balance_sheet", "quarterly_balance_sheet",
+    "cashflow", "quarterly_cashflow", "major_holders", "institutional_holders", "mutualfund_holders",
+    "insider_transactions", "insider_purchases", "insider_roster_holders", "recommendations",
+    "upgrades_downgrades",
+)
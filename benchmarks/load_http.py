@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Load-test the Streamable HTTP transport with concurrent MCP sessions.
+
+Starts benchmarks.fake_server (the real server with yfinance routed to the
+fake upstream) unless --url points at a running server, then for every
+concurrency level opens that many MCP sessions, lets each call tools drawn
+from the tool mix back to back for --duration seconds, and reports
+throughput, latency percentiles, error rate and the server's resident
+memory (from /proc, Linux only; summed over worker processes).
+
+Tool mixes are presets (quotes, history, options, mixed) or weights such as
+``get_stock_info=3,get_option_chain=1``.
+
+Usage:
+    python -m benchmarks.load_http [--concurrency 1 8 32 128] [--mix mixed history] [--duration 10]
+    python -m benchmarks.load_http --url http://127.0.0.1:3001/mcp --pid 12345 --format json --output load.json
+    python -m benchmarks.load_http --workers 4 --mix history --concurrency 4 16 64
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from mcp import ClientSession, types
+from mcp.client.streamable_http import streamablehttp_client
+
+from benchmarks.fake_upstream import expiration_dates
+
+MIXES: dict[str, dict[str, int]] = {
+    "quotes": {"get_stock_info": 6, "get_option_expiration_dates": 2, "get_price_summary": 2},
+    "history": {"get_historical_stock_prices": 4, "get_technical_indicators": 3, "get_price_summary": 3},
+    "options": {"get_option_chain": 6, "get_option_expiration_dates": 3, "get_iv_surface": 1},
+    "mixed": {
+        "get_stock_info": 4, "get_historical_stock_prices": 2, "get_price_summary": 2, "get_technical_indicators": 2,
+        "get_yahoo_finance_news": 1, "get_stock_actions": 1, "get_financial_statement": 1, "get_holder_info": 1,
+        "get_recommendations": 1, "get_option_expiration_dates": 1, "get_option_chain": 2, "get_iv_surface": 1,
+        "get_indicator_snapshot": 1, "get_correlation_matrix": 1,
+    },
+}
+
+
+@dataclass
+class Step:
+    concurrency: int
+    mix: str
+    duration: float
+    sessions_opened: int
+    requests: int
+    throughput: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    error_rate: float
+    connect_p50_ms: float
+    rss_start_mb: float | None
+    rss_peak_mb: float | None
+    rss_end_mb: float | None
+    errors: dict[str, int] = field(default_factory=dict)
+    tools: dict[str, dict[str, float]] = field(default_factory=dict)
+
+
+def parse_mix(spec: str) -> dict[str, int]:
+    if spec in MIXES:
+        return MIXES[spec]
+    weights = {}
+    for item in spec.split(","):
+        tool, _, weight = item.partition("=")
+        weights[tool.strip()] = int(weight or 1)
+    return weights
+
+
+def tool_arguments(tool: str, tickers: list[str], rng: random.Random) -> dict[str, Any]:
+    ticker = rng.choice(tickers)
+    if tool == "get_historical_stock_prices":
+        return {"ticker": ticker, "period": "1y", "interval": "1d"}
+    if tool == "get_technical_indicators":
+        return {"ticker": ticker, "indicators": ["sma", "rsi", "macd", "bollinger"], "limit": 50}
+    if tool == "get_financial_statement":
+        return {"ticker": ticker, "financial_type": rng.choice(["income_stmt", "balance_sheet", "quarterly_cashflow"])}
+    if tool == "get_holder_info":
+        return {"ticker": ticker, "holder_type": rng.choice(["institutional_holders", "insider_transactions"])}
+    if tool == "get_recommendations":
+        return {"ticker": ticker, "recommendation_type": rng.choice(["recommendations", "upgrades_downgrades"])}
+    if tool == "get_option_chain":
+        return {"ticker": ticker, "expiration_date": rng.choice(expiration_dates(4)), "option_type": rng.choice(["calls", "puts"])}
+    if tool == "get_iv_surface":
+        return {"ticker": ticker, "max_expirations": 6}
+    if tool in ("get_indicator_snapshot", "get_correlation_matrix"):
+        return {"tickers": rng.sample(tickers, min(10, len(tickers)))}
+    return {"ticker": ticker}
+
+
+async def call_tool(session: ClientSession, name: str, arguments: dict[str, Any], timeout: timedelta) -> types.CallToolResult:
+    """
+    Call a tool without ClientSession.call_tool's output-schema validation.
+
+    The client validates structured content with jsonschema on every call,
+    which costs more than most tool calls themselves and would make the load
+    generator, not the server, the bottleneck.
+    """
+    request = types.ClientRequest(types.CallToolRequest(params=types.CallToolRequestParams(name=name, arguments=arguments)))
+    return await session.send_request(request, types.CallToolResult, request_read_timeout_seconds=timeout)
+
+
+def is_error(result: Any) -> bool:
+    if result.isError:
+        return True
+    structured = result.structuredContent or {}
+    # Union return types are wrapped as {"result": ...}
+    structured = structured.get("result", structured)
+    return isinstance(structured, dict) and "error" in structured
+
+
+def child_pids(pid: int) -> list[int]:
+    """Direct children of a process (from /proc)."""
+    children = []
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children", encoding="ascii") as listing:
+                children.extend(int(child) for child in listing.read().split())
+    except OSError:
+        pass
+    return children
+
+
+def rss_mb(pid: int | None) -> float | None:
+    """
+    Resident set size of a process and its descendants (uvicorn workers) in
+    MiB, or None where /proc is unavailable.
+    """
+    if pid is None:
+        return None
+    total, found = 0, False
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f"/proc/{current}/status", encoding="ascii") as status:
+                for line in status:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1])
+                        found = True
+        except OSError:
+            continue
+        pending.extend(child_pids(current))
+    return total / 1024 if found else None
+
+
+def percentile(values: list[float], q: float) -> float:
+    return round(float(np.percentile(values, q)), 3) if values else 0.0
+
+
+class LoadTest:
+    def __init__(self, url: str, pid: int | None, tickers: list[str], call_timeout: float, seed: int):
+        self.url = url
+        self.pid = pid
+        self.tickers = tickers
+        self.call_timeout = timedelta(seconds=call_timeout)
+        self.seed = seed
+
+    async def _session(self, index: int, mix: dict[str, int], window: dict, ready: asyncio.Queue, samples: list) -> None:
+        rng = random.Random(self.seed * 100_003 + index)
+        tools, weights = list(mix), list(mix.values())
+        opened = time.perf_counter()
+        try:
+            async with streamablehttp_client(self.url) as (read, write, _), ClientSession(read, write) as session:
+                await session.initialize()
+                await ready.put(time.perf_counter() - opened)
+                await window["start"].wait()
+                while time.perf_counter() < window["end"]:
+                    tool = rng.choices(tools, weights)[0]
+                    start = time.perf_counter()
+                    try:
+                        result = await call_tool(session, tool, tool_arguments(tool, self.tickers, rng), self.call_timeout)
+                        error = "tool_error" if is_error(result) else None
+                    except Exception as exc:
+                        error = type(exc).__name__
+                    samples.append((tool, time.perf_counter() - start, error))
+        except Exception as exc:
+            await ready.put(exc)
+
+    async def step(self, concurrency: int, mix_name: str, mix: dict[str, int], duration: float) -> Step:
+        window = {"start": asyncio.Event(), "end": float("inf")}
+        ready: asyncio.Queue = asyncio.Queue()
+        samples: list[tuple[str, float, str | None]] = []
+        tasks = [asyncio.create_task(self._session(i, mix, window, ready, samples)) for i in range(concurrency)]
+
+        connects, failures = [], 0
+        for _ in range(concurrency):
+            outcome = await ready.get()
+            if isinstance(outcome, Exception):
+                failures += 1
+            else:
+                connects.append(outcome * 1000)
+
+        rss_start = rss_mb(self.pid)
+        rss_peak = rss_start
+        started = time.perf_counter()
+        window["end"] = started + duration
+        window["start"].set()
+        while time.perf_counter() < window["end"]:
+            await asyncio.sleep(0.25)
+            current = rss_mb(self.pid)
+            if current is not None:
+                rss_peak = max(rss_peak or 0.0, current)
+        await asyncio.gather(*tasks, return_exceptions=True)
+        elapsed = time.perf_counter() - started
+
+        latencies = [seconds * 1000 for _, seconds, _ in samples]
+        errors: dict[str, int] = {}
+        for _, _, error in samples:
+            if error:
+                errors[error] = errors.get(error, 0) + 1
+        if failures:
+            errors["connect"] = failures
+        tools = {}
+        for tool in mix:
+            timings = [seconds * 1000 for name, seconds, _ in samples if name == tool]
+            tools[tool] = {
+                "requests": len(timings),
+                "p50_ms": percentile(timings, 50),
+                "p99_ms": percentile(timings, 99),
+                "errors": sum(1 for name, _, error in samples if name == tool and error),
+            }
+
+        return Step(
+            concurrency=concurrency,
+            mix=mix_name,
+            duration=round(elapsed, 3),
+            sessions_opened=len(connects),
+            requests=len(samples),
+            throughput=round(len(samples) / elapsed, 2),
+            p50_ms=percentile(latencies, 50),
+            p95_ms=percentile(latencies, 95),
+            p99_ms=percentile(latencies, 99),
+            max_ms=round(max(latencies), 3) if latencies else 0.0,
+            error_rate=round(sum(1 for *_, error in samples if error) / len(samples), 4) if samples else 1.0,
+            connect_p50_ms=percentile(connects, 50),
+            rss_start_mb=rss_start,
+            rss_peak_mb=rss_peak,
+            rss_end_mb=rss_mb(self.pid),
+            errors=errors,
+            tools=tools,
+        )
+
+    async def warm_up(self, mix: dict[str, int]) -> None:
+        """Call every tool of the mix once so imports and caches do not land in the first step."""
+        rng = random.Random(self.seed)
+        async with streamablehttp_client(self.url) as (read, write, _), ClientSession(read, write) as session:
+            await session.initialize()
+            for tool in mix:
+                await call_tool(session, tool, tool_arguments(tool, self.tickers, rng), self.call_timeout)
+
+
+def start_server(args: argparse.Namespace, env: dict[str, str] | None = None) -> tuple[subprocess.Popen, str]:
+    """Start benchmarks.fake_server on a free port; ``env`` overrides server settings."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    env = {
+        **os.environ,
+        "YF_MCP_TRANSPORT": "http",
+        "YF_MCP_HTTP__HOST": "127.0.0.1",
+        "YF_MCP_HTTP__PORT": str(port),
+        "YF_MCP_HTTP__STATELESS": str(args.stateless).lower(),
+        "YF_MCP_SLOW_LOG__ENABLED": "false",
+        **(env or {}),
+    }
+    command = [
+        sys.executable, "-m", "benchmarks.fake_server",
+        "--history-rows", str(args.history_rows), "--latency-ms", str(args.upstream_latency_ms),
+        "--workers", str(args.workers),
+    ]
+    # The server inherits the log file; this process's handle is closed once it has started
+    with open(args.server_log, "w") if args.server_log else contextlib.nullcontext(subprocess.DEVNULL) as log:
+        server = subprocess.Popen(command, env=env, stdout=log, stderr=log, cwd=Path(__file__).parent.parent)
+
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"server exited with status {server.returncode}")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            return server, f"http://127.0.0.1:{port}/mcp"
+        except OSError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("server did not start listening within 60 s")
+
+
+def format_ascii(steps: list[Step], budget_ms: float, max_error_rate: float, per_tool: bool) -> str:
+    header = f"{'sessions':>8} {'mix':<10} {'requests':>9} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'err %':>7} {'rss MiB':>8} {'peak MiB':>9}"
+    lines = [header, "-" * len(header)]
+    for step in steps:
+        rss = f"{step.rss_end_mb:8.1f}" if step.rss_end_mb is not None else f"{'n/a':>8}"
+        peak = f"{step.rss_peak_mb:9.1f}" if step.rss_peak_mb is not None else f"{'n/a':>9}"
+        lines.append(
+            f"{step.concurrency:>8} {step.mix:<10} {step.requests:>9} {step.throughput:>9.1f} {step.p50_ms:>9.1f} "
+            f"{step.p95_ms:>9.1f} {step.p99_ms:>9.1f} {step.error_rate * 100:>7.2f} {rss} {peak}"
+        )
+        if per_tool:
+            for tool, stats in step.tools.items():
+                lines.append(f"{'':>8}   {tool:<32} n={stats['requests']:<6} p50={stats['p50_ms']:9.1f} p99={stats['p99_ms']:9.1f} errors={stats['errors']}")
+
+    for mix in dict.fromkeys(step.mix for step in steps):
+        sustained = [
+            step.concurrency for step in steps
+            if step.mix == mix and step.p99_ms <= budget_ms and step.error_rate <= max_error_rate
+        ]
+        verdict = f"{max(sustained)} sessions" if sustained else "none of the tested levels"
+        lines.append(f"{mix}: sustained {verdict} within p99 <= {budget_ms:g} ms and errors <= {max_error_rate:.1%}")
+    return "\n".join(lines)
+
+
+async def run(args: argparse.Namespace, url: str, pid: int | None) -> list[Step]:
+    tickers = [f"L{i:03d}" for i in range(args.tickers)]
+    test = LoadTest(url, pid, tickers, args.call_timeout, args.seed)
+    steps = []
+    for mix_name in args.mix:
+        mix = parse_mix(mix_name)
+        await test.warm_up(mix)
+        for concurrency in args.concurrency:
+            steps.append(await test.step(concurrency, mix_name, mix, args.duration))
+            step = steps[-1]
+            print(
+                f"  {mix_name} x{concurrency}: {step.throughput:.1f} req/s, p99 {step.p99_ms:.1f} ms, errors {step.error_rate:.2%}",
+                file=sys.stderr,
+            )
+    return steps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="MCP endpoint of a running server (default: start benchmarks.fake_server)")
+    parser.add_argument("--pid", type=int, help="PID of the server given by --url, for RSS sampling")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64], help="Concurrent sessions per step")
+    parser.add_argument("--mix", nargs="+", default=["mixed"], help=f"Tool mixes: {', '.join(MIXES)} or tool=weight,...")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load per step")
+    parser.add_argument("--tickers", type=int, default=50, help="Distinct symbols requested")
+    parser.add_argument("--call-timeout", type=float, default=60.0, help="Seconds before a call counts as failed")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--p99-budget-ms", type=float, default=1000.0, help="p99 a step must stay under to count as sustained")
+    parser.add_argument("--max-error-rate", type=float, default=0.01, help="Error rate a step must stay under to count as sustained")
+    parser.add_argument("--format", choices=("ascii", "json"), default="ascii")
+    parser.add_argument("--output", type=Path, help="Write the report here instead of stdout")
+    parser.add_argument("--per-tool", action="store_true", help="Break each step down by tool (ASCII report)")
+    server_options = parser.add_argument_group("started server")
+    server_options.add_argument("--stateless", action="store_true", help="Run the server in stateless HTTP mode")
+    server_options.add_argument("--workers", type=int, default=1, help="Server worker processes (more than one implies stateless)")
+    server_options.add_argument("--history-rows", type=int, default=252, help="Bars per fake price history")
+    server_options.add_argument("--upstream-latency-ms", type=float, default=0.0, help="Delay of every fake upstream access")
+    server_options.add_argument("--server-log", help="File for the server's output")
+    args = parser.parse_args()
+
+    server = None
+    url, pid = args.url, args.pid
+    if url is None:
+        server, url = start_server(args)
+        pid = server.pid
+    try:
+        steps = asyncio.run(run(args, url, pid))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+    if args.format == "json":
+        report = json.dumps({"url": url, "arguments": {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()},
+                             "steps": [asdict(step) for step in steps]}, indent=2)
+    else:
+        report = format_ascii(steps, args.p99_budget_ms, args.max_error_rate, args.per_tool)
+    if args.output:
+        args.output.write_text(report + "\n", encoding="utf-8")
+        print(f"report written to {args.output}", file=sys.stderr)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
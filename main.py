@@ -7,6 +7,7 @@ import sys
 from typing import NoReturn
 
 from src.config import config, TransportType
+from src.http_app import APP_FACTORY, run_server, run_workers
 from src.server import mcp
 
 
@@ -21,33 +22,44 @@ def run_stdio() -> NoReturn:
     mcp.run(transport="stdio")
 
 
-def run_http() -> NoReturn:
+def run_http(app_factory: str = APP_FACTORY) -> NoReturn:
     """
     Run server in Streamable HTTP mode.
     Ideal for remote deployment and multiple clients.
+
+    With more than one worker, uvicorn pre-forks workers that each build
+    their application with ``app_factory`` (see src/http_app.py).
     
     Note: Streamable HTTP is the modern transport replacing SSE.
     CORS is handled automatically by FastMCP for HTTP transport.
-    
-    FastMCP.run() only accepts transport and mount_path parameters.
-    Host, port, and stateless_http must be configured via settings.
+
+    FastMCP.run() only passes host, port and log level on to uvicorn, so the
+    app is served with run_server(), which applies the HTTPConfig tuning options.
     """
     print("🌐 Starting server in Streamable HTTP mode...", file=sys.stderr)
     print(f"   Host: {config.http.host}", file=sys.stderr)
     print(f"   Port: {config.http.port}", file=sys.stderr)
     print(f"   Stateless: {config.http.stateless}", file=sys.stderr)
+    print(f"   Workers: {config.http.workers}", file=sys.stderr)
+    print(f"   Event loop: {config.http.loop}, HTTP parser: {config.http.http_parser}", file=sys.stderr)
+    print(f"   Keep-alive: {config.http.keep_alive_timeout}s, backlog: {config.http.backlog}, "
+          f"max connections: {config.http.max_connections or 'unlimited'}", file=sys.stderr)
     print(f"   CORS: Enabled (all origins allowed by default)", file=sys.stderr)
     print(f"   Connect to: http://{config.http.host}:{config.http.port}/mcp", file=sys.stderr)
+    if config.http.metrics_enabled:
+        print(f"   Metrics: http://{config.http.host}:{config.http.port}/metrics", file=sys.stderr)
+
+    if config.http.workers > 1:
+        run_workers(app_factory)
+        return
 
-    # Configure FastMCP settings - these control the HTTP server
-    # FastMCP.run() signature: run(transport, mount_path) 
-    # Host/port/stateless are configured via settings, not run() parameters
+    # Configure FastMCP settings - stateless_http shapes the Streamable HTTP app
     mcp.settings.host = config.http.host
     mcp.settings.port = config.http.port
     mcp.settings.stateless_http = config.http.stateless
 
     # Run server with streamable-http transport
-    mcp.run(transport="streamable-http")
+    run_server(mcp.streamable_http_app())
 
 
 def main() -> NoReturn:
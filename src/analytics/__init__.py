@@ -0,0 +1,37 @@
+"""
+Server-side analytics computed over Yahoo Finance data.
+"""
+from .summary import PERIODS_PER_YEAR, compute_price_summary
+from .indicators import compute_indicators
+from .incremental import IncrementalIndicators, IndicatorParams, IndicatorStateStore
+from .correlation import align_closes, estimate_matrix_bytes, return_statistics, top_pairs
+from .greeks import black_scholes_greeks, years_to_expiration
+from .volatility import (
+    DEFAULT_MONEYNESS_GRID,
+    DEFAULT_TENOR_DAYS,
+    SmileFit,
+    fit_smile,
+    interpolate_surface,
+    otm_quotes,
+)
+
+__all__ = [
+    "PERIODS_PER_YEAR",
+    "compute_price_summary",
+    "compute_indicators",
+    "IncrementalIndicators",
+    "IndicatorParams",
+    "IndicatorStateStore",
+    "align_closes",
+    "estimate_matrix_bytes",
+    "return_statistics",
+    "top_pairs",
+    "black_scholes_greeks",
+    "years_to_expiration",
+    "DEFAULT_MONEYNESS_GRID",
+    "DEFAULT_TENOR_DAYS",
+    "SmileFit",
+    "fit_smile",
+    "interpolate_surface",
+    "otm_quotes",
+]
@@ -0,0 +1,84 @@
+"""
+Vectorized cross-ticker return statistics.
+"""
+from __future__ import annotations
+
+from src.lazy import lazy_import
+
+from .indicators import INTRADAY_INTERVALS
+
+np = lazy_import("numpy", globals())
+pd = lazy_import("pandas", globals())
+
+
+def align_closes(frames: dict[str, pd.DataFrame], interval: str) -> pd.DataFrame:
+    """
+    Align close prices of several tickers on common timestamps.
+
+    Daily and longer bars are keyed by calendar date so that tickers listed in
+    different time zones line up; intraday bars are compared in UTC.
+
+    Returns:
+        DataFrame with one column per ticker and only the rows where every
+        ticker has a close.
+    """
+    columns = {}
+    for ticker, frame in frames.items():
+        close = frame["Close"]
+        index = close.index
+        if isinstance(index, pd.DatetimeIndex):
+            if interval in INTRADAY_INTERVALS:
+                index = index.tz_convert("UTC") if index.tz is not None else index
+            else:
+                index = (index.tz_localize(None) if index.tz is not None else index).normalize()
+        columns[ticker] = pd.Series(close.to_numpy(dtype=np.float64), index=index)
+    aligned = pd.concat(columns, axis=1, join="inner")
+    return aligned[~aligned.index.duplicated(keep="last")].dropna()
+
+
+def estimate_matrix_bytes(observations: int, tickers: int) -> int:
+    """Working memory for prices, returns, covariance and correlation as float64."""
+    return 8 * (2 * observations * tickers + 2 * tickers * tickers)
+
+
+def return_statistics(closes: np.ndarray) -> tuple[np.ndarray, np.ndarray, int]:
+    """
+    Covariance and correlation of log returns.
+
+    Args:
+        closes: (observations, tickers) array of aligned close prices
+
+    Returns:
+        Tuple of (covariance, correlation, number of return observations).
+        Covariance is per bar, not annualized.
+    """
+    returns = np.diff(np.log(closes), axis=0)
+    n = returns.shape[0]
+    if n < 2:
+        raise ValueError("At least 3 aligned prices are needed to compute correlations")
+
+    returns -= returns.mean(axis=0)
+    covariance = returns.T @ returns / (n - 1)
+    std = np.sqrt(np.diag(covariance))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        correlation = covariance / np.outer(std, std)
+    np.fill_diagonal(correlation, 1.0)
+    return covariance, correlation, n
+
+
+def top_pairs(correlation: np.ndarray, k: int) -> list[tuple[int, int, float]]:
+    """
+    The k most strongly correlated distinct pairs by absolute correlation.
+
+    Returns:
+        List of (row, column, correlation) sorted by descending |correlation|.
+    """
+    rows, cols = np.triu_indices(correlation.shape[0], k=1)
+    values = correlation[rows, cols]
+    strength = np.nan_to_num(np.abs(values), nan=-1.0)
+    k = min(k, values.size)
+    if k == 0:
+        return []
+    best = np.argpartition(-strength, k - 1)[:k]
+    best = best[np.argsort(-strength[best], kind="stable")]
+    return [(int(rows[i]), int(cols[i]), float(values[i])) for i in best]
@@ -0,0 +1,103 @@
+"""
+Vectorized Black-Scholes Greeks for whole option chains.
+"""
+from __future__ import annotations
+
+from datetime import datetime, time
+from zoneinfo import ZoneInfo
+
+from src.lazy import lazy_import
+
+np = lazy_import("numpy", globals())
+
+
+# Listed US equity options stop trading at the close on expiration day
+EXPIRATION_TIME = time(16, 0)
+EXCHANGE_TZ = ZoneInfo("America/New_York")
+SECONDS_PER_YEAR = 365.0 * 24 * 3600
+
+
+def years_to_expiration(expiration_date: str, now: datetime | None = None) -> float:
+    """Year fraction from now until the close of the expiration date (ACT/365)."""
+    expiry = datetime.combine(datetime.strptime(expiration_date, "%Y-%m-%d").date(), EXPIRATION_TIME, EXCHANGE_TZ)
+    now = now or datetime.now(EXCHANGE_TZ)
+    return (expiry - now).total_seconds() / SECONDS_PER_YEAR
+
+
+def norm_cdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal CDF via the Abramowitz-Stegun erf approximation (|error| < 1.5e-7)."""
+    z = np.abs(x) / np.sqrt(2.0)
+    t = 1.0 / (1.0 + 0.3275911 * z)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1.0 - poly * np.exp(-z * z)
+    return 0.5 * (1.0 + np.sign(x) * erf)
+
+
+def norm_pdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal density."""
+    return np.exp(-0.5 * x * x) / np.sqrt(2.0 * np.pi)
+
+
+def black_scholes_greeks(
+    spot: float,
+    strikes: np.ndarray,
+    years: float | np.ndarray,
+    volatilities: np.ndarray,
+    is_call: bool | np.ndarray,
+    rate: float = 0.0,
+    dividend_yield: float = 0.0,
+) -> dict[str, np.ndarray]:
+    """
+    Black-Scholes-Merton Greeks for arrays of European options.
+
+    Args:
+        spot: Underlying price
+        strikes: Strike prices
+        years: Time to expiration in years (scalar or per contract)
+        volatilities: Annualized implied volatilities
+        is_call: True for calls, False for puts (scalar or per contract)
+        rate: Continuously compounded risk-free rate
+        dividend_yield: Continuous dividend yield of the underlying
+
+    Returns:
+        Dict of ``delta``, ``gamma``, ``theta`` (per calendar day), ``vega``
+        (per 1 volatility point) and ``rho`` (per 1% rate move). Contracts with
+        non-positive strike, volatility or time to expiration get NaN.
+    """
+    strikes = np.asarray(strikes, dtype=np.float64)
+    sigma = np.asarray(volatilities, dtype=np.float64)
+    t = np.broadcast_to(np.asarray(years, dtype=np.float64), strikes.shape)
+    call = np.broadcast_to(np.asarray(is_call, dtype=bool), strikes.shape)
+
+    valid = (strikes > 0) & (sigma > 0) & (t > 0) & (spot > 0)
+    strikes = np.where(valid, strikes, np.nan)
+    sigma = np.where(valid, sigma, np.nan)
+    t = np.where(valid, t, np.nan)
+
+    sqrt_t = np.sqrt(t)
+    d1 = (np.log(spot / strikes) + (rate - dividend_yield + 0.5 * sigma * sigma) * t) / (sigma * sqrt_t)
+    d2 = d1 - sigma * sqrt_t
+    discount_q = np.exp(-dividend_yield * t)
+    discount_r = np.exp(-rate * t)
+    pdf_d1 = norm_pdf(d1)
+    sign = np.where(call, 1.0, -1.0)
+    cdf_d1 = norm_cdf(sign * d1)
+    cdf_d2 = norm_cdf(sign * d2)
+
+    delta = sign * discount_q * cdf_d1
+    gamma = discount_q * pdf_d1 / (spot * sigma * sqrt_t)
+    vega = spot * discount_q * pdf_d1 * sqrt_t
+    theta = (
+        -spot * discount_q * pdf_d1 * sigma / (2.0 * sqrt_t)
+        - sign * rate * strikes * discount_r * cdf_d2
+        + sign * dividend_yield * spot * discount_q * cdf_d1
+    )
+    rho = sign * strikes * t * discount_r * cdf_d2
+
+    return {
+        "delta": delta,
+        "gamma": gamma,
+        "theta": theta / 365.0,
+        "vega": vega / 100.0,
+        "rho": rho / 100.0,
+    }
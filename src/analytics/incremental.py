@@ -0,0 +1,293 @@
+"""
+Incremental indicator state that advances in O(1) per new bar.
+
+Each accumulator follows the same recurrence as the vectorized kernels in
+``indicators.py`` (pandas ``ewm(adjust=False)``), so a state built bar by bar
+reports the same values as a full recomputation over the same history.
+"""
+from __future__ import annotations
+
+import math
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+
+from src.lazy import lazy_import
+
+from .summary import PERIODS_PER_YEAR
+
+np = lazy_import("numpy", globals())
+pd = lazy_import("pandas", globals())
+
+
+class EMAState:
+    """Exponential moving average seeded with the first observation."""
+    __slots__ = ("span", "alpha", "value", "count")
+
+    def __init__(self, span: int):
+        self.span = span
+        self.alpha = 2.0 / (span + 1.0)
+        self.value = math.nan
+        self.count = 0
+
+    def _next(self, x: float) -> float:
+        return x if self.count == 0 else self.value + self.alpha * (x - self.value)
+
+    def update(self, x: float) -> None:
+        self.value = self._next(x)
+        self.count += 1
+
+    def preview(self, x: float) -> float | None:
+        """Value after observing x, without committing it."""
+        return self._next(x) if self.count + 1 >= self.span else None
+
+    @property
+    def current(self) -> float | None:
+        return self.value if self.count >= self.span else None
+
+
+class RollingVarianceState:
+    """Sample variance over a sliding window using Welford's add/remove updates."""
+    __slots__ = ("window", "values", "mean", "m2")
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values: deque[float] = deque()
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def _next(self, x: float) -> tuple[float, float, int]:
+        """Mean, M2 and size after adding x (and evicting the oldest value if full)."""
+        size = len(self.values) + 1
+        delta = x - self.mean
+        mean = self.mean + delta / size
+        m2 = self.m2 + delta * (x - mean)
+
+        if size > self.window:
+            old = self.values[0]
+            size -= 1
+            delta = old - mean
+            mean -= delta / size
+            m2 -= delta * (old - mean)
+        return mean, m2, size
+
+    def _variance(self, m2: float, size: int) -> float | None:
+        return max(m2, 0.0) / (self.window - 1) if size >= self.window else None
+
+    def update(self, x: float) -> None:
+        self.mean, self.m2, size = self._next(x)
+        self.values.append(x)
+        if len(self.values) > size:
+            self.values.popleft()
+
+    def preview(self, x: float) -> float | None:
+        """Variance after observing x, without committing it."""
+        _, m2, size = self._next(x)
+        return self._variance(m2, size)
+
+    @property
+    def current(self) -> float | None:
+        return self._variance(self.m2, len(self.values))
+
+
+class RSIState:
+    """Relative Strength Index with Wilder's smoothing of gains and losses."""
+    __slots__ = ("period", "alpha", "avg_gain", "avg_loss", "count")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.alpha = 1.0 / period
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.count = 0
+
+    def _next(self, change: float) -> tuple[float, float]:
+        gain, loss = max(change, 0.0), max(-change, 0.0)
+        if self.count == 0:
+            return gain, loss
+        return self.avg_gain + self.alpha * (gain - self.avg_gain), self.avg_loss + self.alpha * (loss - self.avg_loss)
+
+    def _rsi(self, avg_gain: float, avg_loss: float, count: int) -> float | None:
+        if count < self.period:
+            return None
+        if avg_loss == 0:
+            return 50.0 if avg_gain == 0 else 100.0
+        return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    def update(self, change: float) -> None:
+        self.avg_gain, self.avg_loss = self._next(change)
+        self.count += 1
+
+    def preview(self, change: float) -> float | None:
+        """RSI after observing a price change, without committing it."""
+        return self._rsi(*self._next(change), self.count + 1)
+
+    @property
+    def current(self) -> float | None:
+        return self._rsi(self.avg_gain, self.avg_loss, self.count)
+
+
+# History fetched to seed a new state, and the shorter window fetched to extend
+# an existing one (must overlap the last committed bar to avoid a rebuild)
+WARMUP_PERIODS: dict[str, str] = {
+    "1m": "5d", "2m": "1mo", "5m": "1mo", "15m": "1mo", "30m": "1mo",
+    "60m": "6mo", "90m": "6mo", "1h": "6mo",
+    "1d": "2y", "5d": "5y", "1wk": "5y", "1mo": "max", "3mo": "max",
+}
+REFRESH_PERIODS: dict[str, str] = {
+    "1m": "5d", "2m": "5d", "5m": "5d", "15m": "5d", "30m": "5d",
+    "60m": "5d", "90m": "5d", "1h": "5d",
+    "1d": "5d", "5d": "1mo", "1wk": "3mo", "1mo": "1y", "3mo": "2y",
+}
+
+
+@dataclass(frozen=True)
+class IndicatorParams:
+    """Parameters that identify one incremental indicator state."""
+    ema_span: int = 20
+    rsi_period: int = 14
+    volatility_window: int = 20
+
+
+class IncrementalIndicators:
+    """
+    Rolling accumulators for one (ticker, interval, params) combination.
+
+    Only fully formed bars are committed. The most recent bar of a refresh may
+    still be in progress, so its values are previewed on top of the committed
+    state and recomputed on the next refresh.
+    """
+
+    def __init__(self, params: IndicatorParams, interval: str):
+        self.params = params
+        self.interval = interval
+        self.ema = EMAState(params.ema_span)
+        self.rsi = RSIState(params.rsi_period)
+        self.variance = RollingVarianceState(params.volatility_window)
+        self.last_timestamp: pd.Timestamp | None = None
+        self.last_close: float | None = None
+        # Latest bar seen, committed or previewed
+        self.seen_timestamp: pd.Timestamp | None = None
+        self.bars = 0
+
+    def _push(self, timestamp: pd.Timestamp, close: float) -> None:
+        self.ema.update(close)
+        if self.last_close is not None:
+            self.rsi.update(close - self.last_close)
+            self.variance.update(math.log(close / self.last_close))
+        self.last_timestamp, self.last_close = timestamp, close
+        self.bars += 1
+
+    def connects_to(self, closes: pd.Series) -> bool:
+        """
+        Whether a refreshed frame can extend this state.
+
+        The frame must still contain the last committed bar with an unchanged
+        close; otherwise history was revised (e.g. dividend adjustment) or a
+        gap was left and the state must be rebuilt.
+        """
+        if self.last_timestamp is None:
+            return True
+        if self.last_timestamp not in closes.index:
+            return False
+        return math.isclose(float(closes.loc[self.last_timestamp]), self.last_close, rel_tol=1e-9)
+
+    def advance(self, closes: pd.Series) -> tuple[int, dict]:
+        """
+        Consume bars newer than the last committed one.
+
+        Args:
+            closes: Close prices indexed by timestamp, oldest first
+
+        Returns:
+            Tuple of (number of bars no earlier call has seen, snapshot of the latest values).
+            A provisional bar previewed before is not counted again.
+        """
+        closes = closes.dropna()
+        if self.last_timestamp is not None:
+            closes = closes[closes.index > self.last_timestamp]
+
+        timestamps = closes.index
+        values = closes.to_numpy(dtype=np.float64)
+        for timestamp, close in zip(timestamps[:-1], values[:-1], strict=True):
+            self._push(timestamp, float(close))
+
+        if not len(values):
+            return 0, self.snapshot()
+        new_bars = len(values) if self.seen_timestamp is None else int((timestamps > self.seen_timestamp).sum())
+        self.seen_timestamp = timestamps[-1]
+        return new_bars, self.snapshot(timestamps[-1], float(values[-1]))
+
+    def snapshot(self, timestamp: pd.Timestamp | None = None, close: float | None = None) -> dict:
+        """
+        Indicator values at the last committed bar, or at a provisional
+        (timestamp, close) bar evaluated on top of the committed state.
+        """
+        if close is None:
+            timestamp, close = self.last_timestamp, self.last_close
+            ema, rsi, variance = self.ema.current, self.rsi.current, self.variance.current
+        else:
+            ema = self.ema.preview(close)
+            if self.last_close is None:
+                rsi = variance = None
+            else:
+                rsi = self.rsi.preview(close - self.last_close)
+                variance = self.variance.preview(math.log(close / self.last_close))
+
+        periods = PERIODS_PER_YEAR.get(self.interval, 252)
+        return {
+            "timestamp": str(timestamp) if timestamp is not None else None,
+            "close": close,
+            "ema": ema,
+            "rsi": rsi,
+            "volatility": math.sqrt(variance * periods) if variance is not None else None,
+        }
+
+
+class IndicatorStateStore:
+    """
+    Thread-safe LRU registry of incremental states keyed by (ticker, interval, params).
+
+    Keys are chosen by clients, so at most ``max_entries`` states are kept;
+    the least recently used is dropped and rebuilt from a warm-up window if
+    asked for again. lock() serializes refreshes of one key.
+    """
+
+    # Refreshes of different keys share one of these locks only when their hashes collide
+    LOCK_STRIPES = 64
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._states: OrderedDict[tuple[str, str, IndicatorParams], IncrementalIndicators] = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = [threading.Lock() for _ in range(self.LOCK_STRIPES)]
+
+    def lock(self, ticker: str, interval: str, params: IndicatorParams) -> threading.Lock:
+        """Lock held while the state for a key is read, advanced or replaced."""
+        return self._key_locks[hash((ticker, interval, params)) % self.LOCK_STRIPES]
+
+    def get(self, ticker: str, interval: str, params: IndicatorParams) -> IncrementalIndicators | None:
+        key = (ticker, interval, params)
+        with self._lock:
+            state = self._states.get(key)
+            if state is not None:
+                self._states.move_to_end(key)
+            return state
+
+    def create(self, ticker: str, interval: str, params: IndicatorParams) -> IncrementalIndicators:
+        """Create (or replace) the state for a key, evicting the least recently used if full."""
+        state = IncrementalIndicators(params, interval)
+        key = (ticker, interval, params)
+        with self._lock:
+            self._states[key] = state
+            self._states.move_to_end(key)
+            while len(self._states) > self.max_entries:
+                self._states.popitem(last=False)
+        return state
+
+    def clear(self) -> None:
+        with self._lock:
+            self._states.clear()
+
+    def __len__(self) -> int:
+        return len(self._states)
@@ -0,0 +1,130 @@
+"""
+Vectorized technical indicators computed over OHLCV frames.
+Every kernel works on whole columns (pandas rolling/ewm or NumPy), never per bar.
+"""
+from __future__ import annotations
+
+from src.lazy import lazy_import
+from src.models.enums import IndicatorType
+
+np = lazy_import("numpy", globals())
+pd = lazy_import("pandas", globals())
+
+
+INTRADAY_INTERVALS = {"1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h"}
+
+
+def sma(close: pd.Series, window: int) -> pd.Series:
+    """Simple moving average."""
+    return close.rolling(window, min_periods=window).mean()
+
+
+def ema(close: pd.Series, span: int) -> pd.Series:
+    """Exponential moving average seeded with the first observation."""
+    return close.ewm(span=span, adjust=False, min_periods=span).mean()
+
+
+def rsi(close: pd.Series, period: int) -> pd.Series:
+    """Relative Strength Index using Wilder's smoothing."""
+    delta = close.diff()
+    gains = delta.clip(lower=0.0)
+    losses = -delta.clip(upper=0.0)
+    avg_gain = gains.ewm(alpha=1.0 / period, adjust=False, min_periods=period).mean()
+    avg_loss = losses.ewm(alpha=1.0 / period, adjust=False, min_periods=period).mean()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = avg_gain / avg_loss
+    values = 100.0 - 100.0 / (1.0 + rs)
+    # No losses in the window means maximum strength, not NaN; no change at all is neutral
+    values = values.where(avg_loss != 0, 100.0).where((avg_gain != 0) | (avg_loss != 0), 50.0)
+    return values.where(avg_gain.notna())
+
+
+def macd(close: pd.Series, fast: int, slow: int, signal: int) -> tuple[pd.Series, pd.Series, pd.Series]:
+    """MACD line, signal line and histogram."""
+    line = ema(close, fast) - ema(close, slow)
+    signal_line = line.ewm(span=signal, adjust=False, min_periods=signal).mean()
+    return line, signal_line, line - signal_line
+
+
+def bollinger(close: pd.Series, window: int, num_std: float) -> tuple[pd.Series, pd.Series, pd.Series]:
+    """Bollinger Bands: middle (SMA), upper and lower bands."""
+    rolling = close.rolling(window, min_periods=window)
+    middle = rolling.mean()
+    width = rolling.std(ddof=0) * num_std
+    return middle, middle + width, middle - width
+
+
+def atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int) -> pd.Series:
+    """Average True Range using Wilder's smoothing."""
+    prev_close = close.shift(1)
+    true_range = pd.concat(
+        [high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1
+    ).max(axis=1)
+    return true_range.ewm(alpha=1.0 / period, adjust=False, min_periods=period).mean()
+
+
+def vwap(high: pd.Series, low: pd.Series, close: pd.Series, volume: pd.Series, intraday: bool) -> pd.Series:
+    """
+    Volume-weighted average price of the typical price.
+    Intraday bars are anchored to each trading session; otherwise the
+    average is anchored at the start of the window.
+    """
+    typical_volume = (high + low + close) / 3.0 * volume
+    if intraday:
+        sessions = close.index.date
+        cum_pv = typical_volume.groupby(sessions).cumsum()
+        cum_volume = volume.groupby(sessions).cumsum()
+    else:
+        cum_pv = typical_volume.cumsum()
+        cum_volume = volume.cumsum()
+    return cum_pv / cum_volume.replace(0, np.nan)
+
+
+def compute_indicators(
+    frame: pd.DataFrame,
+    indicators: list[IndicatorType],
+    interval: str,
+    window: int = 20,
+    rsi_period: int = 14,
+    macd_fast: int = 12,
+    macd_slow: int = 26,
+    macd_signal: int = 9,
+    bollinger_std: float = 2.0,
+    atr_period: int = 14,
+) -> dict[str, np.ndarray]:
+    """
+    Compute the requested indicators over the full frame.
+
+    Returns:
+        Mapping of output column name (e.g. ``sma_20``, ``macd_signal``) to a
+        float64 array aligned with ``frame.index``.
+    """
+    close = frame["Close"].astype(np.float64)
+    high = frame["High"].astype(np.float64)
+    low = frame["Low"].astype(np.float64)
+    results: dict[str, pd.Series] = {}
+
+    for indicator in dict.fromkeys(indicators):
+        if indicator == IndicatorType.sma:
+            results[f"sma_{window}"] = sma(close, window)
+        elif indicator == IndicatorType.ema:
+            results[f"ema_{window}"] = ema(close, window)
+        elif indicator == IndicatorType.rsi:
+            results[f"rsi_{rsi_period}"] = rsi(close, rsi_period)
+        elif indicator == IndicatorType.macd:
+            line, signal_line, histogram = macd(close, macd_fast, macd_slow, macd_signal)
+            results["macd"] = line
+            results["macd_signal"] = signal_line
+            results["macd_hist"] = histogram
+        elif indicator == IndicatorType.bollinger:
+            middle, upper, lower = bollinger(close, window, bollinger_std)
+            results["bb_middle"] = middle
+            results["bb_upper"] = upper
+            results["bb_lower"] = lower
+        elif indicator == IndicatorType.atr:
+            results[f"atr_{atr_period}"] = atr(high, low, close, atr_period)
+        elif indicator == IndicatorType.vwap:
+            volume = frame["Volume"].astype(np.float64)
+            results["vwap"] = vwap(high, low, close, volume, interval in INTRADAY_INTERVALS)
+
+    return {name: series.to_numpy(dtype=np.float64) for name, series in results.items()}
@@ -0,0 +1,79 @@
+"""
+Vectorized summary statistics for historical price data.
+"""
+from __future__ import annotations
+
+from src.lazy import lazy_import
+
+np = lazy_import("numpy", globals())
+pd = lazy_import("pandas", globals())
+
+
+# Bars per trading year for each yfinance interval (used to annualize volatility)
+PERIODS_PER_YEAR: dict[str, float] = {
+    "1m": 252 * 390,
+    "2m": 252 * 195,
+    "5m": 252 * 78,
+    "15m": 252 * 26,
+    "30m": 252 * 13,
+    "60m": 252 * 6.5,
+    "90m": 252 * 390 / 90,
+    "1h": 252 * 6.5,
+    "1d": 252,
+    "5d": 252 / 5,
+    "1wk": 52,
+    "1mo": 12,
+    "3mo": 4,
+}
+
+
+def _finite_or_none(value: float) -> float | None:
+    """Convert NumPy scalars to float, mapping NaN/inf to None."""
+    return float(value) if np.isfinite(value) else None
+
+
+def compute_price_summary(frame: pd.DataFrame, interval: str) -> dict:
+    """
+    Compute aggregate statistics over an OHLCV frame in a single vectorized pass.
+
+    Args:
+        frame: DataFrame as returned by ``yf.Ticker.history`` (DatetimeIndex,
+            Open/High/Low/Close/Volume columns)
+        interval: yfinance interval of the bars, used to annualize volatility
+
+    Returns:
+        Dictionary with the fields of ``PriceSummaryResponse`` (minus the
+        request echo fields).
+    """
+    frame = frame.dropna(subset=["Close"])
+    if frame.empty:
+        raise ValueError("No closing prices available to summarize")
+
+    close = frame["Close"].to_numpy(dtype=np.float64)
+    high = frame["High"].to_numpy(dtype=np.float64) if "High" in frame else close
+    low = frame["Low"].to_numpy(dtype=np.float64) if "Low" in frame else close
+    volume = frame["Volume"].to_numpy(dtype=np.float64) if "Volume" in frame else np.array([np.nan])
+
+    log_returns = np.diff(np.log(close))
+    if log_returns.size > 1:
+        periods = PERIODS_PER_YEAR.get(interval, 252)
+        volatility = np.std(log_returns, ddof=1) * np.sqrt(periods)
+    else:
+        volatility = np.nan
+
+    running_peak = np.maximum.accumulate(close)
+    drawdowns = close / running_peak - 1.0
+
+    return {
+        "start_date": str(frame.index[0]),
+        "end_date": str(frame.index[-1]),
+        "bars": int(close.size),
+        "first_close": _finite_or_none(close[0]),
+        "last_close": _finite_or_none(close[-1]),
+        "period_return": _finite_or_none(close[-1] / close[0] - 1.0),
+        "high": _finite_or_none(np.nanmax(high)),
+        "low": _finite_or_none(np.nanmin(low)),
+        "average_volume": _finite_or_none(np.nanmean(volume)) if np.isfinite(volume).any() else None,
+        "realized_volatility": _finite_or_none(volatility),
+        "max_drawdown": _finite_or_none(drawdowns.min()),
+    }
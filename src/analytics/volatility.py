@@ -0,0 +1,108 @@
+"""
+Implied volatility smiles, term structure and surface interpolation.
+
+Each expiration's smile is fitted as a quadratic in log-moneyness ln(K/S)
+over out-of-the-money contracts. The surface is then interpolated linearly in
+total implied variance (sigma^2 * T) across tenors, which keeps calendar
+spreads free of arbitrage between fitted expirations.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from src.lazy import lazy_import
+
+np = lazy_import("numpy", globals())
+pd = lazy_import("pandas", globals())
+
+
+DEFAULT_MONEYNESS_GRID = [0.8, 0.85, 0.9, 0.95, 1.0, 1.05, 1.1, 1.15, 1.2]
+DEFAULT_TENOR_DAYS = [7, 14, 30, 60, 90, 180, 365]
+
+# Quotes outside this range are treated as bad data
+MIN_IV, MAX_IV = 0.01, 5.0
+
+
+@dataclass(frozen=True)
+class SmileFit:
+    """Quadratic smile fit for one expiration."""
+    expiration_date: str
+    years: float
+    coefficients: tuple[float, float, float]  # (a, b, c) for a*x^2 + b*x + c, x = ln(K/S)
+    contracts: int
+
+    @property
+    def atm_iv(self) -> float:
+        return max(self.coefficients[2], 0.0)
+
+
+def otm_quotes(spot: float, calls: pd.DataFrame, puts: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Log-moneyness and implied volatility of out-of-the-money contracts
+    (puts below spot, calls at or above), dropping implausible quotes.
+    """
+    frames = []
+    for frame, otm in ((puts, lambda k: k < spot), (calls, lambda k: k >= spot)):
+        if frame is None or frame.empty:
+            continue
+        strikes = frame["strike"].to_numpy(dtype=np.float64)
+        ivs = frame["impliedVolatility"].to_numpy(dtype=np.float64)
+        mask = otm(strikes) & (ivs >= MIN_IV) & (ivs <= MAX_IV)
+        if "bid" in frame:
+            bids = frame["bid"].to_numpy(dtype=np.float64)
+            # Only filter on bids when the feed actually reports them
+            if np.nan_to_num(bids).any():
+                mask &= bids > 0
+        frames.append((strikes[mask], ivs[mask]))
+
+    if not frames:
+        return np.empty(0), np.empty(0)
+    strikes = np.concatenate([strikes for strikes, _ in frames])
+    ivs = np.concatenate([ivs for _, ivs in frames])
+    return np.log(strikes / spot), ivs
+
+
+def fit_smile(expiration_date: str, years: float, log_moneyness: np.ndarray, ivs: np.ndarray) -> SmileFit | None:
+    """Fit a quadratic smile, falling back to a line or a constant with few quotes."""
+    n = len(ivs)
+    if n == 0 or years <= 0:
+        return None
+    degree = min(2, n - 1)
+    if degree == 0 or np.ptp(log_moneyness) == 0:
+        coefficients = (0.0, 0.0, float(np.mean(ivs)))
+    else:
+        fitted = np.polyfit(log_moneyness, ivs, degree)
+        coefficients = tuple(float(c) for c in np.concatenate([np.zeros(2 - degree), fitted]))
+    return SmileFit(expiration_date, years, coefficients, n)
+
+
+def interpolate_surface(smiles: list[SmileFit], moneyness: list[float], tenor_days: list[float]) -> np.ndarray:
+    """
+    Evaluate fitted smiles on a (tenor x moneyness) grid.
+
+    Smiles are evaluated on the moneyness grid in one matrix product, then
+    total variance is interpolated linearly across expirations. Tenors outside
+    the fitted range keep the nearest expiration's volatility.
+
+    Returns:
+        Array of shape (len(tenor_days), len(moneyness)).
+    """
+    smiles = sorted(smiles, key=lambda smile: smile.years)
+    years = np.array([smile.years for smile in smiles])
+    coefficients = np.array([smile.coefficients for smile in smiles])  # (E, 3)
+
+    x = np.log(np.asarray(moneyness, dtype=np.float64))
+    vandermonde = np.vstack([x * x, x, np.ones_like(x)])  # (3, M)
+    vols = np.clip(coefficients @ vandermonde, MIN_IV, MAX_IV)  # (E, M)
+
+    targets = np.asarray(tenor_days, dtype=np.float64) / 365.0
+    if len(smiles) == 1:
+        return np.repeat(vols, len(targets), axis=0)
+
+    variance = vols * vols * years[:, None]  # total variance per expiration
+    upper = np.clip(np.searchsorted(years, targets), 1, len(years) - 1)
+    lower = upper - 1
+    weight = np.clip((targets - years[lower]) / (years[upper] - years[lower]), 0.0, 1.0)[:, None]
+    clamped = np.clip(targets, years[0], years[-1])[:, None]
+    interpolated = (1.0 - weight) * variance[lower] + weight * variance[upper]
+    return np.sqrt(interpolated / clamped)
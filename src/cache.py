@@ -0,0 +1,185 @@
+"""
+In-process TTL cache shared by the server tools.
+Keeps upstream Yahoo Finance calls and derived computations from being repeated
+while their results are still fresh. SharedTTLCache extends it across the
+worker processes of a multi-worker HTTP server.
+"""
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a time-to-live.
+
+    Values are returned as stored (no copy), so callers must treat cached
+    objects such as DataFrames as read-only.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        max_entries: int = 1024,
+        on_lookup: Callable[[str, bool], None] | None = None,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.on_lookup = on_lookup
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for key, or None if missing or expired."""
+        hit, value = self._lookup(key)
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if self.on_lookup is not None:
+            self.on_lookup(self.name, hit)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        if self.max_entries <= 0:
+            return
+        self._store(key, value, self.ttl if ttl is None else ttl)
+
+    def _lookup(self, key: Hashable) -> tuple[bool, Any]:
+        """(hit, value) from the in-process entries, dropping an expired one."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] >= time.monotonic():
+                self._data.move_to_end(key)
+                return True, entry[1]
+            if entry is not None:
+                del self._data[key]
+        return False, None
+
+    def _store(self, key: Hashable, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SharedTTLCache(TTLCache):
+    """
+    TTLCache whose entries are also stored in a SQLite file, so worker
+    processes of one server see each other's results.
+
+    Lookups try the in-process LRU first and fall back to the file; values
+    found there are kept locally for the rest of their lifetime. Keys are
+    stored by ``repr``, values pickled. The file is best effort: when it is
+    locked or unreadable the cache behaves like a plain TTLCache.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            cache TEXT NOT NULL,
+            key TEXT NOT NULL,
+            expires REAL NOT NULL,
+            value BLOB NOT NULL,
+            PRIMARY KEY (cache, key)
+        )
+    """
+    # Expired and surplus rows are pruned every PRUNE_EVERY writes
+    PRUNE_EVERY = 64
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        path: str,
+        max_entries: int = 1024,
+        on_lookup: Callable[[str, bool], None] | None = None,
+    ):
+        super().__init__(name, ttl, max_entries=max_entries, on_lookup=on_lookup)
+        self.path = path
+        self._connections = threading.local()
+        self._writes = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections may not be shared between threads
+        connection = getattr(self._connections, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=1.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(self.SCHEMA)
+            self._connections.connection = connection
+        return connection
+
+    def _lookup(self, key: Hashable) -> tuple[bool, Any]:
+        hit, value = super()._lookup(key)
+        if hit:
+            return hit, value
+        try:
+            row = self._connection().execute(
+                "SELECT expires, value FROM entries WHERE cache = ? AND key = ?", (self.name, repr(key))
+            ).fetchone()
+            if row is None or row[0] < time.time():
+                return False, None
+            value = pickle.loads(row[1])
+        except (sqlite3.Error, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return False, None
+        super()._store(key, value, row[0] - time.time())
+        return True, value
+
+    def _store(self, key: Hashable, value: Any, ttl: float) -> None:
+        super()._store(key, value, ttl)
+        try:
+            connection = self._connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (cache, key, expires, value) VALUES (?, ?, ?, ?)",
+                (self.name, repr(key), time.time() + ttl, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)),
+            )
+            with self._lock:
+                self._writes += 1
+                prune = self._writes % self.PRUNE_EVERY == 0
+            if prune:
+                self._prune(connection)
+        except (sqlite3.Error, pickle.PicklingError, TypeError, AttributeError):
+            pass
+
+    def _prune(self, connection: sqlite3.Connection) -> None:
+        connection.execute("DELETE FROM entries WHERE cache = ? AND expires < ?", (self.name, time.time()))
+        connection.execute(
+            "DELETE FROM entries WHERE cache = ? AND key NOT IN "
+            "(SELECT key FROM entries WHERE cache = ? ORDER BY expires DESC LIMIT ?)",
+            (self.name, self.name, self.max_entries),
+        )
+
+    def clear(self) -> None:
+        """Drop all entries, in this process and in the file, and reset statistics."""
+        super().clear()
+        try:
+            self._connection().execute("DELETE FROM entries WHERE cache = ?", (self.name,))
+        except sqlite3.Error:
+            pass
@@ -0,0 +1,224 @@
+"""
+Negotiated response compression for the Streamable HTTP transport.
+
+CompressionMiddleware compresses a response with the first encoding of
+``HTTPConfig.compression_encodings`` that is installed and accepted by the
+client (``Accept-Encoding``). gzip is always available; br needs ``brotli``
+(or ``brotlicffi``) and zstd needs ``zstandard`` (the 'compression' extra).
+
+Headers are held back until the body reaches ``HTTPConfig.compression_min_size``
+bytes: responses that end below it (quotes, errors, acknowledgements) are
+sent unchanged, larger ones are compressed from the first byte. Tool results
+on /mcp usually arrive as a server-sent event stream whose first events are
+small log notifications, so those wait for the result (or the threshold);
+a threshold of 0 compresses every response without holding anything back.
+Once compressing, each chunk is compressed and flushed on its own so events
+are not delayed. Long-lived GET event streams are never compressed, since
+their first event may not come for minutes.
+"""
+import re
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from starlette.applications import Starlette
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import config
+
+DEFAULT_ENCODINGS = ("zstd", "br", "gzip")
+
+
+class Encoder:
+    """Streaming compressor: compress() returns data flushed up to a block boundary."""
+
+    def compress(self, data: bytes) -> bytes:
+        raise NotImplementedError
+
+    def finish(self, data: bytes) -> bytes:
+        raise NotImplementedError
+
+
+class GzipEncoder(Encoder):
+    def __init__(self, level: int = 6):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliEncoder(Encoder):
+    def __init__(self, module: Any, quality: int = 4):
+        self._compressor = module.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+
+class ZstdEncoder(Encoder):
+    def __init__(self, module: Any, level: int = 3):
+        self._module = module
+        self._compressor = module.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(self._module.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+def _import_first(*names: str) -> Any:
+    for name in names:
+        try:
+            return __import__(name)
+        except ImportError:
+            continue
+    return None
+
+
+def available_encoders() -> dict[str, Callable[[], Encoder]]:
+    """Encoder factories by content-coding name, for the installed packages."""
+    encoders: dict[str, Callable[[], Encoder]] = {"gzip": GzipEncoder}
+    brotli = _import_first("brotli", "brotlicffi")
+    if brotli is not None:
+        encoders["br"] = lambda: BrotliEncoder(brotli)
+    zstandard = _import_first("zstandard")
+    if zstandard is not None:
+        encoders["zstd"] = lambda: ZstdEncoder(zstandard)
+    return encoders
+
+
+_CODING = re.compile(r"^\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([\d.]+))?\s*$")
+
+
+def parse_accept_encoding(header: str) -> dict[str, float]:
+    """Content-coding -> quality from an Accept-Encoding header."""
+    accepted = {}
+    for part in header.lower().split(","):
+        match = _CODING.match(part)
+        if not match:
+            continue
+        try:
+            accepted[match.group(1)] = float(match.group(2)) if match.group(2) else 1.0
+        except ValueError:
+            continue
+    return accepted
+
+
+def negotiate(header: str, preference: tuple[str, ...] | list[str]) -> str | None:
+    """The best encoding of ``preference`` the client accepts, or None for identity."""
+    accepted = parse_accept_encoding(header)
+    best, best_quality = None, 0.0
+    for encoding in preference:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+@dataclass
+class _Response:
+    """Per-request state of the middleware's send wrapper."""
+    start: Message | None = None
+    buffered: list[bytes] = field(default_factory=list)
+    size: int = 0
+    encoder: Encoder | None = None
+    passthrough: bool = False
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses of at least ``minimum_size`` bytes."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, encodings: tuple[str, ...] | list[str] = DEFAULT_ENCODINGS):
+        self.app = app
+        self.minimum_size = minimum_size
+        factories = available_encoders()
+        self.encoders = {name: factories[name] for name in encodings if name in factories}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.encoders:
+            await self.app(scope, receive, send)
+            return
+        accept = ""
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+        encoding = negotiate(accept, tuple(self.encoders))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        response = _Response()
+
+        async def send_compressed(message: Message) -> None:
+            if response.passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = dict((name.lower(), value) for name, value in message.get("headers", []))
+                streaming_get = scope["method"] == "GET" and headers.get(b"content-type", b"").startswith(b"text/event-stream")
+                if b"content-encoding" in headers or streaming_get:
+                    response.passthrough = True
+                    await send(message)
+                else:
+                    response.start = message
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if response.start is not None:
+                response.buffered.append(body)
+                response.size += len(body)
+                if response.size < self.minimum_size:
+                    if more_body:
+                        return
+                    # Ended below the threshold: send everything as it was
+                    response.passthrough = True
+                    await send(response.start)
+                    await send({"type": "http.response.body", "body": b"".join(response.buffered), "more_body": False})
+                    return
+                start, response.start = response.start, None
+                body, response.buffered = b"".join(response.buffered), []
+                response.encoder = self.encoders[encoding]()
+                await send(self._compressed_start(start, encoding))
+
+            if more_body:
+                data = response.encoder.compress(body) if body else b""
+            else:
+                data = response.encoder.finish(body)
+            await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
+
+    @staticmethod
+    def _compressed_start(start: Message, encoding: str) -> Message:
+        headers = [(name, value) for name, value in start.get("headers", []) if name.lower() != b"content-length"]
+        vary = [value for name, value in headers if name.lower() == b"vary"]
+        headers = [(name, value) for name, value in headers if name.lower() != b"vary"]
+        headers.append((b"content-encoding", encoding.encode()))
+        headers.append((b"vary", b", ".join(vary + [b"Accept-Encoding"])))
+        return {**start, "headers": headers}
+
+
+def install_compression(app: Starlette) -> Starlette:
+    """Add CompressionMiddleware to ``app`` as configured in HTTPConfig."""
+    http = config.http
+    if http.compression:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=http.compression_min_size,
+            encodings=http.compression_encodings,
+        )
+    return app
@@ -1,6 +1,6 @@
 """
 Configuration module for Yahoo Finance MCP Server.
 """
-from .settings import ServerConfig, TransportType, HTTPConfig, config
+from .settings import ServerConfig, TransportType, HTTPConfig, CacheConfig, AnalyticsConfig, ExportConfig, TracingConfig, ProfilingConfig, SlowLogConfig, UpstreamConfig, config
 
-__all__ = ["ServerConfig", "TransportType", "HTTPConfig", "config"]
+__all__ = ["ServerConfig", "TransportType", "HTTPConfig", "CacheConfig", "AnalyticsConfig", "ExportConfig", "TracingConfig", "ProfilingConfig", "SlowLogConfig", "UpstreamConfig", "config"]
@@ -19,10 +19,28 @@ class HTTPConfig(BaseModel):
     host: str = Field(default="0.0.0.0", description="HTTP server host")
     port: int = Field(default=3000, description="HTTP server port", ge=1024, le=65535)
     stateless: bool = Field(default=False, description="Stateless mode (no session persistence)")
+    workers: int = Field(default=1, description="Worker processes (more than one implies stateless mode)", ge=1)
+
+    # ASGI server (uvicorn) tuning
+    loop: Literal["auto", "asyncio", "uvloop"] = Field(default="auto", description="Event loop (auto: uvloop when installed)")
+    http_parser: Literal["auto", "h11", "httptools"] = Field(default="auto", description="HTTP/1.1 parser (auto: httptools when installed)")
+    keep_alive_timeout: int = Field(default=5, description="Seconds an idle keep-alive connection is kept open", ge=0)
+    backlog: int = Field(default=2048, description="Connections queued by the listening socket before accept", ge=1)
+    max_connections: int | None = Field(default=None, description="Concurrent connections before new requests get 503 (None: unlimited)", ge=1)
+    graceful_shutdown_timeout: int | None = Field(default=None, description="Seconds to drain in-flight requests on shutdown (None: wait indefinitely)", ge=0)
     cors_origins: list[str] = Field(
         default=["*"],
         description="Allowed CORS origins"
     )
+    metrics_enabled: bool = Field(default=True, description="Serve Prometheus metrics at /metrics")
+
+    # Response compression (see src/compression.py)
+    compression: bool = Field(default=True, description="Compress responses for clients sending Accept-Encoding")
+    compression_min_size: int = Field(default=1024, description="Bytes below which a response is sent uncompressed", ge=0)
+    compression_encodings: list[Literal["zstd", "br", "gzip"]] = Field(
+        default=["zstd", "br", "gzip"],
+        description="Encodings in order of preference (br and zstd need the 'compression' extra)"
+    )
 
     # Optional: Authentication (OAuth 2.1 support - requires separate AS)
     enable_auth: bool = Field(default=False, description="Enable OAuth 2.1")
@@ -33,6 +51,84 @@ class HTTPConfig(BaseModel):
     # See: https://modelcontextprotocol.io/specification/2025-06-18/basic/authorization
 
 
+class CacheConfig(BaseModel):
+    """In-process cache configuration."""
+    enabled: bool = Field(default=True, description="Cache upstream data and derived results")
+    history_ttl: float = Field(default=60.0, description="Seconds historical bars stay fresh", ge=0)
+    indicator_ttl: float = Field(default=60.0, description="Seconds computed indicators stay fresh", ge=0)
+    quote_ttl: float = Field(default=15.0, description="Seconds underlying quotes stay fresh", ge=0)
+    iv_surface_ttl: float = Field(default=120.0, description="Seconds fitted volatility smiles stay fresh", ge=0)
+    max_entries: int = Field(default=1024, description="Maximum entries per cache", ge=0)
+    shared_path: str = Field(
+        default="",
+        description="SQLite file shared by HTTP worker processes (a temporary file when workers > 1 and unset)"
+    )
+    history_store_path: str = Field(
+        default="",
+        description="Directory of memory-mapped history files, shared by worker processes (empty to keep bars in process)"
+    )
+    schema_path: str = Field(
+        default="~/.cache/yahoo-finance-mcp/tool_schemas.json",
+        description="Cached tool definitions served by tools/list (empty to build schemas at startup)"
+    )
+
+
+class AnalyticsConfig(BaseModel):
+    """Limits for multi-ticker analytics."""
+    fetch_workers: int = Field(default=8, description="Threads used for batch upstream fetches", ge=1, le=64)
+    max_tickers: int = Field(default=500, description="Maximum tickers per multi-ticker request", ge=2)
+    memory_budget_mb: float = Field(default=256.0, description="Working memory allowed per matrix computation (MB)", gt=0)
+    risk_free_rate: float = Field(default=0.04, description="Continuously compounded risk-free rate for option Greeks")
+
+
+class ExportConfig(BaseModel):
+    """Bulk dataset exports (export_dataset tool)."""
+    directory: str = Field(
+        default="~/.local/share/yahoo-finance-mcp/exports",
+        description="Directory export files are written to"
+    )
+    row_group_size: int = Field(default=65536, description="Rows per Parquet row group / Arrow record batch", ge=1)
+
+
+class TracingConfig(BaseModel):
+    """Span tracing of tool execution stages."""
+    enabled: bool = Field(default=False, description="Record and export tracing spans")
+    exporter: Literal["console", "file", "otlp"] = Field(default="console", description="Where sampled spans are sent")
+    sample_ratio: float = Field(default=0.1, description="Fraction of tool calls traced", ge=0, le=1)
+    file_path: str = Field(default="traces.jsonl", description="Output file for the 'file' exporter")
+    otlp_endpoint: str = Field(default="http://localhost:4318", description="OTLP/HTTP collector base URL")
+    service_name: str = Field(default="yahoo-finance-mcp", description="service.name resource attribute")
+
+
+class ProfilingConfig(BaseModel):
+    """Opt-in profiling of sampled tool calls."""
+    enabled: bool = Field(default=False, description="Profile sampled tool calls with cProfile")
+    sample_ratio: float = Field(default=0.05, description="Fraction of tool calls profiled", ge=0, le=1)
+    output_dir: str = Field(default="profiles", description="Directory for aggregated profiles and memory snapshots")
+    dump_every: int = Field(default=20, description="Rewrite a tool's aggregated profile every N samples", ge=1)
+    memory_tools: list[str] = Field(
+        default=["get_historical_stock_prices"],
+        description="Tools whose sampled calls also record a tracemalloc snapshot"
+    )
+
+
+class SlowLogConfig(BaseModel):
+    """Structured log of slow tool calls."""
+    enabled: bool = Field(default=True, description="Log tool calls slower than the threshold")
+    threshold_ms: float = Field(default=1000.0, description="Tool calls at or above this duration are logged (ms)", ge=0)
+    path: str | None = Field(default=None, description="JSON-lines file to append to (stderr if unset)")
+
+
+class UpstreamConfig(BaseModel):
+    """Where yfinance sends its HTTP requests."""
+    mode: Literal["live", "record", "replay"] = Field(
+        default="live",
+        description="'live' talks to Yahoo, 'record' also archives every exchange, 'replay' uses a stand-in server"
+    )
+    archive_path: str = Field(default="fixtures/yahoo.jsonl.gz", description="Exchange archive written in 'record' mode")
+    replay_url: str = Field(default="http://127.0.0.1:8765", description="Base URL of the stand-in server used in 'replay' mode")
+
+
 class ServerConfig(BaseSettings):
     """MCP server general configuration."""
 
@@ -45,6 +141,41 @@ class ServerConfig(BaseSettings):
     # HTTP configuration
     http: HTTPConfig = Field(default_factory=HTTPConfig)
 
+    # Caching
+    cache: CacheConfig = Field(default_factory=CacheConfig)
+
+    # Multi-ticker analytics
+    analytics: AnalyticsConfig = Field(default_factory=AnalyticsConfig)
+
+    # Parquet / Arrow exports
+    export: ExportConfig = Field(default_factory=ExportConfig)
+
+    # Tracing, profiling and slow-request log
+    tracing: TracingConfig = Field(default_factory=TracingConfig)
+    profiling: ProfilingConfig = Field(default_factory=ProfilingConfig)
+    slow_log: SlowLogConfig = Field(default_factory=SlowLogConfig)
+
+    # Yahoo Finance access (live, recording or replaying)
+    upstream: UpstreamConfig = Field(default_factory=UpstreamConfig)
+
+    # Startup
+    warm_up: bool = Field(
+        default=True,
+        description="Import pandas/yfinance in a background thread once a client has connected"
+    )
+
+    # Tool results
+    fast_serialization: bool = Field(
+        default=True,
+        description="Serialize model results once with pydantic-core/orjson (compact JSON text)"
+    )
+
+    # Debugging
+    validate_models: bool = Field(
+        default=False,
+        description="Validate response models built from normalized upstream data (slower; on in tests)"
+    )
+
     # Logging
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = Field(
         default="INFO",
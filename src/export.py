@@ -0,0 +1,309 @@
+"""
+Bulk export of Yahoo Finance data to Parquet or Arrow IPC files.
+
+JSON is the wrong encoding for notebooks pulling years of bars for hundreds
+of tickers. The export_dataset tool converts each ticker's data to an Arrow
+table with a fixed schema per dataset and hands it to a DatasetWriter,
+which buffers tables only until a row group is full, writes it and lets the
+rows go. A partial file is published under its final name only once the
+export completes.
+
+pyarrow is optional (the 'export' extra); without it the tool reports that
+exports are unavailable.
+"""
+from __future__ import annotations
+
+import errno
+import importlib.util
+import os
+import re
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.lazy import lazy_import
+
+np = lazy_import("numpy", globals())
+pd = lazy_import("pandas", globals())
+pa = lazy_import("pyarrow", globals())
+pq = lazy_import("pyarrow.parquet", globals())
+
+EXTENSIONS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+# File names are kept inside the export directory
+_FILE_NAME = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
+
+# history: frame column -> (field, type name)
+HISTORY_COLUMNS = {
+    "Open": ("open", "float64"),
+    "High": ("high", "float64"),
+    "Low": ("low", "float64"),
+    "Close": ("close", "float64"),
+    "Adj Close": ("adj_close", "float64"),
+    "Volume": ("volume", "int64"),
+    "Dividends": ("dividends", "float64"),
+    "Stock Splits": ("stock_splits", "float64"),
+}
+
+# options: chain column -> (field, type name)
+OPTION_COLUMNS = {
+    "contractSymbol": ("contract_symbol", "string"),
+    "strike": ("strike", "float64"),
+    "lastPrice": ("last_price", "float64"),
+    "bid": ("bid", "float64"),
+    "ask": ("ask", "float64"),
+    "change": ("change", "float64"),
+    "percentChange": ("percent_change", "float64"),
+    "volume": ("volume", "int64"),
+    "openInterest": ("open_interest", "int64"),
+    "impliedVolatility": ("implied_volatility", "float64"),
+    "inTheMoney": ("in_the_money", "bool_"),
+}
+
+
+def pyarrow_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def export_path(directory: str, file_name: str | None, dataset: str, file_format: str) -> Path:
+    """
+    Path of a new export file, named after the dataset, the time and a random suffix unless ``file_name`` is given.
+
+    Raises:
+        ValueError: If ``file_name`` is not a plain file name.
+    """
+    extension = EXTENSIONS[file_format]
+    if file_name is None:
+        file_name = f"{dataset}-{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}-{uuid.uuid4().hex[:8]}"
+    elif not _FILE_NAME.fullmatch(file_name):
+        raise ValueError(f"Invalid file name '{file_name}': use letters, digits, '.', '_' and '-' only")
+    if not file_name.endswith(extension):
+        file_name += extension
+    return Path(directory).expanduser().resolve() / file_name
+
+
+def _type(name: str) -> pa.DataType:
+    return getattr(pa, name)()
+
+
+def _utc(values: pd.DatetimeIndex | pd.Series) -> np.ndarray:
+    """Naive UTC datetime64[ns] values of timestamps with or without a time zone."""
+    values = pd.to_datetime(values, utc=True)
+    if isinstance(values, pd.Series):
+        values = pd.DatetimeIndex(values)
+    return values.tz_convert(None).as_unit("ns").to_numpy()
+
+
+def _column(frame: pd.DataFrame, name: str, type_name: str) -> pa.Array:
+    """Column of ``frame`` as ``type_name`` with NaN as null (all null if it is missing)."""
+    if name not in frame.columns:
+        return pa.nulls(len(frame), _type(type_name))
+    values = frame[name]
+    if type_name == "string":
+        return pa.array(values.to_numpy(dtype=object), type=pa.string(), from_pandas=True)
+    return pa.array(values.to_numpy(), from_pandas=True).cast(_type(type_name), safe=False)
+
+
+def _label(value: str, rows: int) -> pa.Array:
+    return pa.array([value] * rows, type=pa.string())
+
+
+def history_schema() -> pa.Schema:
+    return pa.schema(
+        [("ticker", pa.string()), ("date", pa.timestamp("ns", tz="UTC"))]
+        + [(field, _type(type_name)) for field, type_name in HISTORY_COLUMNS.values()]
+    )
+
+
+def history_table(ticker: str, frame: pd.DataFrame) -> pa.Table:
+    """OHLCV bars of one ticker; timestamps in UTC, raw values (zeros are kept)."""
+    arrays = [_label(ticker, len(frame)), pa.array(_utc(frame.index), type=pa.timestamp("ns", tz="UTC"))]
+    arrays += [_column(frame, name, type_name) for name, (_, type_name) in HISTORY_COLUMNS.items()]
+    return pa.Table.from_arrays(arrays, schema=history_schema())
+
+
+def statement_schema() -> pa.Schema:
+    return pa.schema([
+        ("ticker", pa.string()),
+        ("statement", pa.string()),
+        ("period_end", pa.date32()),
+        ("item", pa.string()),
+        ("value", pa.float64()),
+    ])
+
+
+def statement_table(ticker: str, financial_type: str, statement: pd.DataFrame) -> pa.Table:
+    """A statement in long form: one row per line item and period end."""
+    items, periods = statement.shape
+    period_ends = pd.to_datetime(pd.Index(statement.columns), errors="coerce")
+    values = statement.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64)
+    arrays = [
+        _label(ticker, items * periods),
+        _label(financial_type, items * periods),
+        pa.array(np.repeat(period_ends.to_numpy(dtype="datetime64[D]"), items), from_pandas=True).cast(pa.date32()),
+        pa.array(np.tile(statement.index.astype(str).to_numpy(dtype=object), periods), type=pa.string()),
+        pa.array(values.ravel(order="F"), from_pandas=True),
+    ]
+    return pa.Table.from_arrays(arrays, schema=statement_schema())
+
+
+def chain_schema() -> pa.Schema:
+    return pa.schema(
+        [
+            ("ticker", pa.string()),
+            ("expiration", pa.date32()),
+            ("option_type", pa.string()),
+            ("last_trade_date", pa.timestamp("ns", tz="UTC")),
+        ]
+        + [(field, _type(type_name)) for field, type_name in OPTION_COLUMNS.values()]
+    )
+
+
+def chain_table(ticker: str, expiration: str, option_type: str, chain: pd.DataFrame) -> pa.Table:
+    """Contracts of one expiration and side ('calls' or 'puts')."""
+    rows = len(chain)
+    traded_type = pa.timestamp("ns", tz="UTC")
+    if "lastTradeDate" in chain.columns:
+        traded = pa.array(_utc(chain["lastTradeDate"]), type=traded_type, from_pandas=True)
+    else:
+        traded = pa.nulls(rows, traded_type)
+    arrays = [
+        _label(ticker, rows),
+        pa.array([datetime.strptime(expiration, "%Y-%m-%d").date()] * rows, type=pa.date32()),
+        _label(option_type, rows),
+        traded,
+    ]
+    arrays += [_column(chain, name, type_name) for name, (_, type_name) in OPTION_COLUMNS.items()]
+    return pa.Table.from_arrays(arrays, schema=chain_schema())
+
+
+SCHEMAS = {"history": history_schema, "financials": statement_schema, "options": chain_schema}
+
+
+def dataset_tables(dataset: str, ticker: str, data, financial_type: str) -> list[pa.Table]:
+    """
+    Tables of one ticker for ``dataset``, from what src.market_data fetched for it:
+    a history frame, a statement frame or (expiration, calls, puts) chains.
+    """
+    if dataset == "history":
+        return [history_table(ticker, data)]
+    if dataset == "financials":
+        return [statement_table(ticker, financial_type, data)]
+    return [
+        chain_table(ticker, expiration, option_type, chain)
+        for expiration, calls, puts in data
+        for option_type, chain in (("calls", calls), ("puts", puts))
+    ]
+
+
+def write_results(writer: DatasetWriter, dataset: str, results: dict, financial_type: str) -> tuple[list[str], list[str]]:
+    """
+    Write the tables of each ticker's fetched data (blocking).
+
+    Returns:
+        Tuple of (tickers written, tickers without rows).
+    """
+    written, empty = [], []
+    for ticker, data in results.items():
+        tables = dataset_tables(dataset, ticker, data, financial_type)
+        if not any(table.num_rows for table in tables):
+            empty.append(ticker)
+            continue
+        for table in tables:
+            writer.write(table)
+        written.append(ticker)
+    return written, empty
+
+
+class DatasetWriter:
+    """
+    Writes tables of one schema to a Parquet or Arrow IPC file in fixed-size row groups.
+
+    Rows are held only until ``row_group_size`` of them are pending. The file
+    is written as ``<name>.partial`` and linked to its name on close(), which
+    never replaces an existing file; abort() removes the partial file. Use as
+    a context manager to abort when the export fails.
+
+    Raises:
+        FileExistsError: If the file exists or another export is writing it.
+    """
+
+    def __init__(self, path: Path, schema: pa.Schema, file_format: str, row_group_size: int):
+        self.path = path
+        self.schema = schema
+        self.file_format = file_format
+        self.row_group_size = row_group_size
+        self.rows = 0
+        self.row_groups = 0
+        self._partial = path.with_name(path.name + ".partial")
+        self._pending: list[pa.Table] = []
+        self._pending_rows = 0
+        self._closed = False
+
+        if path.exists():
+            raise FileExistsError(errno.EEXIST, "Export file exists", str(path))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Claimed exclusively, so two exports of one name never write into each other
+        os.close(os.open(self._partial, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        try:
+            if file_format == "parquet":
+                self._writer = pq.ParquetWriter(self._partial, schema)
+            else:
+                self._writer = pa.ipc.new_file(self._partial, schema)
+        except BaseException:
+            self._partial.unlink(missing_ok=True)
+            raise
+
+    def write(self, table: pa.Table) -> None:
+        """Queue ``table``, writing every row group it completes."""
+        if table.num_rows == 0:
+            return
+        self._pending.append(table)
+        self._pending_rows += table.num_rows
+        while self._pending_rows >= self.row_group_size:
+            pending = pa.concat_tables(self._pending)
+            self._write_group(pending.slice(0, self.row_group_size))
+            rest = pending.slice(self.row_group_size)
+            self._pending, self._pending_rows = [rest], rest.num_rows
+
+    def _write_group(self, table: pa.Table) -> None:
+        table = table.combine_chunks()
+        if self.file_format == "parquet":
+            self._writer.write_table(table, row_group_size=table.num_rows)
+        else:
+            self._writer.write_table(table, max_chunksize=table.num_rows)
+        self.rows += table.num_rows
+        self.row_groups += 1
+
+    def close(self) -> int:
+        """
+        Write the remaining rows and publish the file; returns its size in bytes.
+
+        Raises:
+            FileExistsError: If a file of the same name appeared while writing.
+        """
+        if self._pending_rows:
+            self._write_group(pa.concat_tables(self._pending))
+        self._pending, self._pending_rows = [], 0
+        self._writer.close()
+        self._closed = True
+        # A link fails where a rename would overwrite
+        os.link(self._partial, self.path)
+        self._partial.unlink()
+        return self.path.stat().st_size
+
+    def abort(self) -> None:
+        """Discard the partial file."""
+        try:
+            if not self._closed:
+                self._closed = True
+                self._writer.close()
+        finally:
+            self._partial.unlink(missing_ok=True)
+
+    def __enter__(self) -> DatasetWriter:
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is not None:
+            self.abort()
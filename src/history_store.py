@@ -0,0 +1,216 @@
+"""
+Memory-mapped store for cached price history.
+
+MappedHistoryCache keeps the history cache's bars in fixed-width NumPy files,
+one directory per (ticker, interval): the UTC timestamps and every column
+as ``.npy`` arrays, plus ``meta.json`` naming the current set of files, the
+period they were fetched for and when they expire. Lookups map the arrays
+read-only and wrap them in a DataFrame without parsing or copying the
+columns, so worker processes serving the same history share it through the
+OS page cache instead of each unpickling its own copy.
+
+A request for a shorter period than the stored one is served by slicing
+the mapped arrays to the same window Yahoo returns for it, counted back
+from the last bar (sessions for '1d'/'5d', calendar offsets otherwise).
+For the same reason a fetch does not replace a stored, unexpired entry
+of a wider period: it would only narrow what other workers can read.
+"""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Hashable
+from urllib.parse import quote
+
+from src.cache import TTLCache
+from src.lazy import lazy_import
+
+np = lazy_import("numpy", globals())
+pd = lazy_import("pandas", globals())
+
+# Periods from shortest to longest; 'ytd' is covered by '1y' and longer
+PERIODS = ("1d", "5d", "1mo", "3mo", "6mo", "ytd", "1y", "2y", "5y", "10y", "max")
+SESSIONS = {"1d": 1, "5d": 5}
+MONTHS = {"1mo": 1, "3mo": 3, "6mo": 6, "1y": 12, "2y": 24, "5y": 60, "10y": 120}
+
+META = "meta.json"
+
+
+def covers(stored: str, period: str) -> bool:
+    """Whether bars fetched for ``stored`` include every bar of ``period``."""
+    if stored == period or stored == "max":
+        return True
+    if stored not in PERIODS or period not in PERIODS:
+        return False
+    if period == "ytd":
+        return PERIODS.index(stored) >= PERIODS.index("1y")
+    return stored != "ytd" and PERIODS.index(stored) > PERIODS.index(period)
+
+
+def _mapped(path: Path) -> np.ndarray:
+    """Read-only view of an ``.npy`` file's mapped data (a plain ndarray, not np.memmap)."""
+    return np.load(path, mmap_mode="r").view(np.ndarray)
+
+
+def window_start(index: pd.DatetimeIndex, period: str) -> int:
+    """Position of the first bar of ``period`` in ``index``, counted back from its last bar."""
+    if period == "max" or len(index) == 0:
+        return 0
+    last = index[-1]
+    if period in SESSIONS:
+        sessions = index[index >= last.normalize() - pd.Timedelta(days=7 * SESSIONS[period])].normalize().unique()
+        cutoff = sessions[max(len(sessions) - SESSIONS[period], 0)]
+    elif period == "ytd":
+        cutoff = pd.Timestamp(year=last.year, month=1, day=1, tz=last.tz)
+    else:
+        cutoff = last - pd.DateOffset(months=MONTHS[period])
+    return int(index.searchsorted(cutoff, side="left"))
+
+
+class MappedHistoryCache(TTLCache):
+    """
+    History cache whose entries are also written as memory-mapped NumPy files.
+
+    Keys are ``(ticker, period, interval)`` and values ``yf.Ticker.history``
+    frames. Lookups try the in-process LRU first and fall back to the files;
+    frames stored are kept locally as their mapped copy, so the fetched one
+    can be freed. Frames that cannot be stored as fixed-width arrays (object
+    columns, no DatetimeIndex) stay in process only, as do frames of a
+    period a published entry already covers. Unreadable files are misses,
+    as with SharedTTLCache.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        path: str,
+        max_entries: int = 1024,
+        on_lookup: Callable[[str, bool], None] | None = None,
+    ):
+        super().__init__(name, ttl, max_entries=max_entries, on_lookup=on_lookup)
+        self.path = Path(path).expanduser()
+
+    def _directory(self, ticker: str, interval: str) -> Path:
+        return self.path / f"{quote(ticker, safe='')}@{quote(interval, safe='')}"
+
+    def _lookup(self, key: Hashable) -> tuple[bool, Any]:
+        hit, value = super()._lookup(key)
+        if hit:
+            return hit, value
+        ticker, period, interval = key
+        try:
+            opened = self._open(self._directory(ticker, interval), period)
+        except (OSError, ValueError, KeyError, TypeError):
+            return False, None
+        if opened is None:
+            return False, None
+        frame, expires = opened
+        super()._store(key, frame, expires - time.time())
+        return True, frame
+
+    def _store(self, key: Hashable, value: Any, ttl: float) -> None:
+        ticker, period, interval = key
+        try:
+            mapped = self._write(self._directory(ticker, interval), period, value, ttl)
+        except (OSError, ValueError, KeyError, TypeError):
+            mapped = None
+        super()._store(key, value if mapped is None else mapped, ttl)
+
+    @staticmethod
+    def _published(directory: Path) -> dict[str, Any] | None:
+        """The directory's meta.json, or None if nothing is published there."""
+        try:
+            return json.loads((directory / META).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+
+    def _open(self, directory: Path, period: str) -> tuple[pd.DataFrame, float] | None:
+        """The stored frame trimmed to ``period`` and its expiry time, or None."""
+        meta = self._published(directory)
+        if meta is None or meta["expires"] < time.time() or not covers(meta["period"], period):
+            return None
+        generation = meta["generation"]
+        timestamps = _mapped(directory / f"{generation}.index.npy")
+        columns = {
+            name: _mapped(directory / f"{generation}.{position}.npy")
+            for position, name in enumerate(meta["columns"])
+        }
+        # The index is rebuilt in the stored time zone (8 bytes a bar); the columns stay mapped
+        index = pd.DatetimeIndex(timestamps.view("datetime64[ns]"), name=meta["index_name"], copy=False)
+        if meta["tz"] is not None:
+            index = index.tz_localize("UTC").tz_convert(meta["tz"])
+        frame = pd.DataFrame(columns, index=index, copy=False)
+        start = window_start(index, period) if meta["period"] != period else 0
+        return frame.iloc[start:], meta["expires"]
+
+    def _write(self, directory: Path, period: str, frame: Any, ttl: float) -> pd.DataFrame | None:
+        """
+        Write ``frame`` as a new generation of files and publish it; returns its mapped copy.
+
+        Returns None, writing nothing, when an unexpired entry of a wider period is published.
+        """
+        index = frame.index if isinstance(frame, pd.DataFrame) else None
+        if not isinstance(index, pd.DatetimeIndex) or any(dtype.kind not in "biuf" for dtype in frame.dtypes):
+            return None
+        tz = None if index.tz is None else str(index.tz)
+        if tz is not None:
+            pd.Timestamp(0, tz=tz)  # raises if the name does not read back
+            index = index.tz_convert("UTC").tz_localize(None)
+
+        published = self._published(directory)
+        if (
+            published is not None
+            and published["expires"] >= time.time()
+            and published["period"] != period
+            and covers(published["period"], period)
+        ):
+            return None
+
+        directory.mkdir(parents=True, exist_ok=True)
+        # Names sort by creation time, so pruning can tell older generations from newer ones
+        generation = f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}"
+        np.save(directory / f"{generation}.index.npy", index.as_unit("ns").asi8)
+        for position in range(frame.shape[1]):
+            np.save(directory / f"{generation}.{position}.npy", np.ascontiguousarray(frame.iloc[:, position].to_numpy()))
+        meta = {
+            "generation": generation,
+            "period": period,
+            "expires": time.time() + ttl,
+            "tz": tz,
+            "index_name": frame.index.name,
+            "columns": [str(name) for name in frame.columns],
+        }
+        staged = directory / f"{generation}.meta"
+        staged.write_text(json.dumps(meta), encoding="utf-8")
+        replaced = self._published(directory)
+        os.replace(staged, directory / META)
+        if replaced is not None:
+            self._prune(directory, generation, replaced["generation"])
+
+        # Files are never rewritten, so the mapping stays valid after a newer generation replaces them
+        opened = self._open(directory, period)
+        return None if opened is None else opened[0]
+
+    def _prune(self, directory: Path, current: str, replaced: str) -> None:
+        """
+        Remove files of ``replaced`` and older generations, except ``current`` (open mappings stay readable).
+
+        Newer generations may belong to another process that has not published them yet.
+        """
+        for file in directory.iterdir():
+            generation = file.name.split(".", 1)[0]
+            if file.name != META and generation != current and generation <= replaced:
+                file.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Drop all entries, in this process and on disk, and reset statistics."""
+        super().clear()
+        if self.path.is_dir():
+            for directory in self.path.iterdir():
+                if (directory / META).exists():
+                    shutil.rmtree(directory, ignore_errors=True)
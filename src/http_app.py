@@ -0,0 +1,96 @@
+"""
+Streamable HTTP serving with uvicorn.
+
+server_options() maps the HTTPConfig tuning options (event loop, HTTP parser,
+keep-alive, backlog, connection limit, graceful drain) onto uvicorn settings;
+both serving paths wrap the app in CompressionMiddleware (src/compression.py).
+With ``HTTPConfig.workers`` above one, uvicorn pre-forks that many workers
+sharing the listening socket, and each imports ``create_app`` to build its own
+server.
+
+Any worker may receive any request, so in-memory MCP sessions cannot be
+shared: multi-worker mode always runs stateless. Cached upstream data is
+shared through a SQLite file (``CacheConfig.shared_path``). Workers read their
+configuration from the environment, so run_workers passes both settings on
+through ``YF_MCP_*`` variables.
+"""
+import importlib.util
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from starlette.applications import Starlette
+
+from src.compression import install_compression
+from src.config import config
+
+APP_FACTORY = "src.http_app:create_app"
+
+
+def create_app() -> Starlette:
+    """Streamable HTTP application of one worker process."""
+    from src.server import mcp
+
+    mcp.settings.stateless_http = config.http.stateless
+    return install_compression(mcp.streamable_http_app())
+
+
+def server_options() -> dict[str, Any]:
+    """uvicorn.run() keyword arguments from HTTPConfig."""
+    http = config.http
+    for setting, package in (("loop", "uvloop"), ("http_parser", "httptools")):
+        if getattr(http, setting) == package and importlib.util.find_spec(package) is None:
+            raise RuntimeError(
+                f"YF_MCP_HTTP__{setting.upper()}={package} needs the {package} package "
+                "(install the 'performance' extra)"
+            )
+    return {
+        "host": http.host,
+        "port": http.port,
+        "log_level": config.log_level.lower(),
+        "loop": http.loop,
+        "http": http.http_parser,
+        "timeout_keep_alive": http.keep_alive_timeout,
+        "backlog": http.backlog,
+        "limit_concurrency": http.max_connections,
+        "timeout_graceful_shutdown": http.graceful_shutdown_timeout,
+    }
+
+
+def run_server(app: Starlette) -> None:
+    """Serve ``app`` from this process, with response compression as configured."""
+    import uvicorn
+
+    uvicorn.run(install_compression(app), **server_options())
+
+
+def worker_environment(shared_path: str) -> dict[str, str]:
+    """Settings every worker must agree on."""
+    return {"YF_MCP_HTTP__STATELESS": "true", "YF_MCP_CACHE__SHARED_PATH": shared_path}
+
+
+def run_workers(app_factory: str = APP_FACTORY) -> None:
+    """Serve ``app_factory`` from ``config.http.workers`` pre-forked uvicorn workers."""
+    import uvicorn
+
+    options = server_options()
+    if not config.http.stateless:
+        print("   Stateless: forced on (sessions cannot be shared between workers)", file=sys.stderr)
+
+    temporary = None
+    shared_path = config.cache.shared_path
+    if not shared_path:
+        descriptor, shared_path = tempfile.mkstemp(prefix="yf-mcp-cache-", suffix=".sqlite3")
+        os.close(descriptor)
+        temporary = Path(shared_path)
+    print(f"   Shared cache: {shared_path}", file=sys.stderr)
+    os.environ.update(worker_environment(shared_path))
+
+    try:
+        uvicorn.run(app_factory, factory=True, workers=config.http.workers, **options)
+    finally:
+        if temporary is not None:
+            for path in (temporary, temporary.with_name(temporary.name + "-wal"), temporary.with_name(temporary.name + "-shm")):
+                path.unlink(missing_ok=True)
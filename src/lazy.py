@@ -0,0 +1,101 @@
+"""
+Deferred imports of heavy libraries.
+
+numpy, pandas and yfinance take most of the server's startup time, yet no
+tool needs them before its first call. Modules bind them with::
+
+    pd = lazy_import("pandas", globals())
+
+which returns a placeholder that imports the library on first attribute
+access and then replaces itself with the real module in every namespace it
+was bound in, so later lookups cost nothing extra.
+
+Annotations that name lazy modules must not be evaluated at definition time
+(use ``from __future__ import annotations`` or a string annotation).
+"""
+import importlib
+import sys
+import threading
+import time
+from types import ModuleType
+from typing import Any
+
+_lazy_modules: dict[str, "LazyModule"] = {}
+_registry_lock = threading.Lock()
+_warm_up_thread: threading.Thread | None = None
+
+
+class LazyModule:
+    """Placeholder for a module that is imported on first use."""
+
+    __slots__ = ("_name", "_namespaces", "_module")
+
+    def __init__(self, name: str):
+        self._name = name
+        self._namespaces: list[dict[str, Any]] = []
+        self._module: ModuleType | None = None
+
+    def load(self) -> ModuleType:
+        """Import the module (thread-safe) and rebind it wherever the placeholder is bound."""
+        module = self._module
+        if module is None:
+            # The import system serializes concurrent imports of one module
+            module = importlib.import_module(self._name)
+            with _registry_lock:
+                self._module = module
+                for namespace in self._namespaces:
+                    for key, value in list(namespace.items()):
+                        if value is self:
+                            namespace[key] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.load(), attr)
+
+    def __dir__(self) -> list[str]:
+        return dir(self.load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name: str, namespace: dict[str, Any]) -> ModuleType | LazyModule:
+    """
+    Module ``name`` for binding in ``namespace`` (the caller's ``globals()``).
+
+    Returns the module itself when it is already imported.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    with _registry_lock:
+        placeholder = _lazy_modules.setdefault(name, LazyModule(name))
+        if placeholder._module is not None:
+            return placeholder._module
+        placeholder._namespaces.append(namespace)
+    return placeholder
+
+
+def pending() -> list[str]:
+    """Names of lazily bound modules not imported yet."""
+    return [name for name, placeholder in _lazy_modules.items() if placeholder._module is None]
+
+
+def warm_up() -> dict[str, float]:
+    """Import every lazily bound module now; returns seconds spent per module."""
+    timings = {}
+    for name in pending():
+        start = time.perf_counter()
+        _lazy_modules[name].load()
+        timings[name] = time.perf_counter() - start
+    return timings
+
+
+def start_warm_up() -> threading.Thread | None:
+    """Run warm_up() once in a daemon thread; later calls return the same thread."""
+    global _warm_up_thread
+    with _registry_lock:
+        if _warm_up_thread is None and pending():
+            _warm_up_thread = threading.Thread(target=warm_up, name="import-warm-up", daemon=True)
+            _warm_up_thread.start()
+        return _warm_up_thread
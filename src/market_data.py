@@ -0,0 +1,295 @@
+"""
+Shared access to Yahoo Finance data for the server tools.
+Upstream results are cached so that tools working over the same bars
+(prices, summaries, indicators) do not refetch them.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from src.analytics.greeks import years_to_expiration
+from src.analytics.incremental import REFRESH_PERIODS, WARMUP_PERIODS, IndicatorParams, IndicatorStateStore
+from src.analytics.volatility import SmileFit, fit_smile, otm_quotes
+from src.cache import SharedTTLCache, TTLCache
+from src.config import config
+from src.history_store import MappedHistoryCache
+from src.lazy import lazy_import
+from src.telemetry import InstrumentedTicker, note_cache_lookup, registry
+
+pd = lazy_import("pandas", globals())
+
+
+def _max_entries() -> int:
+    return config.cache.max_entries if config.cache.enabled else 0
+
+
+def _cache(name: str, ttl: float) -> TTLCache:
+    """In-process cache, or one shared through SQLite by the workers of a multi-worker server."""
+    if config.cache.shared_path:
+        return SharedTTLCache(name, ttl=ttl, path=config.cache.shared_path, max_entries=_max_entries(), on_lookup=note_cache_lookup)
+    return TTLCache(name, ttl=ttl, max_entries=_max_entries(), on_lookup=note_cache_lookup)
+
+
+def _history_cache() -> TTLCache:
+    """Bars in memory-mapped files when a history store is configured, else like the other caches."""
+    if config.cache.history_store_path:
+        return MappedHistoryCache(
+            "history", ttl=config.cache.history_ttl, path=config.cache.history_store_path,
+            max_entries=_max_entries(), on_lookup=note_cache_lookup,
+        )
+    return _cache("history", config.cache.history_ttl)
+
+
+history_cache = _history_cache()
+indicator_cache = _cache("indicators", config.cache.indicator_ttl)
+quote_cache = _cache("quotes", config.cache.quote_ttl)
+smile_cache = _cache("smiles", config.cache.iv_surface_ttl)
+indicator_states = IndicatorStateStore(max_entries=config.cache.max_entries)
+
+# Upstream calls are blocking; batch fetches fan out on this pool
+fetch_executor = ThreadPoolExecutor(max_workers=config.analytics.fetch_workers, thread_name_prefix="yf-fetch")
+
+CACHES = (history_cache, indicator_cache, quote_cache, smile_cache)
+
+registry.gauge_callback(
+    "yf_mcp_cache_hit_ratio",
+    "Fraction of cache lookups served from the cache.",
+    lambda: {(cache.name,): cache.hit_ratio for cache in CACHES},
+    ("cache",),
+)
+registry.gauge_callback(
+    "yf_mcp_cache_entries",
+    "Entries currently held per cache.",
+    lambda: {(cache.name,): len(cache) for cache in CACHES},
+    ("cache",),
+)
+registry.gauge_callback(
+    "yf_mcp_fetch_queue_depth",
+    "Upstream fetches waiting for a fetch executor thread.",
+    lambda: {(): fetch_executor._work_queue.qsize()},
+)
+
+
+def _run_in_executor(loop: asyncio.AbstractEventLoop, func, *args) -> asyncio.Future:
+    """Run func on the fetch executor, keeping the caller's request trace."""
+    context = contextvars.copy_context()
+    return loop.run_in_executor(fetch_executor, functools.partial(context.run, func, *args))
+
+
+async def run_blocking(func: Callable[..., Any], *args) -> Any:
+    """Await ``func(*args)`` run on the fetch executor, off the event loop."""
+    return await _run_in_executor(asyncio.get_running_loop(), func, *args)
+
+
+class TickerNotFoundError(LookupError):
+    """Raised when Yahoo Finance does not recognize a ticker symbol."""
+
+    def __init__(self, ticker: str):
+        super().__init__(f"Ticker '{ticker}' not found")
+        self.ticker = ticker
+
+
+def fetch_history(ticker: str, period: str, interval: str, store: bool = True) -> pd.DataFrame:
+    """
+    Fetch OHLCV bars for a ticker, served from the history cache when fresh.
+
+    The returned DataFrame may be shared with other callers and must not be
+    modified in place. Bulk readers pass ``store=False`` so that bars fetched
+    for them are not kept in (and do not evict entries from) the cache.
+
+    Raises:
+        TickerNotFoundError: If the ticker is not recognized.
+    """
+    key = (ticker, period, interval)
+    cached = history_cache.get(key)
+    if cached is not None:
+        return cached
+
+    company = InstrumentedTicker(ticker)
+    if company.isin is None:
+        raise TickerNotFoundError(ticker)
+
+    hist_data = company.history(period=period, interval=interval)
+    if store and not hist_data.empty:
+        history_cache.set(key, hist_data)
+    return hist_data
+
+
+def fetch_spot_price(ticker: str) -> float | None:
+    """
+    Latest price of a ticker from its quote data, served from the quote cache
+    when fresh. Returns None if Yahoo Finance reports no price.
+    """
+    cached = quote_cache.get(ticker)
+    if cached is not None:
+        return cached
+
+    info = InstrumentedTicker(ticker).info or {}
+    price = info.get("currentPrice") or info.get("regularMarketPrice") or info.get("previousClose")
+    if price is None:
+        return None
+    price = float(price)
+    quote_cache.set(ticker, price)
+    return price
+
+
+async def fetch_batch(func: Callable[..., Any], tickers: list[str], *args) -> tuple[dict[str, Any], dict[str, Exception]]:
+    """
+    Call ``func(ticker, *args)`` for several tickers concurrently on the fetch executor.
+
+    Returns:
+        Tuple of (results by ticker, errors by ticker).
+    """
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *(_run_in_executor(loop, func, ticker, *args) for ticker in tickers),
+        return_exceptions=True,
+    )
+
+    values, errors = {}, {}
+    for ticker, result in zip(tickers, results, strict=True):
+        if isinstance(result, Exception):
+            errors[ticker] = result
+        else:
+            values[ticker] = result
+    return values, errors
+
+
+async def fetch_history_batch(
+    tickers: list[str], period: str, interval: str
+) -> tuple[dict[str, pd.DataFrame], dict[str, Exception]]:
+    """
+    Fetch history for several tickers concurrently on the fetch executor.
+
+    Returns:
+        Tuple of (frames by ticker, errors by ticker). Tickers with no data are
+        reported as errors.
+    """
+    results, errors = await fetch_batch(fetch_history, tickers, period, interval)
+
+    frames = {}
+    for ticker, result in results.items():
+        if result.empty:
+            errors[ticker] = ValueError(f"No data available for {ticker} in period {period}")
+        else:
+            frames[ticker] = result
+    return frames, errors
+
+
+def fetch_statement(ticker: str, financial_type: str) -> pd.DataFrame:
+    """
+    Financial statement of a ticker (line items by period end), e.g. 'quarterly_cashflow'.
+
+    Raises:
+        TickerNotFoundError: If the ticker is not recognized.
+    """
+    company = InstrumentedTicker(ticker)
+    if company.isin is None:
+        raise TickerNotFoundError(ticker)
+    return getattr(company, financial_type)
+
+
+def fetch_option_chains(ticker: str, max_expirations: int) -> list[tuple[str, pd.DataFrame, pd.DataFrame]]:
+    """
+    Calls and puts for the nearest unexpired option expirations of a ticker.
+
+    Returns:
+        List of (expiration date, calls, puts), ordered by expiration.
+
+    Raises:
+        TickerNotFoundError: If the ticker is not recognized.
+    """
+    company = InstrumentedTicker(ticker)
+    if company.isin is None:
+        raise TickerNotFoundError(ticker)
+
+    expirations = [date for date in company.options if years_to_expiration(date) > 0][:max_expirations]
+    chains = []
+    for date in expirations:
+        chain = company.option_chain(date)
+        chains.append((date, chain.calls, chain.puts))
+    return chains
+
+
+async def fetch_volatility_smiles(ticker: str, max_expirations: int) -> tuple[float, list[SmileFit]]:
+    """
+    Fit implied volatility smiles for the nearest option expirations.
+
+    Chains are fetched concurrently on the fetch executor. The fitted smiles
+    are cached per ticker so repeated surface queries with different grids do
+    not refetch every chain.
+
+    Returns:
+        Tuple of (underlying price, smiles ordered by expiration). Expirations
+        without usable quotes are skipped.
+
+    Raises:
+        TickerNotFoundError: If the ticker is not recognized.
+        ValueError: If the ticker has no listed options or no underlying price.
+    """
+    key = (ticker, max_expirations)
+    cached = smile_cache.get(key)
+    if cached is not None:
+        return cached
+
+    loop = asyncio.get_running_loop()
+    company = InstrumentedTicker(ticker)
+    if company.isin is None:
+        raise TickerNotFoundError(ticker)
+
+    expirations = [date for date in company.options if years_to_expiration(date) > 0][:max_expirations]
+    if not expirations:
+        raise ValueError(f"No option expirations available for {ticker}")
+
+    spot = await _run_in_executor(loop, fetch_spot_price, ticker)
+    if spot is None:
+        raise ValueError(f"No underlying price available for {ticker}")
+
+    chains = await asyncio.gather(*(_run_in_executor(loop, company.option_chain, date) for date in expirations))
+
+    smiles = []
+    for date, chain in zip(expirations, chains, strict=True):
+        log_moneyness, ivs = otm_quotes(spot, chain.calls, chain.puts)
+        smile = fit_smile(date, years_to_expiration(date), log_moneyness, ivs)
+        if smile is not None:
+            smiles.append(smile)
+
+    smile_cache.set(key, (spot, smiles))
+    return spot, smiles
+
+
+def advance_indicators(ticker: str, interval: str, params: IndicatorParams) -> tuple[int, dict]:
+    """
+    Bring the incremental indicator state for a ticker up to date.
+
+    A new state is seeded from a warm-up history window; an existing one only
+    fetches a short recent window and advances over the bars it has not seen.
+    The state is rebuilt if the recent window no longer overlaps it.
+
+    Refreshes of the same state are serialized; other tickers are not held up.
+
+    Returns:
+        Tuple of (bars not seen by an earlier refresh, latest indicator snapshot).
+
+    Raises:
+        TickerNotFoundError: If the ticker is not recognized.
+        ValueError: If no price data is available.
+    """
+    with indicator_states.lock(ticker, interval, params):
+        state = indicator_states.get(ticker, interval, params)
+        if state is not None:
+            recent = fetch_history(ticker, REFRESH_PERIODS[interval], interval)
+            if recent.empty or not state.connects_to(recent["Close"]):
+                state = None
+
+        if state is None:
+            recent = fetch_history(ticker, WARMUP_PERIODS[interval], interval)
+            if recent.empty:
+                raise ValueError(f"No data available for {ticker} at interval {interval}")
+            state = indicator_states.create(ticker, interval, params)
+
+        return state.advance(recent["Close"])
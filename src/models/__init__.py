@@ -2,7 +2,7 @@
 Pydantic models for structured Yahoo Finance MCP Server responses.
 """
 from .base import TickerValidationError, AppContext
-from .historical import HistoricalPricePoint, HistoricalPriceResponse
+from .historical import HistoricalPricePoint, HistoricalPriceResponse, PriceSummaryResponse
 from .stock_info import StockInfoResponse
 from .news import NewsArticle, NewsListResponse
 from .actions import StockActionPoint, StockActionsResponse
@@ -11,9 +11,14 @@ from .holders import HolderInfoResponse
 from .options import (
     OptionExpirationDatesResponse,
     OptionContract,
-    OptionChainResponse
+    OptionChainResponse,
+    TermStructurePoint,
+    IVSurfaceResponse
 )
 from .recommendations import RecommendationPoint, RecommendationsResponse
+from .indicators import TechnicalIndicatorsResponse, IndicatorSnapshot, IndicatorSnapshotResponse
+from .correlation import CorrelationPair, CorrelationMatrixResponse
+from .export import ExportDatasetResponse
 
 __all__ = [
     # Base
@@ -22,6 +27,7 @@ __all__ = [
     # Historical
     "HistoricalPricePoint",
     "HistoricalPriceResponse",
+    "PriceSummaryResponse",
     # Stock Info
     "StockInfoResponse",
     # News
@@ -38,7 +44,18 @@ __all__ = [
     "OptionExpirationDatesResponse",
     "OptionContract",
     "OptionChainResponse",
+    "TermStructurePoint",
+    "IVSurfaceResponse",
     # Recommendations
     "RecommendationPoint",
     "RecommendationsResponse",
+    # Indicators
+    "TechnicalIndicatorsResponse",
+    "IndicatorSnapshot",
+    "IndicatorSnapshotResponse",
+    # Correlation
+    "CorrelationPair",
+    "CorrelationMatrixResponse",
+    # Export
+    "ExportDatasetResponse",
 ]
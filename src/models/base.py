@@ -2,8 +2,31 @@
 Base models for Yahoo Finance MCP Server.
 These models enable structured outputs with automatic validation.
 """
+from typing import Any, TypeVar
+
 from pydantic import BaseModel, Field, ConfigDict
 
+M = TypeVar("M", bound=BaseModel)
+
+_setattr = object.__setattr__
+
+
+def construct(model: type[M], values: dict[str, Any]) -> M:
+    """
+    Instance of ``model`` holding ``values`` as they are, without validation.
+
+    For hot loops over data the server has already normalized. Unlike
+    model_construct(), which resolves aliases and defaults in Python and is
+    slower than validating, ``values`` must name every field by its field
+    name, and nothing else, with values of the declared types.
+    """
+    instance = model.__new__(model)
+    _setattr(instance, "__dict__", values)
+    _setattr(instance, "__pydantic_fields_set__", set(values))
+    _setattr(instance, "__pydantic_extra__", None)
+    _setattr(instance, "__pydantic_private__", None)
+    return instance
+
 
 class TickerValidationError(BaseModel):
     """Error model for ticker validation failures."""
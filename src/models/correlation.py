@@ -0,0 +1,52 @@
+"""
+Models for cross-ticker correlation data.
+"""
+from pydantic import BaseModel, Field, ConfigDict
+
+from .base import TickerValidationError
+
+
+class CorrelationPair(BaseModel):
+    """Correlation between two tickers."""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "ticker_a": "AAPL",
+                "ticker_b": "MSFT",
+                "correlation": 0.71,
+                "covariance": 0.00021
+            }
+        }
+    )
+
+    ticker_a: str = Field(..., description="First ticker symbol")
+    ticker_b: str = Field(..., description="Second ticker symbol")
+    correlation: float | None = Field(None, description="Pearson correlation of log returns")
+    covariance: float | None = Field(None, description="Covariance of per-bar log returns")
+
+
+class CorrelationMatrixResponse(BaseModel):
+    """Response containing return correlations across tickers."""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "tickers": ["AAPL", "MSFT"],
+                "period": "1y",
+                "interval": "1d",
+                "observations": 250,
+                "correlation": [[1.0, 0.71], [0.71, 1.0]],
+                "covariance": [[0.00031, 0.00021], [0.00021, 0.00028]],
+                "top_pairs": None,
+                "errors": []
+            }
+        }
+    )
+
+    tickers: list[str] = Field(..., description="Tickers included, in matrix row/column order")
+    period: str = Field(..., description="Time period queried")
+    interval: str = Field(..., description="Data interval")
+    observations: int = Field(..., description="Number of aligned log-return observations")
+    correlation: list[list[float | None]] | None = Field(None, description="Correlation matrix (omitted when top_k is set)")
+    covariance: list[list[float | None]] | None = Field(None, description="Per-bar covariance matrix of log returns (omitted when top_k is set)")
+    top_pairs: list[CorrelationPair] | None = Field(None, description="Most strongly correlated pairs by absolute correlation")
+    errors: list[TickerValidationError] = Field(default_factory=list, description="Tickers excluded from the computation")
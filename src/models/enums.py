@@ -28,3 +28,14 @@ class RecommendationType(str, Enum):
     """Types of analyst recommendations."""
     recommendations = "recommendations"
     upgrades_downgrades = "upgrades_downgrades"
+
+
+class IndicatorType(str, Enum):
+    """Technical indicators computed by get_technical_indicators."""
+    sma = "sma"
+    ema = "ema"
+    rsi = "rsi"
+    macd = "macd"
+    bollinger = "bollinger"
+    atr = "atr"
+    vwap = "vwap"
@@ -0,0 +1,37 @@
+"""
+Models for bulk dataset exports.
+"""
+from pydantic import BaseModel, Field, ConfigDict
+
+from .base import TickerValidationError
+
+
+class ExportDatasetResponse(BaseModel):
+    """Response describing a dataset written to a Parquet or Arrow IPC file."""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "dataset": "history",
+                "file_format": "parquet",
+                "path": "/home/user/.local/share/yahoo-finance-mcp/exports/history-20251024T200000Z.parquet",
+                "uri": "file:///home/user/.local/share/yahoo-finance-mcp/exports/history-20251024T200000Z.parquet",
+                "tickers": ["AAPL", "MSFT"],
+                "rows": 5030,
+                "row_groups": 1,
+                "size_bytes": 182344,
+                "columns": ["ticker", "date", "open", "high", "low", "close", "adj_close", "volume", "dividends", "stock_splits"],
+                "errors": []
+            }
+        }
+    )
+
+    dataset: str = Field(..., description="Exported dataset: 'history', 'financials' or 'options'")
+    file_format: str = Field(..., description="File format: 'parquet' or 'arrow' (Arrow IPC file)")
+    path: str = Field(..., description="Absolute path of the written file")
+    uri: str = Field(..., description="file:// URI of the written file")
+    tickers: list[str] = Field(..., description="Tickers with data in the file")
+    rows: int = Field(..., description="Number of rows written")
+    row_groups: int = Field(..., description="Number of Parquet row groups / Arrow record batches")
+    size_bytes: int = Field(..., description="File size in bytes")
+    columns: list[str] = Field(..., description="Column names of the file")
+    errors: list[TickerValidationError] = Field(default_factory=list, description="Tickers left out of the export")
@@ -1,7 +1,12 @@
 """
 Models for historical stock price data.
 """
-from pydantic import BaseModel, Field, ConfigDict
+from collections.abc import Sequence
+from typing import Annotated, Any
+
+from pydantic import BaseModel, Field, ConfigDict, GetCoreSchemaHandler, GetJsonSchemaHandler, SerializationInfo, SerializerFunctionWrapHandler
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import core_schema
 
 
 class HistoricalPricePoint(BaseModel):
@@ -30,6 +35,42 @@ class HistoricalPricePoint(BaseModel):
     adj_close: float | None = Field(None, alias="Adj Close", description="Adjusted closing price")
 
 
+class PricePoints(Sequence):
+    """
+    Read-only sequence of HistoricalPricePoint other than a list (src.series.PriceSeries).
+
+    As a field type, lists validate and serialize as ``list[HistoricalPricePoint]``
+    does and a PricePoints passes validation as is. It dumps to a list of
+    dicts in Python mode; in JSON mode its points are written while it is
+    iterated, so they never exist all at once.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        points = handler.generate_schema(list[HistoricalPricePoint])
+
+        def serialize(value: Sequence[HistoricalPricePoint], nxt: SerializerFunctionWrapHandler, info: SerializationInfo) -> Any:
+            if not isinstance(value, PricePoints):
+                return nxt(value)
+            if info.mode_is_json():
+                return iter(value)
+            return nxt(list(value))
+
+        return core_schema.json_or_python_schema(
+            json_schema=points,
+            python_schema=core_schema.union_schema([core_schema.is_instance_schema(cls), points]),
+            serialization=core_schema.wrap_serializer_function_ser_schema(
+                serialize, schema=points, info_arg=True, return_schema=core_schema.any_schema()
+            ),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler) -> JsonSchemaValue:
+        # An array of points in both modes, not the untyped serializer output
+        return handler(schema["json_schema"])
+
+
 class HistoricalPriceResponse(BaseModel):
     """Response containing historical price data."""
     model_config = ConfigDict(
@@ -47,5 +88,44 @@ class HistoricalPriceResponse(BaseModel):
     ticker: str = Field(..., description="Ticker symbol")
     period: str = Field(..., description="Time period queried")
     interval: str = Field(..., description="Data interval")
-    data_points: list[HistoricalPricePoint] = Field(..., description="Historical price data points")
+    data_points: Annotated[Sequence[HistoricalPricePoint], PricePoints] = Field(..., description="Historical price data points")
     count: int = Field(..., description="Number of data points returned")
+
+
+class PriceSummaryResponse(BaseModel):
+    """Aggregate statistics over a historical price window."""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "ticker": "AAPL",
+                "period": "1y",
+                "interval": "1d",
+                "start_date": "2024-10-25 00:00:00-04:00",
+                "end_date": "2025-10-24 00:00:00-04:00",
+                "bars": 251,
+                "first_close": 231.41,
+                "last_close": 262.82,
+                "period_return": 0.1357,
+                "high": 264.38,
+                "low": 169.21,
+                "average_volume": 54000000.0,
+                "realized_volatility": 0.3215,
+                "max_drawdown": -0.3336
+            }
+        }
+    )
+
+    ticker: str = Field(..., description="Ticker symbol")
+    period: str = Field(..., description="Time period queried")
+    interval: str = Field(..., description="Data interval")
+    start_date: str = Field(..., description="Timestamp of the first bar")
+    end_date: str = Field(..., description="Timestamp of the last bar")
+    bars: int = Field(..., description="Number of bars summarized")
+    first_close: float | None = Field(None, description="Closing price of the first bar")
+    last_close: float | None = Field(None, description="Closing price of the last bar")
+    period_return: float | None = Field(None, description="Simple return over the window (0.05 = +5%)")
+    high: float | None = Field(None, description="Highest price in the window")
+    low: float | None = Field(None, description="Lowest price in the window")
+    average_volume: float | None = Field(None, description="Average volume per bar")
+    realized_volatility: float | None = Field(None, description="Annualized standard deviation of log returns")
+    max_drawdown: float | None = Field(None, description="Largest peak-to-trough decline of the close (-0.2 = -20%)")
@@ -0,0 +1,85 @@
+"""
+Models for technical indicator data.
+"""
+from pydantic import BaseModel, Field, ConfigDict
+
+from .base import TickerValidationError
+
+
+class TechnicalIndicatorsResponse(BaseModel):
+    """Response containing technical indicator series."""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "ticker": "AAPL",
+                "period": "1y",
+                "interval": "1d",
+                "dates": ["2025-10-23", "2025-10-24"],
+                "indicators": {
+                    "sma_20": [252.1, 253.4],
+                    "rsi_14": [61.2, 64.8]
+                },
+                "count": 2
+            }
+        }
+    )
+
+    ticker: str = Field(..., description="Ticker symbol")
+    period: str = Field(..., description="Time period the indicators were computed over")
+    interval: str = Field(..., description="Data interval")
+    dates: list[str] = Field(..., description="Bar timestamps aligned with every indicator series")
+    indicators: dict[str, list[float | None]] = Field(
+        ...,
+        description="Indicator series keyed by name (e.g. 'sma_20', 'macd_signal'); None during warm-up"
+    )
+    count: int = Field(..., description="Number of bars returned per series")
+
+
+class IndicatorSnapshot(BaseModel):
+    """Latest indicator values for one ticker."""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "ticker": "AAPL",
+                "timestamp": "2025-10-24 00:00:00-04:00",
+                "close": 262.82,
+                "ema": 255.13,
+                "rsi": 64.8,
+                "volatility": 0.2411,
+                "new_bars": 1
+            }
+        }
+    )
+
+    ticker: str = Field(..., description="Ticker symbol")
+    timestamp: str | None = Field(None, description="Timestamp of the latest bar")
+    close: float | None = Field(None, description="Close of the latest bar")
+    ema: float | None = Field(None, description="Exponential moving average of the close")
+    rsi: float | None = Field(None, description="Relative Strength Index (Wilder)")
+    volatility: float | None = Field(None, description="Annualized rolling volatility of log returns")
+    new_bars: int = Field(..., description="Bars not seen by an earlier refresh")
+
+
+class IndicatorSnapshotResponse(BaseModel):
+    """Response containing latest indicator values for a watchlist."""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "interval": "1d",
+                "ema_span": 20,
+                "rsi_period": 14,
+                "volatility_window": 20,
+                "snapshots": [],
+                "errors": [],
+                "count": 2
+            }
+        }
+    )
+
+    interval: str = Field(..., description="Data interval")
+    ema_span: int = Field(..., description="EMA span")
+    rsi_period: int = Field(..., description="RSI period")
+    volatility_window: int = Field(..., description="Rolling volatility window in bars")
+    snapshots: list[IndicatorSnapshot] = Field(..., description="Latest values per ticker")
+    errors: list[TickerValidationError] = Field(default_factory=list, description="Tickers that could not be refreshed")
+    count: int = Field(..., description="Number of snapshots returned")
@@ -45,6 +45,13 @@ class OptionContract(BaseModel):
     implied_volatility: float | None = Field(None, description="Implied volatility")
     in_the_money: bool | None = Field(None, description="Whether option is in the money")
 
+    # Black-Scholes Greeks (only populated when requested)
+    delta: float | None = Field(None, description="Change in option price per $1 move in the underlying")
+    gamma: float | None = Field(None, description="Change in delta per $1 move in the underlying")
+    theta: float | None = Field(None, description="Change in option price per calendar day")
+    vega: float | None = Field(None, description="Change in option price per 1 point of implied volatility")
+    rho: float | None = Field(None, description="Change in option price per 1% move in the risk-free rate")
+
 
 class OptionChainResponse(BaseModel):
     """Response containing option chain data."""
@@ -65,4 +72,50 @@ class OptionChainResponse(BaseModel):
     option_type: str = Field(..., description="Option type (calls or puts)")
     contracts: list[OptionContract] = Field(..., description="List of option contracts")
     count: int = Field(..., description="Number of contracts")
+    underlying_price: float | None = Field(None, description="Underlying price used for Greeks and moneyness filtering")
+
+
+
+class TermStructurePoint(BaseModel):
+    """At-the-money implied volatility for one expiration."""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "expiration_date": "2025-11-21",
+                "tenor_days": 28.3,
+                "atm_iv": 0.241,
+                "contracts": 64
+            }
+        }
+    )
+
+    expiration_date: str = Field(..., description="Expiration date")
+    tenor_days: float = Field(..., description="Calendar days until expiration")
+    atm_iv: float = Field(..., description="Fitted at-the-money implied volatility")
+    contracts: int = Field(..., description="Out-of-the-money contracts used in the smile fit")
 
+
+class IVSurfaceResponse(BaseModel):
+    """Response containing an interpolated implied volatility surface."""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "ticker": "AAPL",
+                "underlying_price": 262.82,
+                "moneyness": [0.9, 1.0, 1.1],
+                "tenor_days": [30, 90],
+                "implied_volatility": [[0.29, 0.24, 0.22], [0.28, 0.25, 0.23]],
+                "term_structure": []
+            }
+        }
+    )
+
+    ticker: str = Field(..., description="Ticker symbol")
+    underlying_price: float = Field(..., description="Underlying price used for moneyness")
+    moneyness: list[float] = Field(..., description="Strike / underlying price grid (columns)")
+    tenor_days: list[float] = Field(..., description="Tenor grid in calendar days (rows)")
+    implied_volatility: list[list[float | None]] = Field(
+        ...,
+        description="Implied volatility per tenor (row) and moneyness (column)"
+    )
+    term_structure: list[TermStructurePoint] = Field(..., description="Fitted ATM volatility per listed expiration")
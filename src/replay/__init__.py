@@ -0,0 +1,27 @@
+"""
+Record/replay of Yahoo Finance HTTP traffic for offline load testing.
+
+Record real exchanges once (``YF_MCP_UPSTREAM__MODE=record`` or
+``python -m src.replay.record``), serve them with ``python -m src.replay.standin``
+and point the server at the stand-in with ``YF_MCP_UPSTREAM__MODE=replay``.
+"""
+from .archive import Archive, ArchiveWriter, Exchange, canonical_body, read_exchanges, request_key
+from .session import RecordingSession, ReplaySession, full_url, install_session, replay_url, session_from_config
+from .standin import StandIn, make_server
+
+__all__ = [
+    "Archive",
+    "ArchiveWriter",
+    "Exchange",
+    "canonical_body",
+    "read_exchanges",
+    "request_key",
+    "RecordingSession",
+    "ReplaySession",
+    "full_url",
+    "install_session",
+    "replay_url",
+    "session_from_config",
+    "StandIn",
+    "make_server",
+]
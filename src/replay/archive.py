@@ -0,0 +1,142 @@
+"""
+Archive of recorded Yahoo Finance HTTP exchanges.
+
+An archive is a JSON-lines file (gzip-compressed when the name ends in
+``.gz``) with one request/response pair per line. Requests are matched on
+method, host, path, query and body, ignoring parameters that change from
+one session or day to the next (the crumb and absolute time ranges).
+"""
+import base64
+import gzip
+import itertools
+import json
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import IO, Iterable, Iterator
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+# Query parameters that differ between otherwise identical requests
+VOLATILE_PARAMS = frozenset({"crumb", "period1", "period2", "_"})
+
+
+def request_key(method: str, url: str, body: str = "") -> str:
+    """Canonical form of a request used to match it against recorded exchanges."""
+    parts = urlsplit(url)
+    query = sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True) if name not in VOLATILE_PARAMS)
+    key = f"{method.upper()} {parts.hostname}{parts.path or '/'}"
+    if query:
+        key += "?" + urlencode(query)
+    if body:
+        key += " " + body
+    return key
+
+
+def canonical_body(body: bytes | str | None) -> str:
+    """JSON request bodies with sorted keys, so key order does not affect matching."""
+    if not body:
+        return ""
+    text = body.decode("utf-8", "replace") if isinstance(body, bytes) else body
+    try:
+        return json.dumps(json.loads(text), sort_keys=True, separators=(",", ":"))
+    except ValueError:
+        return text
+
+
+@dataclass
+class Exchange:
+    """One recorded request and the response Yahoo returned."""
+    method: str
+    url: str
+    status: int
+    content_type: str
+    body: str
+    request_body: str = ""
+    binary: bool = False  # body is base64-encoded
+
+    @property
+    def key(self) -> str:
+        return request_key(self.method, self.url, self.request_body)
+
+    @property
+    def content(self) -> bytes:
+        return base64.b64decode(self.body) if self.binary else self.body.encode("utf-8")
+
+    @classmethod
+    def create(cls, method: str, url: str, status: int, content_type: str, content: bytes, request_body: str = "") -> "Exchange":
+        try:
+            return cls(method.upper(), url, status, content_type, content.decode("utf-8"), request_body)
+        except UnicodeDecodeError:
+            return cls(method.upper(), url, status, content_type, base64.b64encode(content).decode("ascii"), request_body, True)
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def read_exchanges(path: str | Path) -> Iterator[Exchange]:
+    with _open(Path(path), "r") as handle:
+        for line in handle:
+            if line.strip():
+                yield Exchange(**json.loads(line))
+
+
+class Archive:
+    """
+    Recorded exchanges indexed by request key.
+
+    A request recorded several times is answered with its responses in
+    turn, so paginated or repeated calls replay in the order they happened.
+    """
+
+    def __init__(self, exchanges: Iterable[Exchange] = ()):
+        self._responses: dict[str, list[Exchange]] = {}
+        self._cursors: dict[str, Iterator[Exchange]] = {}
+        self._lock = threading.Lock()
+        for exchange in exchanges:
+            self.add(exchange)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Archive":
+        return cls(read_exchanges(path))
+
+    def add(self, exchange: Exchange) -> None:
+        with self._lock:
+            self._responses.setdefault(exchange.key, []).append(exchange)
+            self._cursors.pop(exchange.key, None)
+
+    def lookup(self, method: str, url: str, body: str = "") -> Exchange | None:
+        key = request_key(method, url, body)
+        with self._lock:
+            if key not in self._responses:
+                return None
+            if key not in self._cursors:
+                self._cursors[key] = itertools.cycle(self._responses[key])
+            return next(self._cursors[key])
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self._responses.values())
+
+    def __iter__(self) -> Iterator[Exchange]:
+        for responses in self._responses.values():
+            yield from responses
+
+
+class ArchiveWriter:
+    """Appends exchanges to an archive file as they are recorded."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.count = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def write(self, exchange: Exchange) -> None:
+        line = json.dumps(asdict(exchange)) + "\n"
+        with self._lock:
+            # gzip members can be appended; readers see one continuous stream
+            with _open(self.path, "a") as handle:
+                handle.write(line)
+            self.count += 1
@@ -0,0 +1,79 @@
+"""
+Record the Yahoo Finance traffic of a representative set of tool calls.
+
+Runs every tool once per ticker against live Yahoo Finance with a
+RecordingSession installed, so the resulting archive can be replayed by the
+stand-in. Running the server with ``YF_MCP_UPSTREAM__MODE=record`` records
+whatever real clients ask for instead.
+
+Usage:
+    python -m src.replay.record AAPL MSFT SPY [--archive fixtures/yahoo.jsonl.gz]
+"""
+import argparse
+import asyncio
+from typing import Any
+
+from src.config import config
+
+from .archive import ArchiveWriter
+from .session import RecordingSession, install_session
+
+FINANCIAL_TYPES = ("income_stmt", "quarterly_income_stmt", "balance_sheet", "quarterly_balance_sheet", "cashflow", "quarterly_cashflow")
+HOLDER_TYPES = ("major_holders", "institutional_holders", "mutualfund_holders", "insider_transactions", "insider_purchases", "insider_roster_holders")
+
+
+def ticker_calls(ticker: str) -> list[tuple[str, dict[str, Any]]]:
+    return [
+        ("get_stock_info", {"ticker": ticker}),
+        ("get_historical_stock_prices", {"ticker": ticker, "period": "1mo", "interval": "1d"}),
+        ("get_historical_stock_prices", {"ticker": ticker, "period": "1y", "interval": "1d"}),
+        ("get_historical_stock_prices", {"ticker": ticker, "period": "5d", "interval": "1h"}),
+        ("get_yahoo_finance_news", {"ticker": ticker}),
+        ("get_stock_actions", {"ticker": ticker}),
+        *[("get_financial_statement", {"ticker": ticker, "financial_type": kind}) for kind in FINANCIAL_TYPES],
+        *[("get_holder_info", {"ticker": ticker, "holder_type": kind}) for kind in HOLDER_TYPES],
+        ("get_recommendations", {"ticker": ticker, "recommendation_type": "recommendations"}),
+        ("get_recommendations", {"ticker": ticker, "recommendation_type": "upgrades_downgrades"}),
+        ("get_price_summary", {"ticker": ticker}),
+        ("get_technical_indicators", {"ticker": ticker, "indicators": ["sma", "rsi", "macd"]}),
+        ("get_iv_surface", {"ticker": ticker, "max_expirations": 4}),
+    ]
+
+
+async def run(tickers: list[str], expirations: int) -> None:
+    from src.server import mcp
+
+    async def call(name: str, arguments: dict[str, Any]) -> Any:
+        result = await mcp._tool_manager.get_tool(name).run(arguments, context=None, convert_result=False)
+        status = "error" if getattr(result, "error", None) else "ok"
+        print(f"  {name} {arguments} -> {status}")
+        return result
+
+    for ticker in tickers:
+        print(f"Recording {ticker}")
+        for name, arguments in ticker_calls(ticker):
+            await call(name, arguments)
+        dates = await call("get_option_expiration_dates", {"ticker": ticker})
+        for date in (getattr(dates, "expiration_dates", None) or [])[:expirations]:
+            for option_type in ("calls", "puts"):
+                await call("get_option_chain", {"ticker": ticker, "expiration_date": date, "option_type": option_type})
+    if len(tickers) > 1:
+        await call("get_correlation_matrix", {"tickers": tickers})
+        await call("get_indicator_snapshot", {"tickers": tickers})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("tickers", nargs="+", help="Ticker symbols to record")
+    parser.add_argument("--archive", default=config.upstream.archive_path, help="Archive file to append to")
+    parser.add_argument("--expirations", type=int, default=2, help="Option chains recorded per ticker")
+    args = parser.parse_args()
+
+    writer = ArchiveWriter(args.archive)
+    install_session(RecordingSession(writer))
+    asyncio.run(run(args.tickers, args.expirations))
+    print(f"Recorded {writer.count} exchanges to {writer.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+curl_cffi sessions that record yfinance traffic or redirect it to a stand-in.
+
+yfinance sends every request through one shared curl_cffi session, which can
+be replaced with ``YfData(session=...)``. The sessions here keep yfinance's
+browser impersonation and only change where requests go or what is kept.
+"""
+import json
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from curl_cffi import requests
+
+from src.config import UpstreamConfig
+
+from .archive import ArchiveWriter, Exchange, canonical_body
+
+
+def full_url(url: str, params: Any = None) -> str:
+    """URL with the request parameters merged into its query string, without the crumb."""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query += list(params.items()) if isinstance(params, dict) else list(params)
+    query = [(name, str(value)) for name, value in query if name != "crumb" and value is not None]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+
+
+def replay_url(base_url: str, url: str) -> str:
+    """Address of ``url`` on the stand-in: ``<base>/<original host><path>?<query>``."""
+    parts = urlsplit(url)
+    base = urlsplit(base_url.rstrip("/"))
+    return urlunsplit((base.scheme, base.netloc, f"{base.path}/{parts.hostname}{parts.path or '/'}", parts.query, ""))
+
+
+def _request_body(kwargs: dict[str, Any]) -> str:
+    if kwargs.get("json") is not None:
+        return canonical_body(json.dumps(kwargs["json"]))
+    return canonical_body(kwargs.get("data"))
+
+
+class RecordingSession(requests.Session):
+    """Talks to Yahoo as usual and archives every completed exchange."""
+
+    def __init__(self, writer: ArchiveWriter, **kwargs):
+        kwargs.setdefault("impersonate", "chrome")
+        super().__init__(**kwargs)
+        self.writer = writer
+
+    def request(self, method: str, url: str, *args, **kwargs):
+        response = super().request(method, url, *args, **kwargs)
+        self.writer.write(Exchange.create(
+            method,
+            full_url(url, kwargs.get("params")),
+            response.status_code,
+            response.headers.get("content-type", ""),
+            response.content,
+            _request_body(kwargs),
+        ))
+        return response
+
+
+class ReplaySession(requests.Session):
+    """Sends every request to a stand-in server instead of Yahoo."""
+
+    def __init__(self, base_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = base_url
+
+    def request(self, method: str, url: str, *args, **kwargs):
+        return super().request(method, replay_url(self.base_url, url), *args, **kwargs)
+
+
+def session_from_config(settings: UpstreamConfig) -> requests.Session | None:
+    """The session the upstream configuration calls for, or None to keep yfinance's own."""
+    if settings.mode == "record":
+        return RecordingSession(ArchiveWriter(settings.archive_path))
+    if settings.mode == "replay":
+        return ReplaySession(settings.replay_url)
+    return None
+
+
+def install_session(session: requests.Session) -> None:
+    """Make yfinance send all requests through ``session``."""
+    from yfinance.data import YfData
+
+    YfData(session=session)
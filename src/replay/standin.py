@@ -0,0 +1,166 @@
+"""
+Local HTTP stand-in for Yahoo Finance that replays an exchange archive.
+
+Requests arrive as ``/<yahoo host><path>?<query>`` (see ReplaySession) and
+are answered from the archive after an optional injected delay. A fraction
+of requests can be failed on purpose to exercise error handling under load.
+The cookie and crumb handshake yfinance performs first is answered with
+placeholders when the archive does not contain it.
+
+Usage:
+    python -m src.replay.standin --archive fixtures/yahoo.jsonl.gz [--port 8765]
+        [--latency-ms 80 --jitter-ms 40] [--error-rate 0.02 --error-status 500 429]
+
+Counters are served as JSON at ``/__standin__/stats``.
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from .archive import Archive, canonical_body
+
+STATS_PATH = "/__standin__/stats"
+
+
+class StandIn:
+    """Replay policy: archive lookup, latency and error injection."""
+
+    def __init__(
+        self,
+        archive: Archive,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        error_statuses: tuple[int, ...] = (500,),
+        miss_status: int = 404,
+        seed: int | None = None,
+    ):
+        self.archive = archive
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_statuses = error_statuses
+        self.miss_status = miss_status
+        self.stats: Counter[str] = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+
+    def delay(self) -> float:
+        """Seconds to hold the next response."""
+        with self._lock:
+            jitter = self._random.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0
+        return (self.latency_ms + jitter) / 1000.0
+
+    def respond(self, method: str, target: str, body: bytes = b"") -> tuple[int, str, bytes]:
+        """Status, content type and body for a request to the stand-in."""
+        parts = urlsplit(target)
+        host, _, path = parts.path.lstrip("/").partition("/")
+        url = f"https://{host}/{path}" + (f"?{parts.query}" if parts.query else "")
+
+        with self._lock:
+            self.stats["requests"] += 1
+            fail = self.error_rate > 0 and self._random.random() < self.error_rate
+            status = self._random.choice(self.error_statuses) if fail else None
+        if fail:
+            self._count("injected_errors")
+            text = "Too Many Requests\r\n" if status == 429 else json.dumps({"error": "injected failure"})
+            return status, "text/plain" if status == 429 else "application/json", text.encode()
+
+        exchange = self.archive.lookup(method, url, canonical_body(body))
+        if exchange is not None:
+            self._count("hits")
+            return exchange.status, exchange.content_type, exchange.content
+
+        if host == "fc.yahoo.com":
+            self._count("synthetic")
+            return 200, "text/html", b""
+        if path == "v1/test/getcrumb":
+            self._count("synthetic")
+            return 200, "text/plain", b"replay-crumb"
+
+        self._count("misses")
+        error = {"finance": {"result": None, "error": {"code": "Not Found", "description": f"No recorded exchange for {method} {url}"}}}
+        return self.miss_status, "application/json", json.dumps(error).encode()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def start(self, host: str = "127.0.0.1", port: int = 0, verbose: bool = False) -> str:
+        """Serve in a background thread and return the base URL."""
+        self._server = make_server(self, host, port, verbose)
+        threading.Thread(target=self._server.serve_forever, name="yahoo-standin", daemon=True).start()
+        return f"http://{host}:{self._server.server_address[1]}"
+
+    def shutdown(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+def make_server(standin: StandIn, host: str, port: int, verbose: bool = False) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _handle(self) -> None:
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            if self.path == STATS_PATH:
+                status, content_type, content = 200, "application/json", json.dumps(dict(standin.stats)).encode()
+            else:
+                time.sleep(standin.delay())
+                status, content_type, content = standin.respond(self.command, self.path, body)
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        do_GET = do_POST = _handle
+
+        def log_message(self, format: str, *args) -> None:
+            if verbose:
+                super().log_message(format, *args)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--archive", required=True, help="Exchange archive recorded with YF_MCP_UPSTREAM__MODE=record")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Fixed delay added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra uniform random delay, 0 to this value")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests failed on purpose")
+    parser.add_argument("--error-status", type=int, nargs="+", default=[500], help="Statuses used for injected failures")
+    parser.add_argument("--miss-status", type=int, default=404, help="Status for requests missing from the archive")
+    parser.add_argument("--seed", type=int, help="Seed for jitter and error injection")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    archive = Archive.load(args.archive)
+    standin = StandIn(
+        archive, args.latency_ms, args.jitter_ms, args.error_rate, tuple(args.error_status), args.miss_status, args.seed
+    )
+    server = make_server(standin, args.host, args.port, args.verbose)
+    print(f"Replaying {len(archive)} exchanges at http://{args.host}:{args.port} (stats: {STATS_PATH})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(json.dumps(dict(standin.stats)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+On-disk cache of the tool definitions served by ``tools/list``.
+
+FastMCP builds a Pydantic argument model, an output model and both JSON
+schemas for every ``@mcp.tool`` at import time, which is most of the cost of
+importing src.server. With the cache installed, tools whose definitions are
+cached are registered without building anything: ``tools/list`` answers from
+the file, and a tool's models are built on its first call.
+
+The cache is keyed by a fingerprint of the package sources and of the mcp and
+Pydantic versions; when it does not match, every tool is built as usual and the
+file is rewritten on the next ``tools/list``.
+
+Usage:
+    python -m src.schema_cache build    # write the cache for the current sources
+    python -m src.schema_cache check    # exit 1 when the cache is missing or stale
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any, Callable
+
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.tools import Tool, ToolManager
+from mcp.types import Tool as MCPTool
+
+PACKAGE_DIR = Path(__file__).parent
+SCHEMA_DEPENDENCIES = ("mcp", "pydantic", "pydantic-core")
+
+
+def source_fingerprint(package_dir: Path = PACKAGE_DIR) -> str:
+    """Hash of every source file in the package and of the schema-generating libraries."""
+    digest = hashlib.sha256()
+    digest.update(f"python {sys.version_info.major}.{sys.version_info.minor}\n".encode())
+    for dependency in SCHEMA_DEPENDENCIES:
+        digest.update(f"{dependency} {version(dependency)}\n".encode())
+    for path in sorted(package_dir.rglob("*.py")):
+        digest.update(path.relative_to(package_dir).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def tool_definition(tool: Tool) -> MCPTool:
+    """The ``tools/list`` entry of a registered tool (as FastMCP.list_tools builds it)."""
+    return MCPTool(
+        name=tool.name,
+        title=tool.title,
+        description=tool.description,
+        inputSchema=tool.parameters,
+        outputSchema=tool.output_schema,
+        annotations=tool.annotations,
+        icons=tool.icons,
+        _meta=tool.meta,
+    )
+
+
+class SchemaCache:
+    """JSON file of tool definitions stamped with a source fingerprint."""
+
+    def __init__(self, path: str | Path, fingerprint: str | None = None):
+        self.path = Path(path).expanduser()
+        self.fingerprint = fingerprint or source_fingerprint()
+
+    def read(self) -> dict[str, Any] | None:
+        """The file's contents, or None when it is missing or unreadable."""
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def load(self) -> dict[str, MCPTool] | None:
+        """Cached definitions by tool name, or None when the cache is missing or stale."""
+        payload = self.read()
+        if not payload or payload.get("fingerprint") != self.fingerprint:
+            return None
+        try:
+            return {entry["name"]: MCPTool.model_validate(entry) for entry in payload["tools"]}
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def save(self, definitions: list[MCPTool]) -> bool:
+        """Write the definitions atomically; returns False when the location is not writable."""
+        payload = {
+            "fingerprint": self.fingerprint,
+            "tools": [definition.model_dump(mode="json", by_alias=True, exclude_none=True) for definition in definitions],
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            temporary.write_text(json.dumps(payload, indent=1) + "\n", encoding="utf-8")
+            os.replace(temporary, self.path)
+        except OSError:
+            return False
+        return True
+
+
+class CachedToolManager(ToolManager):
+    """
+    ToolManager that defers building tools whose definitions are cached.
+
+    ``get_tool`` builds a deferred tool on first use, so direct calls through
+    the manager behave as with the stock ToolManager.
+    """
+
+    def __init__(self, cache: SchemaCache, warn_on_duplicate_tools: bool = True):
+        super().__init__(warn_on_duplicate_tools=warn_on_duplicate_tools)
+        self.cache = cache
+        self.cached = cache.load() or {}
+        self._pending: dict[str, tuple[Callable[..., Any], dict[str, Any]]] = {}
+        self._order: list[str] = []
+        self._lock = threading.Lock()
+        self._saved = False
+
+    def add_tool(self, fn: Callable[..., Any], name: str | None = None, **kwargs: Any) -> Tool | None:
+        """Register a tool; returns None when building it is deferred."""
+        tool_name = name or fn.__name__
+        if tool_name in self._pending or tool_name in self._tools:
+            return super().add_tool(fn, name=name, **kwargs)
+        self._order.append(tool_name)
+        if tool_name in self.cached:
+            self._pending[tool_name] = (fn, {"name": name, **kwargs})
+            return None
+        return super().add_tool(fn, name=name, **kwargs)
+
+    def get_tool(self, name: str) -> Tool | None:
+        if name in self._pending:
+            with self._lock:
+                if name in self._pending:
+                    fn, kwargs = self._pending[name]
+                    super().add_tool(fn, **kwargs)
+                    del self._pending[name]
+        return super().get_tool(name)
+
+    def list_tools(self) -> list[Tool]:
+        """Every tool, building the deferred ones."""
+        return [self.get_tool(name) for name in self._order if name in self._pending or name in self._tools]
+
+    def remove_tool(self, name: str) -> None:
+        if name in self._pending:
+            del self._pending[name]
+        else:
+            super().remove_tool(name)
+        self._order.remove(name)
+
+    def definitions(self) -> list[MCPTool]:
+        """``tools/list`` entries, from the cache where possible; refreshes a stale cache once."""
+        definitions = [
+            self.cached[name] if name in self._pending else tool_definition(self._tools[name])
+            for name in self._order
+            if name in self._pending or name in self._tools
+        ]
+        if not self._saved and set(self.cached) != set(self._order):
+            self._saved = True
+            self.cache.save(definitions)
+        return definitions
+
+
+def install_schema_cache(server: FastMCP, path: str | Path) -> CachedToolManager:
+    """
+    Serve ``server``'s tool definitions from the cache at ``path``.
+
+    Must run before any tool is registered.
+    """
+    if server._tool_manager.list_tools():
+        raise RuntimeError("The schema cache must be installed before tools are registered")
+    manager = CachedToolManager(SchemaCache(path), warn_on_duplicate_tools=server.settings.warn_on_duplicate_tools)
+    server._tool_manager = manager
+
+    async def list_tools() -> list[MCPTool]:
+        return manager.definitions()
+
+    # Replaces FastMCP.list_tools both as a method and as the tools/list handler
+    server.list_tools = list_tools
+    server._mcp_server.list_tools()(list_tools)
+    return manager
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=("build", "check"))
+    parser.add_argument("--path", help="Cache file (default: YF_MCP_CACHE__SCHEMA_PATH)")
+    args = parser.parse_args()
+
+    from src.config import config
+    from src.server import mcp
+
+    path = args.path or config.cache.schema_path
+    if not path:
+        sys.exit("No cache file: pass --path or set YF_MCP_CACHE__SCHEMA_PATH")
+    cache = SchemaCache(path)
+    tools = mcp._tool_manager.list_tools()
+    current = [tool_definition(tool).model_dump(mode="json", by_alias=True, exclude_none=True) for tool in tools]
+
+    if args.command == "build":
+        if not cache.save([tool_definition(tool) for tool in tools]):
+            sys.exit(f"Could not write {cache.path}")
+        print(f"Wrote {len(tools)} tool definitions to {cache.path}")
+        return
+
+    payload = cache.read()
+    if payload is None:
+        sys.exit(f"{cache.path} is missing; run `python -m src.schema_cache build`")
+    if payload.get("fingerprint") != cache.fingerprint or payload.get("tools") != current:
+        sys.exit(f"{cache.path} is stale; run `python -m src.schema_cache build`")
+    print(f"{cache.path} is up to date ({len(current)} tools)")
+
+
+if __name__ == "__main__":
+    main()
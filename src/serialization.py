@@ -0,0 +1,38 @@
+"""
+Fast conversion of structured tool results into MCP content.
+
+FastMCP serializes a model result twice: to indented JSON text for the
+unstructured content (pydantic_core.to_json) and to a JSON-compatible dict
+for ``structuredContent`` (model_dump(mode="json")), which builds every
+nested value in Python. convert_result() serializes the model once in
+pydantic-core (model_dump_json) and parses those bytes back with orjson, or
+with pydantic-core's parser when orjson is not installed (the 'performance'
+extra), so both forms come from the same JSON.
+
+Values are the same as model_dump(mode="json"): NaN and ±inf become null,
+datetimes and dates ISO 8601 strings. The text is compact instead of
+indented. Results that are not models go through FastMCP's own conversion.
+"""
+from typing import Any
+
+import pydantic_core
+from mcp.server.fastmcp.utilities.func_metadata import FuncMetadata
+from mcp.types import TextContent
+from pydantic import BaseModel
+
+try:
+    from orjson import loads
+except ImportError:  # pragma: no cover - depends on the installed extras
+    loads = pydantic_core.from_json
+
+
+def convert_result(metadata: FuncMetadata, result: Any) -> Any:
+    """Same output as ``metadata.convert_result(result)``, with one serialization pass for models."""
+    if not isinstance(result, BaseModel) or metadata.output_schema is None:
+        return metadata.convert_result(result)
+
+    raw = result.model_dump_json(by_alias=True)
+    structured = loads(raw)
+    if metadata.wrap_output:
+        structured = {"result": structured}
+    return [TextContent(type="text", text=raw)], structured
@@ -0,0 +1,169 @@
+"""
+Compact price series for historical price responses.
+
+A history of N bars used to pass through the tool as the cached DataFrame,
+a copy with the index reset, N record dicts from to_dict(), N normalized
+dicts and N HistoricalPricePoint models, all alive until the response was
+serialized. PriceSeries keeps the frame's index and column arrays (views,
+not copies) and produces the points in chunks while the response is written,
+so only one chunk of rows exists as Python objects at any time.
+
+Values are normalized as the tool always has: missing, NaN and zero prices
+and volumes become None, volumes are ints, and dates read like
+``str(Timestamp)`` ("2025-10-24 00:00:00-04:00").
+"""
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+from src.lazy import lazy_import
+from src.models import HistoricalPricePoint
+from src.models.base import construct
+from src.models.historical import PricePoints
+
+np = lazy_import("numpy", globals())
+pd = lazy_import("pandas", globals())
+
+# Rows turned into Python objects at a time
+CHUNK_ROWS = 4096
+
+
+def _offset(seconds: int) -> str | None:
+    """UTC offset as isoformat() writes it, or None when it is not whole minutes."""
+    if seconds % 60:
+        return None
+    hours, minutes = divmod(abs(seconds) // 60, 60)
+    return f"{'-' if seconds < 0 else '+'}{hours:02d}:{minutes:02d}"
+
+
+def format_dates(index: pd.Index) -> list[str]:
+    """
+    ``[str(value) for value in index]``, vectorized for whole-second DatetimeIndexes.
+
+    Formatting each Timestamp costs microseconds; NumPy formats the wall
+    times in one call and the UTC offset is appended per distinct offset.
+    """
+    if not isinstance(index, pd.DatetimeIndex) or index.hasnans:
+        return [str(value) for value in index]
+    wall = index.tz_localize(None) if index.tz is not None else index
+    seconds = wall.values.astype("datetime64[s]")
+    if (seconds != wall.values).any():
+        return [str(value) for value in index]
+
+    dates = [text.replace("T", " ") for text in np.datetime_as_string(seconds).tolist()]
+    if index.tz is None:
+        return dates
+    offsets = (wall.values - index.tz_convert(None).values).astype("timedelta64[s]").astype(np.int64)
+    unique, positions = np.unique(offsets, return_inverse=True)
+    suffixes = [_offset(int(value)) for value in unique]
+    if None in suffixes:
+        return [str(value) for value in index]
+    return [date + suffixes[position] for date, position in zip(dates, positions.tolist(), strict=True)]
+
+
+def _part(values: np.ndarray | None, item: slice) -> np.ndarray | None:
+    return None if values is None else values[item]
+
+
+def _values(column: np.ndarray | None, size: int, integer: bool = False) -> list:
+    """Python values of a column chunk, None where it is missing, NaN or zero."""
+    if column is None:
+        return [None] * size
+    missing = column == 0
+    if column.dtype.kind == "f":
+        missing |= np.isnan(column)
+    if integer and column.dtype.kind != "i":
+        column = np.where(missing, 0, column).astype(np.int64)
+    elif not integer:
+        column = column.astype(np.float64, copy=False)
+    values = column.astype(object)
+    values[missing] = None
+    return values.tolist()
+
+
+class PriceSeries(PricePoints):
+    """
+    OHLCV bars held as arrays, read as a sequence of HistoricalPricePoint.
+
+    Indexing and iteration build points on demand; rows() yields the
+    normalized field dicts, one chunk at a time. As a PricePoints it can
+    stand in for the list in HistoricalPriceResponse.data_points.
+    """
+    __slots__ = ("dates", "open", "high", "low", "close", "volume", "adj_close")
+
+    def __init__(
+        self,
+        dates: pd.Index,
+        open: np.ndarray | None,
+        high: np.ndarray | None,
+        low: np.ndarray | None,
+        close: np.ndarray | None,
+        volume: np.ndarray | None,
+        adj_close: np.ndarray | None,
+    ):
+        self.dates = dates
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.adj_close = adj_close
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> PriceSeries:
+        """Series over a ``yf.Ticker.history`` frame, sharing its column arrays."""
+        def column(name: str) -> np.ndarray | None:
+            return frame[name].to_numpy() if name in frame.columns else None
+
+        return cls(
+            frame.index,
+            column("Open"),
+            column("High"),
+            column("Low"),
+            column("Close"),
+            column("Volume"),
+            column("Adj Close"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, item: int | slice) -> HistoricalPricePoint | PriceSeries:
+        if isinstance(item, slice):
+            return PriceSeries(*(_part(values, item) for values in self._columns()))
+        position = range(len(self))[item]
+        return next(iter(self[position:position + 1]))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (PriceSeries, list)):
+            return NotImplemented
+        return len(self) == len(other) and all(point == item for point, item in zip(self, other, strict=True))
+
+    __hash__ = None
+
+    def __iter__(self) -> Iterator[HistoricalPricePoint]:
+        for row in self.rows():
+            yield construct(HistoricalPricePoint, row)
+
+    def _columns(self) -> tuple:
+        return self.dates, self.open, self.high, self.low, self.close, self.volume, self.adj_close
+
+    def rows(self) -> Iterator[dict[str, Any]]:
+        """Field dicts of HistoricalPricePoint, in order."""
+        for start in range(0, len(self), CHUNK_ROWS):
+            chunk = slice(start, start + CHUNK_ROWS)
+            dates = format_dates(self.dates[chunk])
+            size = len(dates)
+            opens, highs, lows, closes = (_values(_part(values, chunk), size) for values in (self.open, self.high, self.low, self.close))
+            volumes = _values(_part(self.volume, chunk), size, integer=True)
+            adj_closes = _values(_part(self.adj_close, chunk), size)
+            for date, open, high, low, close, volume, adj_close in zip(dates, opens, highs, lows, closes, volumes, adj_closes, strict=True):
+                yield {
+                    "date": date,
+                    "open": open,
+                    "high": high,
+                    "low": low,
+                    "close": close,
+                    "volume": volume,
+                    "adj_close": adj_close,
+                }
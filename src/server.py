@@ -3,19 +3,24 @@ Yahoo Finance MCP Server - Modernized for MCP 1.19+
 Supports structured outputs with Pydantic validation.
 Protocol: 2025-06-18
 """
+import sys
 from contextlib import asynccontextmanager
-from typing import Literal
+from functools import cache
+from importlib.metadata import version
+from typing import Annotated, Any, Literal
 
-import pandas as pd
-import yfinance as yf
-from pydantic import Field
+from pydantic import Field, TypeAdapter
+from mcp import types
 from mcp.server.fastmcp import FastMCP, Context
+from starlette.requests import Request
+from starlette.responses import Response
 
 from src.models import (
     AppContext,
     TickerValidationError,
     HistoricalPricePoint,
     HistoricalPriceResponse,
+    PriceSummaryResponse,
     StockInfoResponse,
     NewsArticle,
     NewsListResponse,
@@ -28,8 +33,53 @@ from src.models import (
     OptionChainResponse,
     RecommendationPoint,
     RecommendationsResponse,
+    TechnicalIndicatorsResponse,
+    IndicatorSnapshot,
+    IndicatorSnapshotResponse,
+    CorrelationPair,
+    CorrelationMatrixResponse,
+    TermStructurePoint,
+    IVSurfaceResponse,
+    ExportDatasetResponse,
 )
-from src.models.enums import FinancialType, HolderType, RecommendationType
+from src.models.base import M, construct
+from src.models.enums import FinancialType, HolderType, RecommendationType, IndicatorType
+from src.analytics import (
+    compute_price_summary,
+    compute_indicators,
+    IndicatorParams,
+    align_closes,
+    estimate_matrix_bytes,
+    return_statistics,
+    top_pairs,
+    black_scholes_greeks,
+    years_to_expiration,
+    DEFAULT_MONEYNESS_GRID,
+    DEFAULT_TENOR_DAYS,
+    interpolate_surface,
+)
+from src.config import config
+from src.export import SCHEMAS, DatasetWriter, export_path, pyarrow_available, write_results
+from src.lazy import lazy_import, start_warm_up
+from src.schema_cache import install_schema_cache
+from src.series import PriceSeries
+from src.telemetry import CONTENT_TYPE, InstrumentedTicker, TracedFastMCP, instrumented, note_error, profiling, registry, tracing
+from src.market_data import (
+    TickerNotFoundError,
+    fetch_history,
+    fetch_batch,
+    fetch_history_batch,
+    fetch_option_chains,
+    fetch_spot_price,
+    fetch_statement,
+    indicator_cache,
+    advance_indicators,
+    fetch_volatility_smiles,
+    run_blocking,
+)
+
+np = lazy_import("numpy", globals())
+pd = lazy_import("pandas", globals())
 
 
 # ============================================================================
@@ -42,24 +92,37 @@ async def app_lifespan(server: FastMCP):
     context = AppContext()
 
     # Startup: initialize resources
-    print("🚀 Yahoo Finance MCP Server v2.0 starting...")
-    print(f"📊 yfinance version: {yf.__version__}")
-    print(f"📡 MCP Protocol: 2025-06-18")
-    print(f"🔧 Python SDK: 1.19+")
+    print("🚀 Yahoo Finance MCP Server v2.0 starting...", file=sys.stderr)
+    print(f"📊 yfinance version: {version('yfinance')}", file=sys.stderr)
+    print(f"📡 MCP Protocol: 2025-06-18", file=sys.stderr)
+    print(f"🔧 Python SDK: 1.19+", file=sys.stderr)
+
+    if config.upstream.mode != "live":
+        # Imported here: the replay sessions pull in curl_cffi
+        from src.replay import install_session, session_from_config
+
+        install_session(session_from_config(config.upstream))
+        if config.upstream.mode == "record":
+            print(f"🎙️  Recording Yahoo Finance exchanges to {config.upstream.archive_path}", file=sys.stderr)
+        else:
+            print(f"🎞️  Replaying Yahoo Finance from {config.upstream.replay_url}", file=sys.stderr)
 
     try:
         yield context
     finally:
         # Cleanup: close connections, save cache, etc.
-        print(f"📈 Total requests processed: {context.request_count}")
-        print("👋 Server shutting down...")
+        tracing.tracer.shutdown()
+        if profiling.profiler:
+            profiling.profiler.dump()
+        print(f"📈 Total requests processed: {context.request_count}", file=sys.stderr)
+        print("👋 Server shutting down...", file=sys.stderr)
 
 
 # ============================================================================
 # SERVER INITIALIZATION
 # ============================================================================
 
-mcp = FastMCP(
+mcp = TracedFastMCP(
     "Yahoo Finance",
     lifespan=app_lifespan,
     instructions="""
@@ -86,6 +149,12 @@ Modernized MCP server for Yahoo Finance financial data with structured outputs.
 7. **get_option_expiration_dates** - Available option expiration dates
 8. **get_option_chain** - Option chain data
 9. **get_recommendations** - Analyst recommendations
+10. **get_price_summary** - Period return, range, volatility and drawdown
+11. **get_technical_indicators** - SMA, EMA, RSI, MACD, Bollinger Bands, ATR, VWAP
+12. **get_indicator_snapshot** - Latest EMA, RSI and volatility for a watchlist
+13. **get_correlation_matrix** - Return correlations and covariances across tickers
+14. **get_iv_surface** - Implied volatility surface and ATM term structure
+15. **export_dataset** - Write history, statements or option chains for many tickers to Parquet/Arrow
 
 ## Supported Tickers:
 - US Stocks: AAPL, MSFT, GOOGL, TSLA, etc.
@@ -97,6 +166,73 @@ Modernized MCP server for Yahoo Finance financial data with structured outputs.
 )
 
 
+async def _on_initialized(notification: types.InitializedNotification) -> None:
+    """Start importing pandas/yfinance once the client handshake is done."""
+    if config.warm_up:
+        start_warm_up()
+
+
+mcp._mcp_server.notification_handlers[types.InitializedNotification] = _on_initialized
+
+if config.cache.schema_path:
+    install_schema_cache(mcp, config.cache.schema_path)
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+@cache
+def _list_adapter(model: type[M]) -> TypeAdapter:
+    return TypeAdapter(list[model])
+
+
+def _build(model: type[M], rows: list[dict[str, Any]]) -> list[M]:
+    """
+    ``model`` instances for rows normalized from upstream data.
+
+    Rows name every field and are wrapped without validation
+    (src.models.base.construct) unless ``config.validate_models`` is set,
+    which validates the whole list in one pass.
+    """
+    if config.validate_models:
+        return _list_adapter(model).validate_python(rows)
+    return [construct(model, row) for row in rows]
+
+
+def _missing_field_error(rows: list[dict[str, Any]], field: str, ticker: str, what: str) -> TickerValidationError | None:
+    """
+    Error for rows whose required ``field`` upstream left empty, or None.
+
+    construct() would pass the None on unchecked and the result would fail
+    the tool's output schema, so the tool reports it instead.
+    """
+    missing = sum(row[field] is None for row in rows)
+    if not missing:
+        return None
+    return TickerValidationError(
+        error=f"Yahoo Finance returned {missing} {what} for '{ticker}' without a {field}",
+        ticker=ticker
+    )
+
+
+def _ticker_errors(failures: dict[str, Exception]) -> list[TickerValidationError]:
+    """Per-ticker errors of a batch fetch, for tools that report them next to their results."""
+    return [
+        TickerValidationError(error=str(exc), ticker=ticker)
+        if isinstance(exc, (TickerNotFoundError, ValueError))
+        else TickerValidationError(error=f"Internal error: {str(exc)}", ticker=ticker)
+        for ticker, exc in failures.items()
+    ]
+
+
+def _to_json_list(values: "np.ndarray") -> list:
+    """Convert a float array (any shape) to nested lists with NaN/inf as None."""
+    values = values.astype(object)
+    values[~np.isfinite(values.astype(np.float64))] = None
+    return values.tolist()
+
+
 # ============================================================================
 # TOOL 1: GET HISTORICAL STOCK PRICES
 # ============================================================================
@@ -105,6 +241,7 @@ Modernized MCP server for Yahoo Finance financial data with structured outputs.
     name="get_historical_stock_prices",
     description="Get historical OHLCV (Open, High, Low, Close, Volume) stock price data for analysis and charting"
 )
+@instrumented
 async def get_historical_stock_prices(
     ticker: str = Field(description="Stock ticker symbol (e.g., 'AAPL', 'MSFT', 'TSLA')"),
     period: Literal["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"] = Field(
@@ -126,20 +263,8 @@ async def get_historical_stock_prices(
         ctx.request_context.lifespan_context.request_count += 1
 
     try:
-        company = yf.Ticker(ticker)
-
-        # Validate ticker
-        if company.isin is None:
-            if ctx:
-                await ctx.warning(f"⚠️  Ticker {ticker} not found")
-            return TickerValidationError(
-                error=f"Ticker '{ticker}' not found",
-                ticker=ticker,
-                suggestion="Check the symbol or try with exchange suffix (e.g., AAPL.MX for Mexico)"
-            )
-
-        # Get historical data
-        hist_data = company.history(period=period, interval=interval)
+        # Get historical data (validates the ticker on a cache miss)
+        hist_data = await run_blocking(fetch_history, ticker, period, interval)
 
         if hist_data.empty:
             return TickerValidationError(
@@ -148,35 +273,41 @@ async def get_historical_stock_prices(
                 suggestion="Try a different period or check if trading is active"
             )
 
-        # Convert to structured format
-        hist_data = hist_data.reset_index(names="Date")
-        records = hist_data.to_dict(orient="records")
-
-        data_points = [
-            HistoricalPricePoint(
-                date=str(rec["Date"]),
-                open=float(rec["Open"]) if rec.get("Open") and not pd.isna(rec["Open"]) else None,
-                high=float(rec["High"]) if rec.get("High") and not pd.isna(rec["High"]) else None,
-                low=float(rec["Low"]) if rec.get("Low") and not pd.isna(rec["Low"]) else None,
-                close=float(rec["Close"]) if rec.get("Close") and not pd.isna(rec["Close"]) else None,
-                volume=int(rec["Volume"]) if rec.get("Volume") and not pd.isna(rec["Volume"]) else None,
-                adj_close=float(rec.get("Adj Close")) if rec.get("Adj Close") and not pd.isna(rec.get("Adj Close")) else None
-            )
-            for rec in records
-        ]
+        # Points are produced from the frame's arrays while the response is written
+        series = PriceSeries.from_frame(hist_data)
 
         if ctx:
-            await ctx.info(f"✅ Returning {len(data_points)} data points for {ticker}")
+            await ctx.info(f"✅ Returning {len(series)} data points for {ticker}")
 
-        return HistoricalPriceResponse(
+        if config.validate_models:
+            data_points = _build(HistoricalPricePoint, list(series.rows()))
+            return HistoricalPriceResponse(
+                ticker=ticker,
+                period=period,
+                interval=interval,
+                data_points=data_points,
+                count=len(data_points)
+            )
+        return construct(HistoricalPriceResponse, dict(
             ticker=ticker,
             period=period,
             interval=interval,
-            data_points=data_points,
-            count=len(data_points)
+            data_points=series,
+            count=len(series)
+        ))
+
+    except TickerNotFoundError as e:
+        note_error(e)
+        if ctx:
+            await ctx.warning(f"⚠️  Ticker {ticker} not found")
+        return TickerValidationError(
+            error=f"Ticker '{ticker}' not found",
+            ticker=ticker,
+            suggestion="Check the symbol or try with exchange suffix (e.g., AAPL.MX for Mexico)"
         )
 
     except Exception as e:
+        note_error(e)
         if ctx:
             await ctx.error(f"❌ Error getting historical data for {ticker}: {str(e)}")
         return TickerValidationError(
@@ -193,6 +324,7 @@ async def get_historical_stock_prices(
     name="get_stock_info",
     description="Get comprehensive stock information including real-time price, market metrics, financial ratios, and company details"
 )
+@instrumented
 async def get_stock_info(
     ticker: str = Field(description="Stock ticker symbol to retrieve information for (e.g., 'AAPL', 'GOOGL', 'TSLA')"),
     ctx: Context | None = None
@@ -206,7 +338,7 @@ async def get_stock_info(
         ctx.request_context.lifespan_context.request_count += 1
 
     try:
-        company = yf.Ticker(ticker)
+        company = InstrumentedTicker(ticker)
 
         # Validate ticker
         if company.isin is None:
@@ -253,6 +385,7 @@ async def get_stock_info(
         )
 
     except Exception as e:
+        note_error(e)
         if ctx:
             await ctx.error(f"❌ Error getting stock info for {ticker}: {str(e)}")
         return TickerValidationError(
@@ -276,6 +409,7 @@ import json
     name="get_yahoo_finance_news",
     description="Get latest news articles and headlines related to a stock from Yahoo Finance"
 )
+@instrumented
 async def get_yahoo_finance_news(
     ticker: str = Field(description="Stock ticker symbol to retrieve news for (e.g., 'AAPL', 'TSLA', 'NVDA')"),
     ctx: Context | None = None
@@ -289,7 +423,7 @@ async def get_yahoo_finance_news(
         ctx.request_context.lifespan_context.request_count += 1
 
     try:
-        company = yf.Ticker(ticker)
+        company = InstrumentedTicker(ticker)
 
         # Validate ticker
         if company.isin is None:
@@ -305,11 +439,11 @@ async def get_yahoo_finance_news(
         if not news:
             return NewsListResponse(ticker=ticker, articles=[], count=0)
 
-        articles = []
+        rows = []
         for item in news:
             if item.get("content", {}).get("contentType") == "STORY":
                 content = item.get("content", {})
-                articles.append(NewsArticle(
+                rows.append(dict(
                     title=content.get("title"),
                     publisher=content.get("provider", {}).get("displayName"),
                     link=content.get("canonicalUrl", {}).get("url"),
@@ -318,6 +452,10 @@ async def get_yahoo_finance_news(
                     thumbnail=content.get("thumbnail", {}).get("resolutions", [{}])[0].get("url") if content.get("thumbnail") else None,
                     related_tickers=item.get("relatedTickers")
                 ))
+        error = _missing_field_error(rows, "title", ticker, "news articles")
+        if error:
+            return error
+        articles = _build(NewsArticle, rows)
 
         if ctx:
             await ctx.info(f"✅ Found {len(articles)} news articles for {ticker}")
@@ -325,6 +463,7 @@ async def get_yahoo_finance_news(
         return NewsListResponse(ticker=ticker, articles=articles, count=len(articles))
 
     except Exception as e:
+        note_error(e)
         if ctx:
             await ctx.error(f"❌ Error getting news for {ticker}: {str(e)}")
         return TickerValidationError(
@@ -341,6 +480,7 @@ async def get_yahoo_finance_news(
     name="get_stock_actions",
     description="Get historical dividend payments and stock split events for a company"
 )
+@instrumented
 async def get_stock_actions(
     ticker: str = Field(description="Stock ticker symbol to retrieve corporate actions for (e.g., 'AAPL', 'MSFT', 'KO')"),
     ctx: Context | None = None
@@ -354,7 +494,7 @@ async def get_stock_actions(
         ctx.request_context.lifespan_context.request_count += 1
 
     try:
-        company = yf.Ticker(ticker)
+        company = InstrumentedTicker(ticker)
         actions_df = company.actions
 
         if actions_df.empty:
@@ -363,14 +503,14 @@ async def get_stock_actions(
         actions_df = actions_df.reset_index(names="Date")
         records = actions_df.to_dict(orient="records")
 
-        actions = [
-            StockActionPoint(
+        actions = _build(StockActionPoint, [
+            dict(
                 date=str(rec["Date"]),
                 dividends=float(rec["Dividends"]) if rec.get("Dividends") and not pd.isna(rec["Dividends"]) else None,
                 stock_splits=float(rec["Stock Splits"]) if rec.get("Stock Splits") and not pd.isna(rec["Stock Splits"]) else None
             )
             for rec in records
-        ]
+        ])
 
         if ctx:
             await ctx.info(f"✅ Found {len(actions)} stock actions for {ticker}")
@@ -378,6 +518,7 @@ async def get_stock_actions(
         return StockActionsResponse(ticker=ticker, actions=actions, count=len(actions))
 
     except Exception as e:
+        note_error(e)
         if ctx:
             await ctx.error(f"❌ Error getting stock actions for {ticker}: {str(e)}")
         return TickerValidationError(
@@ -394,6 +535,7 @@ async def get_stock_actions(
     name="get_financial_statement",
     description="Get official financial statements including income statement, balance sheet, and cash flow (annual or quarterly)"
 )
+@instrumented
 async def get_financial_statement(
     ticker: str = Field(description="Stock ticker symbol to retrieve financial statements for (e.g., 'AAPL', 'MSFT', 'GOOGL')"),
     financial_type: FinancialType = Field(description="Type of financial statement: 'income_stmt', 'balance_sheet', 'cashflow' (annual), or quarterly versions with 'quarterly_' prefix"),
@@ -408,7 +550,7 @@ async def get_financial_statement(
         ctx.request_context.lifespan_context.request_count += 1
 
     try:
-        company = yf.Ticker(ticker)
+        company = InstrumentedTicker(ticker)
 
         # Validate ticker
         if company.isin is None:
@@ -473,6 +615,7 @@ async def get_financial_statement(
         )
 
     except Exception as e:
+        note_error(e)
         if ctx:
             await ctx.error(f"❌ Error getting financial statement for {ticker}: {str(e)}")
         return TickerValidationError(
@@ -489,6 +632,7 @@ async def get_financial_statement(
     name="get_holder_info",
     description="Get stock ownership data including institutional holders, mutual funds, insiders, and insider transactions"
 )
+@instrumented
 async def get_holder_info(
     ticker: str = Field(description="Stock ticker symbol to retrieve ownership information for (e.g., 'AAPL', 'TSLA', 'MSFT')"),
     holder_type: HolderType = Field(description="Type of ownership data: 'major_holders', 'institutional_holders', 'mutualfund_holders', 'insider_transactions', 'insider_purchases', or 'insider_roster_holders'"),
@@ -503,7 +647,7 @@ async def get_holder_info(
         ctx.request_context.lifespan_context.request_count += 1
 
     try:
-        company = yf.Ticker(ticker)
+        company = InstrumentedTicker(ticker)
 
         # Validate ticker
         if company.isin is None:
@@ -549,6 +693,7 @@ async def get_holder_info(
         )
 
     except Exception as e:
+        note_error(e)
         if ctx:
             await ctx.error(f"❌ Error getting holder info for {ticker}: {str(e)}")
         return TickerValidationError(
@@ -565,6 +710,7 @@ async def get_holder_info(
     name="get_option_expiration_dates",
     description="Get all available option contract expiration dates for a stock"
 )
+@instrumented
 async def get_option_expiration_dates(
     ticker: str = Field(description="Stock ticker symbol to retrieve option expiration dates for (e.g., 'AAPL', 'SPY', 'TSLA')"),
     ctx: Context | None = None
@@ -578,7 +724,7 @@ async def get_option_expiration_dates(
         ctx.request_context.lifespan_context.request_count += 1
 
     try:
-        company = yf.Ticker(ticker)
+        company = InstrumentedTicker(ticker)
 
         # Validate ticker
         if company.isin is None:
@@ -601,6 +747,7 @@ async def get_option_expiration_dates(
         )
 
     except Exception as e:
+        note_error(e)
         if ctx:
             await ctx.error(f"❌ Error getting option dates for {ticker}: {str(e)}")
         return TickerValidationError(
@@ -617,14 +764,22 @@ async def get_option_expiration_dates(
     name="get_option_chain",
     description="Get detailed options chain data (calls or puts) for a specific expiration date"
 )
+@instrumented
 async def get_option_chain(
     ticker: str = Field(description="Stock ticker symbol to retrieve options chain for (e.g., 'AAPL', 'SPY', 'NVDA')"),
     expiration_date: str = Field(description="Option expiration date in YYYY-MM-DD format (use get_option_expiration_dates to find valid dates)"),
     option_type: Literal["calls", "puts"] = Field(description="Type of options contracts: 'calls' (right to buy) or 'puts' (right to sell)"),
+    include_greeks: Annotated[bool, Field(description="Compute Black-Scholes delta, gamma, theta, vega and rho for every contract")] = False,
+    min_strike: Annotated[float | None, Field(description="Only return strikes at or above this price", ge=0)] = None,
+    max_strike: Annotated[float | None, Field(description="Only return strikes at or below this price", ge=0)] = None,
+    moneyness_range: Annotated[float | None, Field(description="Only return strikes within this fraction of the underlying price (e.g., 0.1 for ±10%)", gt=0)] = None,
+    min_open_interest: Annotated[int | None, Field(description="Only return contracts with at least this open interest", ge=0)] = None,
     ctx: Context | None = None
 ) -> OptionChainResponse | TickerValidationError:
     """
     Retrieve complete options chain with strike prices, premiums, Greeks, and open interest.
+    Strike, moneyness and open interest filters are applied before contracts are converted,
+    and Greeks are computed server-side only when include_greeks is set.
     Essential for options trading strategies and volatility analysis.
     """
     if ctx:
@@ -632,7 +787,7 @@ async def get_option_chain(
         ctx.request_context.lifespan_context.request_count += 1
 
     try:
-        company = yf.Ticker(ticker)
+        company = InstrumentedTicker(ticker)
 
         # Validate ticker
         if company.isin is None:
@@ -668,10 +823,48 @@ async def get_option_chain(
                 count=0
             )
 
+        underlying_price = None
+        if include_greeks or moneyness_range is not None:
+            underlying_price = fetch_spot_price(ticker)
+
+        strikes = chain_df["strike"].to_numpy(dtype=np.float64)
+        keep = np.ones(len(chain_df), dtype=bool)
+        if min_strike is not None:
+            keep &= strikes >= min_strike
+        if max_strike is not None:
+            keep &= strikes <= max_strike
+        if moneyness_range is not None:
+            if underlying_price is None:
+                return TickerValidationError(
+                    error=f"No underlying price available for {ticker} to apply moneyness_range",
+                    ticker=ticker,
+                    suggestion="Use min_strike and max_strike instead"
+                )
+            keep &= np.abs(strikes / underlying_price - 1.0) <= moneyness_range
+        if min_open_interest is not None:
+            keep &= chain_df["openInterest"].fillna(0).to_numpy() >= min_open_interest
+        if not keep.all():
+            chain_df = chain_df[keep]
+
+        if include_greeks:
+            if underlying_price is None:
+                if ctx:
+                    await ctx.warning(f"⚠️  No underlying price for {ticker}, Greeks unavailable")
+            else:
+                greeks = black_scholes_greeks(
+                    spot=underlying_price,
+                    strikes=chain_df["strike"].to_numpy(dtype=np.float64),
+                    years=years_to_expiration(expiration_date),
+                    volatilities=chain_df["impliedVolatility"].to_numpy(dtype=np.float64),
+                    is_call=option_type == "calls",
+                    rate=config.analytics.risk_free_rate,
+                )
+                chain_df = chain_df.assign(**greeks)
+
         records = chain_df.to_dict(orient="records")
         
-        contracts = [
-            OptionContract(
+        contracts = _build(OptionContract, [
+            dict(
                 contract_symbol=rec.get("contractSymbol"),
                 strike=float(rec["strike"]) if rec.get("strike") and not pd.isna(rec["strike"]) else None,
                 last_price=float(rec["lastPrice"]) if rec.get("lastPrice") and not pd.isna(rec["lastPrice"]) else None,
@@ -680,10 +873,15 @@ async def get_option_chain(
                 volume=int(rec["volume"]) if rec.get("volume") and not pd.isna(rec["volume"]) else None,
                 open_interest=int(rec["openInterest"]) if rec.get("openInterest") and not pd.isna(rec["openInterest"]) else None,
                 implied_volatility=float(rec["impliedVolatility"]) if rec.get("impliedVolatility") and not pd.isna(rec["impliedVolatility"]) else None,
-                in_the_money=bool(rec.get("inTheMoney"))
+                in_the_money=bool(rec.get("inTheMoney")),
+                delta=None if pd.isna(rec.get("delta")) else float(rec["delta"]),
+                gamma=None if pd.isna(rec.get("gamma")) else float(rec["gamma"]),
+                theta=None if pd.isna(rec.get("theta")) else float(rec["theta"]),
+                vega=None if pd.isna(rec.get("vega")) else float(rec["vega"]),
+                rho=None if pd.isna(rec.get("rho")) else float(rec["rho"])
             )
             for rec in records
-        ]
+        ])
 
         if ctx:
             await ctx.info(f"✅ Found {len(contracts)} {option_type} contracts for {ticker}")
@@ -693,10 +891,12 @@ async def get_option_chain(
             expiration_date=expiration_date,
             option_type=option_type,
             contracts=contracts,
-            count=len(contracts)
+            count=len(contracts),
+            underlying_price=underlying_price
         )
 
     except Exception as e:
+        note_error(e)
         if ctx:
             await ctx.error(f"❌ Error getting option chain for {ticker}: {str(e)}")
         return TickerValidationError(
@@ -713,6 +913,7 @@ async def get_option_chain(
     name="get_recommendations",
     description="Get analyst recommendations, ratings, and upgrade/downgrade history from Wall Street firms"
 )
+@instrumented
 async def get_recommendations(
     ticker: str = Field(description="Stock ticker symbol to retrieve analyst recommendations for (e.g., 'AAPL', 'GOOGL', 'TSLA')"),
     recommendation_type: RecommendationType = Field(description="Type of recommendations: 'recommendations' (current ratings) or 'upgrades_downgrades' (rating changes)"),
@@ -728,7 +929,7 @@ async def get_recommendations(
         ctx.request_context.lifespan_context.request_count += 1
 
     try:
-        company = yf.Ticker(ticker)
+        company = InstrumentedTicker(ticker)
 
         # Validate ticker
         if company.isin is None:
@@ -750,9 +951,9 @@ async def get_recommendations(
                 )
             
             records = recs_df.to_dict(orient="records")
-            recommendations = [
-                RecommendationPoint(
-                    date=str(rec.get("Date")) if rec.get("Date") else None,
+            rows = [
+                dict(
+                    date=None if pd.isna(rec.get("Date")) else str(rec["Date"]),
                     firm=rec.get("Firm"),
                     to_grade=rec.get("To Grade"),
                     from_grade=rec.get("From Grade"),
@@ -778,9 +979,9 @@ async def get_recommendations(
             latest_by_firm = upgrades_df.drop_duplicates(subset=["Firm"])
             
             records = latest_by_firm.to_dict(orient="records")
-            recommendations = [
-                RecommendationPoint(
-                    date=str(rec.get("GradeDate")) if rec.get("GradeDate") else None,
+            rows = [
+                dict(
+                    date=None if pd.isna(rec.get("GradeDate")) else str(rec["GradeDate"]),
                     firm=rec.get("Firm"),
                     to_grade=rec.get("ToGrade"),
                     from_grade=rec.get("FromGrade"),
@@ -794,6 +995,11 @@ async def get_recommendations(
                 ticker=ticker
             )
 
+        error = _missing_field_error(rows, "date", ticker, "recommendations")
+        if error:
+            return error
+        recommendations = _build(RecommendationPoint, rows)
+
         if ctx:
             await ctx.info(f"✅ Found {len(recommendations)} recommendations for {ticker}")
 
@@ -805,6 +1011,7 @@ async def get_recommendations(
         )
 
     except Exception as e:
+        note_error(e)
         if ctx:
             await ctx.error(f"❌ Error getting recommendations for {ticker}: {str(e)}")
         return TickerValidationError(
@@ -813,6 +1020,605 @@ async def get_recommendations(
         )
 
 
+# ============================================================================
+# TOOL 10: GET PRICE SUMMARY
+# ============================================================================
+
+@mcp.tool(
+    name="get_price_summary",
+    description="Get summary statistics (return, high/low, average volume, volatility, max drawdown) over a historical price window"
+)
+@instrumented
+async def get_price_summary(
+    ticker: str = Field(description="Stock ticker symbol (e.g., 'AAPL', 'MSFT', 'TSLA')"),
+    period: Literal["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"] = Field(
+        default="1y",
+        description="Time period to summarize: '1mo'=1 month, '1y'=1 year, 'max'=all available data"
+    ),
+    interval: Literal["1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo"] = Field(
+        default="1d",
+        description="Bar granularity used for the statistics: '1h'=1 hour, '1d'=1 day, '1wk'=1 week"
+    ),
+    ctx: Context | None = None
+) -> PriceSummaryResponse | TickerValidationError:
+    """
+    Compute aggregate statistics over historical prices without returning every bar.
+    Prefer this over get_historical_stock_prices when only the totals are needed.
+    """
+    if ctx:
+        await ctx.info(f"📐 Summarizing prices for {ticker} (period={period}, interval={interval})")
+        ctx.request_context.lifespan_context.request_count += 1
+
+    try:
+        hist_data = await run_blocking(fetch_history, ticker, period, interval)
+
+        if hist_data.empty:
+            return TickerValidationError(
+                error=f"No data available for {ticker} in period {period}",
+                ticker=ticker,
+                suggestion="Try a different period or check if trading is active"
+            )
+
+        summary = compute_price_summary(hist_data, interval)
+
+        if ctx:
+            await ctx.info(f"✅ Summarized {summary['bars']} bars for {ticker}")
+
+        return PriceSummaryResponse(
+            ticker=ticker,
+            period=period,
+            interval=interval,
+            **summary
+        )
+
+    except TickerNotFoundError as e:
+        note_error(e)
+        if ctx:
+            await ctx.warning(f"⚠️  Ticker {ticker} not found")
+        return TickerValidationError(
+            error=f"Ticker '{ticker}' not found",
+            ticker=ticker,
+            suggestion="Check the symbol or try with exchange suffix (e.g., AAPL.MX for Mexico)"
+        )
+
+    except Exception as e:
+        note_error(e)
+        if ctx:
+            await ctx.error(f"❌ Error summarizing prices for {ticker}: {str(e)}")
+        return TickerValidationError(
+            error=f"Internal error: {str(e)}",
+            ticker=ticker
+        )
+
+
+# ============================================================================
+# TOOL 11: GET TECHNICAL INDICATORS
+# ============================================================================
+
+@mcp.tool(
+    name="get_technical_indicators",
+    description="Get technical indicators (SMA, EMA, RSI, MACD, Bollinger Bands, ATR, VWAP) computed server-side over historical prices"
+)
+@instrumented
+async def get_technical_indicators(
+    ticker: str = Field(description="Stock ticker symbol (e.g., 'AAPL', 'MSFT', 'TSLA')"),
+    indicators: list[IndicatorType] = Field(description="Indicators to compute: 'sma', 'ema', 'rsi', 'macd', 'bollinger', 'atr', 'vwap'"),
+    period: Literal["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"] = Field(
+        default="1y",
+        description="History used for the computation; longer periods give indicators more warm-up data"
+    ),
+    interval: Literal["1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo"] = Field(
+        default="1d",
+        description="Bar granularity: '1h'=1 hour, '1d'=1 day, '1wk'=1 week"
+    ),
+    window: int = Field(default=20, ge=2, le=500, description="Window length for SMA, EMA and Bollinger Bands"),
+    rsi_period: int = Field(default=14, ge=2, le=500, description="Lookback period for RSI"),
+    macd_fast: int = Field(default=12, ge=2, le=500, description="Fast EMA span for MACD (shorter than macd_slow)"),
+    macd_slow: int = Field(default=26, ge=2, le=500, description="Slow EMA span for MACD"),
+    macd_signal: int = Field(default=9, ge=2, le=500, description="Signal line span for MACD"),
+    bollinger_std: float = Field(default=2.0, gt=0, le=10, description="Band width in standard deviations for Bollinger Bands"),
+    atr_period: int = Field(default=14, ge=2, le=500, description="Lookback period for ATR"),
+    limit: int = Field(default=100, ge=1, le=10000, description="Number of most recent bars to return (indicators are always computed over the full period)"),
+    ctx: Context | None = None
+) -> TechnicalIndicatorsResponse | TickerValidationError:
+    """
+    Compute technical indicators over the same bars get_historical_stock_prices returns.
+    Avoids downloading raw prices and computing indicators in-context.
+    """
+    if ctx:
+        await ctx.info(f"📉 Computing {[i.value for i in indicators]} for {ticker} (period={period}, interval={interval})")
+        ctx.request_context.lifespan_context.request_count += 1
+
+    if IndicatorType.macd in indicators and macd_fast >= macd_slow:
+        return TickerValidationError(
+            error=f"macd_fast ({macd_fast}) must be shorter than macd_slow ({macd_slow})",
+            ticker=ticker
+        )
+
+    try:
+        params = (window, rsi_period, macd_fast, macd_slow, macd_signal, bollinger_std, atr_period)
+        key = (ticker, period, interval, tuple(sorted(i.value for i in indicators)), params)
+        cached = indicator_cache.get(key)
+
+        if cached is None:
+            hist_data = await run_blocking(fetch_history, ticker, period, interval)
+
+            if hist_data.empty:
+                return TickerValidationError(
+                    error=f"No data available for {ticker} in period {period}",
+                    ticker=ticker,
+                    suggestion="Try a different period or check if trading is active"
+                )
+
+            series = compute_indicators(
+                hist_data,
+                indicators,
+                interval,
+                window=window,
+                rsi_period=rsi_period,
+                macd_fast=macd_fast,
+                macd_slow=macd_slow,
+                macd_signal=macd_signal,
+                bollinger_std=bollinger_std,
+                atr_period=atr_period,
+            )
+            cached = (hist_data.index, series)
+            indicator_cache.set(key, cached)
+
+        index, series = cached
+        dates = [str(ts) for ts in index[-limit:]]
+        indicator_values = {}
+        for name, values in series.items():
+            indicator_values[name] = _to_json_list(values[-limit:])
+
+        if ctx:
+            await ctx.info(f"✅ Computed {len(indicator_values)} indicator series for {ticker}")
+
+        return TechnicalIndicatorsResponse(
+            ticker=ticker,
+            period=period,
+            interval=interval,
+            dates=dates,
+            indicators=indicator_values,
+            count=len(dates)
+        )
+
+    except TickerNotFoundError as e:
+        note_error(e)
+        if ctx:
+            await ctx.warning(f"⚠️  Ticker {ticker} not found")
+        return TickerValidationError(
+            error=f"Ticker '{ticker}' not found",
+            ticker=ticker,
+            suggestion="Check the symbol or try with exchange suffix (e.g., AAPL.MX for Mexico)"
+        )
+
+    except Exception as e:
+        note_error(e)
+        if ctx:
+            await ctx.error(f"❌ Error computing indicators for {ticker}: {str(e)}")
+        return TickerValidationError(
+            error=f"Internal error: {str(e)}",
+            ticker=ticker
+        )
+
+
+# ============================================================================
+# TOOL 12: GET INDICATOR SNAPSHOT
+# ============================================================================
+
+@mcp.tool(
+    name="get_indicator_snapshot",
+    description="Get the latest EMA, RSI and rolling volatility for a watchlist of tickers, updated incrementally on each call"
+)
+@instrumented
+async def get_indicator_snapshot(
+    tickers: list[str] = Field(description="Ticker symbols to refresh (e.g., ['AAPL', 'MSFT', 'NVDA'])", min_length=1, max_length=500),
+    interval: Literal["1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo"] = Field(
+        default="1d",
+        description="Bar granularity: '1m'=1 minute, '1h'=1 hour, '1d'=1 day"
+    ),
+    ema_span: int = Field(default=20, ge=2, le=500, description="EMA span in bars (e.g., 200 for the 200-day EMA)"),
+    rsi_period: int = Field(default=14, ge=2, le=500, description="RSI lookback period in bars"),
+    volatility_window: int = Field(default=20, ge=2, le=500, description="Rolling volatility window in bars"),
+    ctx: Context | None = None
+) -> IndicatorSnapshotResponse:
+    """
+    Return current indicator values for many tickers at once.
+    State is kept server-side per ticker and interval, so repeated refreshes only process new bars.
+    """
+    if ctx:
+        await ctx.info(f"🔁 Refreshing indicators for {len(tickers)} tickers (interval={interval})")
+        ctx.request_context.lifespan_context.request_count += 1
+
+    params = IndicatorParams(ema_span=ema_span, rsi_period=rsi_period, volatility_window=volatility_window)
+    results, failures = await fetch_batch(advance_indicators, list(dict.fromkeys(tickers)), interval, params)
+    snapshots = [
+        IndicatorSnapshot(ticker=ticker, new_bars=new_bars, **values)
+        for ticker, (new_bars, values) in results.items()
+    ]
+    errors = []
+
+    for ticker, e in failures.items():
+        if isinstance(e, TickerNotFoundError):
+            errors.append(TickerValidationError(
+                error=f"Ticker '{ticker}' not found",
+                ticker=ticker,
+                suggestion="Check the symbol or try with exchange suffix (e.g., AAPL.MX for Mexico)"
+            ))
+            continue
+        if ctx:
+            await ctx.error(f"❌ Error refreshing indicators for {ticker}: {str(e)}")
+        errors.append(TickerValidationError(
+            error=f"Internal error: {str(e)}",
+            ticker=ticker
+        ))
+
+    if ctx:
+        await ctx.info(f"✅ Refreshed {len(snapshots)} tickers ({len(errors)} failed)")
+
+    return IndicatorSnapshotResponse(
+        interval=interval,
+        ema_span=ema_span,
+        rsi_period=rsi_period,
+        volatility_window=volatility_window,
+        snapshots=snapshots,
+        errors=errors,
+        count=len(snapshots)
+    )
+
+
+# ============================================================================
+# TOOL 13: GET CORRELATION MATRIX
+# ============================================================================
+
+@mcp.tool(
+    name="get_correlation_matrix",
+    description="Get the correlation and covariance matrix of log returns across many tickers, or only the most correlated pairs"
+)
+@instrumented
+async def get_correlation_matrix(
+    tickers: list[str] = Field(description="Ticker symbols to compare (e.g., ['AAPL', 'MSFT', 'GOOGL'])", min_length=2),
+    period: Literal["1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"] = Field(
+        default="1y",
+        description="History window used for returns: '3mo'=3 months, '1y'=1 year, '5y'=5 years"
+    ),
+    interval: Literal["1h", "1d", "1wk", "1mo"] = Field(
+        default="1d",
+        description="Return frequency: '1d'=daily, '1wk'=weekly, '1mo'=monthly"
+    ),
+    top_k: int = Field(default=0, ge=0, le=1000, description="If greater than 0, return only the k most strongly correlated pairs instead of full matrices"),
+    ctx: Context | None = None
+) -> CorrelationMatrixResponse | TickerValidationError:
+    """
+    Compute pairwise return correlations for a portfolio in one call.
+    Close prices are batch-fetched, aligned on common dates, and reduced with vectorized NumPy.
+    """
+    tickers = list(dict.fromkeys(tickers))
+    ticker_list = ", ".join(tickers)
+
+    if ctx:
+        await ctx.info(f"🔗 Computing correlations for {len(tickers)} tickers (period={period}, interval={interval})")
+        ctx.request_context.lifespan_context.request_count += 1
+
+    if len(tickers) > config.analytics.max_tickers:
+        return TickerValidationError(
+            error=f"Too many tickers: {len(tickers)} (maximum {config.analytics.max_tickers})",
+            ticker=ticker_list,
+            suggestion="Split the request into smaller groups"
+        )
+
+    try:
+        frames, failures = await fetch_history_batch(tickers, period, interval)
+        errors = _ticker_errors(failures)
+
+        if len(frames) < 2:
+            return TickerValidationError(
+                error="At least two tickers with price data are required",
+                ticker=ticker_list,
+                suggestion="Check the symbols or try a longer period"
+            )
+
+        aligned = align_closes(frames, interval)
+        budget = config.analytics.memory_budget_mb * 1024 * 1024
+        if estimate_matrix_bytes(len(aligned), aligned.shape[1]) > budget:
+            return TickerValidationError(
+                error=f"Request exceeds the {config.analytics.memory_budget_mb:g} MB analytics memory budget",
+                ticker=ticker_list,
+                suggestion="Use fewer tickers, a shorter period or a coarser interval"
+            )
+
+        covariance, correlation, observations = return_statistics(aligned.to_numpy(dtype=np.float64))
+        included = list(aligned.columns)
+
+        if ctx:
+            await ctx.info(f"✅ Computed {len(included)}x{len(included)} correlations over {observations} returns")
+
+        if top_k:
+            pairs = [
+                CorrelationPair(
+                    ticker_a=included[i],
+                    ticker_b=included[j],
+                    correlation=value if np.isfinite(value) else None,
+                    covariance=float(covariance[i, j])
+                )
+                for i, j, value in top_pairs(correlation, top_k)
+            ]
+            return CorrelationMatrixResponse(
+                tickers=included,
+                period=period,
+                interval=interval,
+                observations=observations,
+                top_pairs=pairs,
+                errors=errors
+            )
+
+        return CorrelationMatrixResponse(
+            tickers=included,
+            period=period,
+            interval=interval,
+            observations=observations,
+            correlation=_to_json_list(correlation),
+            covariance=_to_json_list(covariance),
+            errors=errors
+        )
+
+    except Exception as e:
+        note_error(e)
+        if ctx:
+            await ctx.error(f"❌ Error computing correlations: {str(e)}")
+        return TickerValidationError(
+            error=f"Internal error: {str(e)}",
+            ticker=ticker_list
+        )
+
+
+# ============================================================================
+# TOOL 14: GET IV SURFACE
+# ============================================================================
+
+@mcp.tool(
+    name="get_iv_surface",
+    description="Build an implied volatility surface (moneyness x tenor) and ATM term structure from option chains"
+)
+@instrumented
+async def get_iv_surface(
+    ticker: str = Field(description="Stock ticker symbol with listed options (e.g., 'AAPL', 'SPY')"),
+    max_expirations: int = Field(default=8, ge=1, le=40, description="Number of nearest expirations to fit"),
+    moneyness: list[float] = Field(
+        default=DEFAULT_MONEYNESS_GRID,
+        min_length=1,
+        description="Strike / underlying price grid points (e.g., [0.9, 1.0, 1.1])"
+    ),
+    tenor_days: list[float] = Field(
+        default=DEFAULT_TENOR_DAYS,
+        min_length=1,
+        description="Tenor grid points in calendar days (e.g., [30, 60, 90])"
+    ),
+    ctx: Context | None = None
+) -> IVSurfaceResponse | TickerValidationError:
+    """
+    Fit a quadratic smile in log-moneyness to each expiration's out-of-the-money quotes
+    and interpolate total variance across expirations onto the requested grid.
+    Fitted smiles are cached per ticker, so re-gridding the same surface is cheap.
+    """
+    if ctx:
+        await ctx.info(f"🌋 Building implied volatility surface for {ticker}")
+        ctx.request_context.lifespan_context.request_count += 1
+
+    if any(point <= 0 for point in moneyness) or any(days <= 0 for days in tenor_days):
+        return TickerValidationError(
+            error="Moneyness and tenor grid points must be positive",
+            ticker=ticker
+        )
+
+    try:
+        spot, smiles = await fetch_volatility_smiles(ticker, max_expirations)
+        if not smiles:
+            return TickerValidationError(
+                error=f"No usable implied volatility quotes for {ticker}",
+                ticker=ticker,
+                suggestion="Try again during market hours or check get_option_chain"
+            )
+
+        moneyness = sorted(moneyness)
+        tenor_days = sorted(tenor_days)
+        surface = interpolate_surface(smiles, moneyness, tenor_days)
+
+        if ctx:
+            await ctx.info(f"✅ Fitted {len(smiles)} expirations for {ticker}")
+
+        return IVSurfaceResponse(
+            ticker=ticker,
+            underlying_price=spot,
+            moneyness=moneyness,
+            tenor_days=tenor_days,
+            implied_volatility=_to_json_list(surface),
+            term_structure=[
+                TermStructurePoint(
+                    expiration_date=smile.expiration_date,
+                    tenor_days=round(smile.years * 365.0, 2),
+                    atm_iv=smile.atm_iv,
+                    contracts=smile.contracts
+                )
+                for smile in smiles
+            ]
+        )
+
+    except TickerNotFoundError as e:
+        note_error(e)
+        if ctx:
+            await ctx.warning(f"⚠️  Ticker {ticker} not found")
+        return TickerValidationError(
+            error=f"Ticker '{ticker}' not found",
+            ticker=ticker,
+            suggestion="Check the symbol or try with exchange suffix (e.g., AAPL.MX for Mexico)"
+        )
+
+    except ValueError as e:
+        note_error(e)
+        return TickerValidationError(
+            error=str(e),
+            ticker=ticker,
+            suggestion="Use get_option_expiration_dates to check listed options"
+        )
+
+    except Exception as e:
+        note_error(e)
+        if ctx:
+            await ctx.error(f"❌ Error building volatility surface for {ticker}: {str(e)}")
+        return TickerValidationError(
+            error=f"Internal error: {str(e)}",
+            ticker=ticker
+        )
+
+
+# ============================================================================
+# TOOL 15: EXPORT DATASET
+# ============================================================================
+
+@mcp.tool(
+    name="export_dataset",
+    description="Write price history, financial statements or option chains for many tickers to a Parquet or Arrow IPC file and return its location instead of the data"
+)
+@instrumented
+async def export_dataset(
+    tickers: list[str] = Field(description="Ticker symbols to export (e.g., ['AAPL', 'MSFT', 'GOOGL'])", min_length=1),
+    dataset: Literal["history", "financials", "options"] = Field(
+        description="'history'=OHLCV bars, 'financials'=one financial statement per ticker, 'options'=calls and puts of the nearest expirations"
+    ),
+    file_format: Literal["parquet", "arrow"] = Field(
+        default="parquet",
+        description="'parquet' or 'arrow' (Arrow IPC file, also readable as Feather v2)"
+    ),
+    period: Literal["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"] = Field(
+        default="1y",
+        description="History window for dataset='history': '1mo'=1 month, '1y'=1 year, 'max'=all available data"
+    ),
+    interval: Literal["1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo"] = Field(
+        default="1d",
+        description="Bar size for dataset='history': '1h'=1 hour, '1d'=1 day, '1wk'=1 week"
+    ),
+    financial_type: FinancialType = Field(
+        default=FinancialType.income_stmt,
+        description="Statement for dataset='financials': 'income_stmt', 'balance_sheet', 'cashflow' or their 'quarterly_' versions"
+    ),
+    max_expirations: int = Field(default=1, ge=1, le=60, description="Nearest expirations per ticker for dataset='options'"),
+    file_name: str | None = Field(
+        default=None,
+        description="New file name in the export directory (default: dataset, UTC time and a random suffix); the extension is added"
+    ),
+    ctx: Context | None = None
+) -> ExportDatasetResponse | TickerValidationError:
+    """
+    Export a dataset for a ticker list to a columnar file under the configured export directory.
+    Tickers are fetched in groups of the batch fetch size and written in fixed-size row groups
+    as they arrive, so memory stays bounded however many tickers are exported.
+    """
+    tickers = list(dict.fromkeys(tickers))
+    ticker_list = ", ".join(tickers)
+
+    if ctx:
+        await ctx.info(f"📦 Exporting {dataset} for {len(tickers)} tickers to {file_format}")
+        ctx.request_context.lifespan_context.request_count += 1
+
+    if len(tickers) > config.analytics.max_tickers:
+        return TickerValidationError(
+            error=f"Too many tickers: {len(tickers)} (maximum {config.analytics.max_tickers})",
+            ticker=ticker_list,
+            suggestion="Split the export into several files"
+        )
+
+    if not pyarrow_available():
+        return TickerValidationError(
+            error="Exports need pyarrow, which is not installed",
+            ticker=ticker_list,
+            suggestion="Install the 'export' extra (uv sync --extra export)"
+        )
+
+    try:
+        path = export_path(config.export.directory, file_name, dataset, file_format)
+    except ValueError as e:
+        return TickerValidationError(error=str(e), ticker=ticker_list)
+
+    if dataset == "history":
+        fetch, arguments = fetch_history, (period, interval, False)
+    elif dataset == "financials":
+        fetch, arguments = fetch_statement, (financial_type.value,)
+    else:
+        fetch, arguments = fetch_option_chains, (max_expirations,)
+
+    try:
+        exported, errors = [], []
+        with DatasetWriter(path, SCHEMAS[dataset](), file_format, config.export.row_group_size) as writer:
+            group = config.analytics.fetch_workers
+            for start in range(0, len(tickers), group):
+                results, failures = await fetch_batch(fetch, tickers[start:start + group], *arguments)
+                errors.extend(_ticker_errors(failures))
+
+                # Converting and writing row groups is CPU and disk work; keep it off the event loop
+                written, empty = await run_blocking(write_results, writer, dataset, results, financial_type.value)
+                exported.extend(written)
+                errors.extend(
+                    TickerValidationError(error=f"No {dataset} data available for {ticker}", ticker=ticker)
+                    for ticker in empty
+                )
+
+                if ctx:
+                    await ctx.report_progress(min(start + group, len(tickers)), len(tickers))
+
+            if not exported:
+                writer.abort()
+                return TickerValidationError(
+                    error=f"No {dataset} data available for any of the {len(tickers)} tickers",
+                    ticker=ticker_list,
+                    suggestion="Check the symbols or try a longer period"
+                )
+            size = await run_blocking(writer.close)
+
+        if ctx:
+            await ctx.info(f"✅ Wrote {writer.rows} rows for {len(exported)} tickers to {path}")
+
+        return ExportDatasetResponse(
+            dataset=dataset,
+            file_format=file_format,
+            path=str(path),
+            uri=path.as_uri(),
+            tickers=exported,
+            rows=writer.rows,
+            row_groups=writer.row_groups,
+            size_bytes=size,
+            columns=writer.schema.names,
+            errors=errors
+        )
+
+    except FileExistsError:
+        return TickerValidationError(
+            error=f"'{path.name}' already exists" if path.exists() else f"An export to '{path.name}' is already in progress",
+            ticker=ticker_list,
+            suggestion="Use another file_name or leave it unset"
+        )
+    except Exception as e:
+        note_error(e)
+        if ctx:
+            await ctx.error(f"❌ Error exporting {dataset}: {str(e)}")
+        return TickerValidationError(
+            error=f"Internal error: {str(e)}",
+            ticker=ticker_list
+        )
+
+
+# ============================================================================
+# HTTP ROUTES
+# ============================================================================
+
+if config.http.metrics_enabled:
+    @mcp.custom_route("/metrics", methods=["GET"])
+    async def metrics_endpoint(request: Request) -> Response:
+        """Prometheus scrape endpoint, served next to /mcp on the HTTP transport."""
+        return Response(registry.render(), media_type=CONTENT_TYPE)
+
+
 # ============================================================================
 # MAIN ENTRY POINT
 # ============================================================================
@@ -0,0 +1,59 @@
+"""
+Runtime telemetry: Prometheus-style metrics, per-request traces, spans, profiles and the slow-request log.
+"""
+from .metrics import CONTENT_TYPE, MetricsRegistry, registry
+from .tracing import (
+    ConsoleSpanExporter,
+    JsonFileSpanExporter,
+    OTLPHttpSpanExporter,
+    Span,
+    SpanExporter,
+    Tracer,
+    tracer_from_config,
+)
+from .context import (
+    STAGES,
+    RequestTrace,
+    UpstreamCall,
+    current_trace,
+    instrumented,
+    note_cache_lookup,
+    note_error,
+    record_upstream,
+    stage,
+    upstream_call,
+)
+from .profiling import Profiler, profiler_from_config
+from .slowlog import SlowRequestLog, slow_log_from_config
+from .upstream import InstrumentedTicker, payload_bytes
+from .server import TracedFastMCP
+
+__all__ = [
+    "CONTENT_TYPE",
+    "MetricsRegistry",
+    "registry",
+    "ConsoleSpanExporter",
+    "JsonFileSpanExporter",
+    "OTLPHttpSpanExporter",
+    "Span",
+    "SpanExporter",
+    "Tracer",
+    "tracer_from_config",
+    "STAGES",
+    "RequestTrace",
+    "UpstreamCall",
+    "current_trace",
+    "instrumented",
+    "note_cache_lookup",
+    "note_error",
+    "record_upstream",
+    "stage",
+    "upstream_call",
+    "Profiler",
+    "profiler_from_config",
+    "SlowRequestLog",
+    "slow_log_from_config",
+    "InstrumentedTicker",
+    "payload_bytes",
+    "TracedFastMCP",
+]
@@ -0,0 +1,263 @@
+"""
+Per-request trace state and tool instrumentation.
+
+Each tool call gets a RequestTrace held in a context variable, so helpers
+deeper in the call (market data fetches, error handlers) can attach
+information to the request that triggered them.
+
+A request is split into stages:
+
+- ``validate``: argument validation by FastMCP before the tool body runs
+- ``fetch``: time spent in Yahoo Finance calls
+- ``convert``: the rest of the tool body (DataFrame work, model construction)
+- ``serialize``: conversion of the returned model into MCP content
+
+Sampled requests also record a span per stage and per upstream call.
+"""
+import functools
+import inspect
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterator, TypeVar
+
+from src.models import TickerValidationError
+
+from .metrics import tool_duration, tool_errors, tool_requests, upstream_bytes, upstream_duration, upstream_errors
+from . import profiling, slowlog, tracing
+from .tracing import Span, new_span_id, new_trace_id
+
+STAGES = ("validate", "fetch", "convert", "serialize")
+
+
+@dataclass
+class UpstreamCall:
+    """One call to Yahoo Finance made while serving a request."""
+    endpoint: str
+    duration: float = 0.0
+    bytes: int = 0
+    outcome: str = "ok"  # "ok", "empty" or the exception type name
+
+    @property
+    def ok(self) -> bool:
+        return self.outcome in ("ok", "empty")
+
+
+@dataclass
+class RequestTrace:
+    """Telemetry collected over one tool call."""
+    tool: str
+    started: float = field(default_factory=time.perf_counter)
+    started_ns: int = field(default_factory=time.time_ns)
+    error_type: str | None = None
+    upstream: list[UpstreamCall] = field(default_factory=list)
+    stages: dict[str, float] = field(default_factory=dict)
+    sampled: bool = False
+    trace_id: str = field(default_factory=new_trace_id)
+    root_span_id: str = field(default_factory=new_span_id)
+    spans: list[Span] = field(default_factory=list)
+    arguments: dict[str, Any] = field(default_factory=dict)
+    cache: dict[str, list[int]] = field(default_factory=dict)  # cache name -> [hits, misses]
+    result: Any = None
+    response_bytes: int | None = None
+
+    def upstream_summary(self) -> list[dict]:
+        """Upstream calls grouped by endpoint, slowest total first."""
+        grouped: dict[str, dict] = {}
+        for call in self.upstream:
+            entry = grouped.setdefault(call.endpoint, {"endpoint": call.endpoint, "calls": 0, "seconds": 0.0, "bytes": 0})
+            entry["calls"] += 1
+            entry["seconds"] += call.duration
+            entry["bytes"] += call.bytes
+        return sorted(grouped.values(), key=lambda entry: entry["seconds"], reverse=True)
+
+    def stage_timings(self) -> dict[str, float]:
+        """Seconds per stage; fetch is carved out of the tool body time."""
+        fetch = sum(call.duration for call in self.upstream)
+        body = self.stages.get("execute", 0.0)
+        return {
+            "validate": self.stages.get("validate", 0.0),
+            "fetch": fetch,
+            "convert": max(body - fetch, 0.0),
+            "serialize": self.stages.get("serialize", 0.0),
+        }
+
+
+current_trace: ContextVar[RequestTrace | None] = ContextVar("current_trace", default=None)
+current_span_id: ContextVar[str | None] = ContextVar("current_span_id", default=None)
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+def note_error(exc: BaseException) -> None:
+    """Record the exception behind an error response on the current trace."""
+    trace = current_trace.get()
+    if trace is not None:
+        trace.error_type = type(exc).__name__
+
+
+def note_cache_lookup(cache: str, hit: bool) -> None:
+    """Count a cache lookup against the current request."""
+    trace = current_trace.get()
+    if trace is not None:
+        counts = trace.cache.setdefault(cache, [0, 0])
+        counts[0 if hit else 1] += 1
+
+
+def _add_span(
+    trace: RequestTrace, name: str, start_ns: int, end_ns: int, error: str | None = None, span_id: str | None = None, **attributes
+) -> Span:
+    span = Span(
+        name=name,
+        trace_id=trace.trace_id,
+        span_id=span_id or new_span_id(),
+        parent_id=current_span_id.get() or trace.root_span_id,
+        start_ns=start_ns,
+        end_ns=end_ns,
+        attributes=attributes,
+        error=error,
+    )
+    trace.spans.append(span)
+    return span
+
+
+def record_upstream(call: UpstreamCall) -> None:
+    """Add a finished upstream call to the metrics and the current request trace."""
+    upstream_duration.observe(call.duration, endpoint=call.endpoint)
+    upstream_bytes.inc(call.bytes, endpoint=call.endpoint)
+    if not call.ok:
+        upstream_errors.inc(endpoint=call.endpoint)
+    trace = current_trace.get()
+    if trace is not None:
+        trace.upstream.append(call)
+        if trace.sampled:
+            end_ns = time.time_ns()
+            _add_span(
+                trace, f"yfinance.{call.endpoint}", end_ns - int(call.duration * 1e9), end_ns,
+                error=None if call.ok else call.outcome, bytes=call.bytes, outcome=call.outcome,
+            )
+
+
+@contextmanager
+def upstream_call(endpoint: str) -> Iterator[UpstreamCall]:
+    """
+    Time a Yahoo Finance call and attribute it to the current request.
+
+    The yielded record may be updated with the payload size and outcome
+    before the block exits; exceptions are recorded as the outcome.
+    """
+    call = UpstreamCall(endpoint)
+    start = time.perf_counter()
+    try:
+        yield call
+    except BaseException as exc:
+        call.outcome = type(exc).__name__
+        raise
+    finally:
+        call.duration = time.perf_counter() - start
+        record_upstream(call)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a stage of the current request, as a span when the request is sampled."""
+    trace = current_trace.get()
+    if trace is None:
+        yield
+        return
+
+    start, start_ns = time.perf_counter(), time.time_ns()
+    span_id = new_span_id() if trace.sampled else None
+    token = current_span_id.set(span_id) if span_id else None
+    error = None
+    try:
+        yield
+    except BaseException as exc:
+        error = type(exc).__name__
+        raise
+    finally:
+        trace.stages[name] = trace.stages.get(name, 0.0) + time.perf_counter() - start
+        if token is not None:
+            current_span_id.reset(token)
+            _add_span(trace, name, start_ns, time.time_ns(), error=error, span_id=span_id)
+
+
+def begin_request(tool: str, arguments: dict[str, Any] | None = None) -> Token:
+    """Start the trace for a tool call and make it current."""
+    trace = RequestTrace(tool, sampled=tracing.tracer.should_sample(), arguments=arguments or {})
+    return current_trace.set(trace)
+
+
+def end_request(trace: RequestTrace, token: Token) -> None:
+    """Publish metrics and sampled spans for a finished tool call."""
+    current_trace.reset(token)
+    duration = time.perf_counter() - trace.started
+    tool_requests.inc(tool=trace.tool)
+    tool_duration.observe(duration, tool=trace.tool)
+    if trace.error_type is not None:
+        tool_errors.inc(tool=trace.tool, type=trace.error_type)
+
+    if trace.sampled:
+        root = Span(
+            name=f"tool.{trace.tool}",
+            trace_id=trace.trace_id,
+            span_id=trace.root_span_id,
+            parent_id=None,
+            start_ns=trace.started_ns,
+            end_ns=trace.started_ns + int(duration * 1e9),
+            attributes={"mcp.tool": trace.tool, "upstream.calls": len(trace.upstream)},
+            error=trace.error_type,
+        )
+        tracing.tracer.export([root, *trace.spans])
+
+    if slowlog.slow_log is not None:
+        slowlog.slow_log.record(trace, duration)
+
+
+def instrumented(func: F) -> F:
+    """
+    Count, time and classify calls to a tool.
+
+    Apply below ``@mcp.tool`` so the registered tool keeps the wrapped
+    function's signature. A call counts as an error when it raises or returns
+    a TickerValidationError; the type is the exception noted by the tool's
+    handler, or ``validation`` for input errors.
+
+    Calls arriving through TracedFastMCP join the request the server already
+    started, which is finished after serialization; direct calls start and
+    finish their own.
+    """
+    tool = func.__name__
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        trace = current_trace.get()
+        token = None
+        if trace is None or trace.tool != tool or "execute" in trace.stages:
+            bound = signature.bind_partial(*args, **kwargs)
+            token = begin_request(tool, bound.arguments)
+            trace = current_trace.get()
+        else:
+            trace.stages["validate"] = time.perf_counter() - trace.started
+            if trace.sampled:
+                _add_span(trace, "validate", trace.started_ns, time.time_ns())
+
+        profiler = profiling.profiler
+        try:
+            with stage("execute"), profiler.profile(tool) if profiler else nullcontext():
+                result = await func(*args, **kwargs)
+        except Exception as exc:
+            trace.error_type = type(exc).__name__
+            raise
+        else:
+            if isinstance(result, TickerValidationError) and trace.error_type is None:
+                trace.error_type = "validation"
+            trace.result = result
+            return result
+        finally:
+            if token is not None:
+                end_request(trace, token)
+
+    return wrapper
@@ -0,0 +1,122 @@
+"""
+Opt-in profiling of sampled tool calls.
+
+Sampled calls run under cProfile and their stats are aggregated per tool,
+so one dump per tool covers many invocations. Tools listed for memory
+profiling also take a tracemalloc snapshot of the call.
+
+cProfile observes the whole thread, so on a busy event loop a tool's
+profile also includes work of requests that ran while it was awaiting.
+"""
+import cProfile
+import pstats
+import random
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from src.config import ProfilingConfig, config
+
+
+class Profiler:
+    """Samples tool calls and keeps aggregated cProfile stats per tool."""
+
+    def __init__(
+        self,
+        output_dir: str,
+        sample_ratio: float = 0.05,
+        memory_tools: tuple[str, ...] = (),
+        dump_every: int = 20,
+        top_allocations: int = 25,
+    ):
+        self.output_dir = Path(output_dir)
+        self.sample_ratio = sample_ratio
+        self.memory_tools = frozenset(memory_tools)
+        self.dump_every = dump_every
+        self.top_allocations = top_allocations
+        self.stats: dict[str, pstats.Stats] = {}
+        self.samples: dict[str, int] = {}
+        # Only one cProfile can be active per process at a time
+        self._active = threading.Lock()
+
+    @contextmanager
+    def profile(self, tool: str) -> Iterator[None]:
+        """Profile the enclosed call if it is sampled and no other profile is running."""
+        if random.random() >= self.sample_ratio or not self._active.acquire(blocking=False):
+            yield
+            return
+
+        trace_memory = tool in self.memory_tools
+        started_tracing = trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        elif trace_memory:
+            tracemalloc.reset_peak()
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+            try:
+                yield
+            finally:
+                profile.disable()
+                if trace_memory:
+                    self._write_memory_snapshot(tool)
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+            self._active.release()
+            self._add(tool, profile)
+
+    def _add(self, tool: str, profile: cProfile.Profile) -> None:
+        if tool in self.stats:
+            self.stats[tool].add(profile)
+        else:
+            self.stats[tool] = pstats.Stats(profile)
+        self.samples[tool] = self.samples.get(tool, 0) + 1
+        if self.samples[tool] % self.dump_every == 0:
+            self.dump(tool)
+
+    def _write_memory_snapshot(self, tool: str) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        lines = [f"# {tool} current={current} peak={peak} bytes"]
+        lines.extend(str(stat) for stat in snapshot.statistics("lineno")[: self.top_allocations])
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / f"{tool}-{time.strftime('%Y%m%d-%H%M%S')}-{time.monotonic_ns() % 1_000_000:06d}.mem.txt"
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    def dump(self, tool: str | None = None) -> list[Path]:
+        """
+        Write aggregated stats to ``<output_dir>/<tool>.prof``.
+
+        The files load with ``pstats.Stats(path)`` or snakeviz.
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        written = []
+        for name in [tool] if tool else list(self.stats):
+            path = self.output_dir / f"{name}.prof"
+            self.stats[name].dump_stats(path)
+            written.append(path)
+        return written
+
+
+def profiler_from_config(settings: ProfilingConfig) -> Profiler | None:
+    """Build the profiler described by the profiling configuration, or None if disabled."""
+    if not settings.enabled:
+        return None
+    return Profiler(
+        output_dir=settings.output_dir,
+        sample_ratio=settings.sample_ratio,
+        memory_tools=tuple(settings.memory_tools),
+        dump_every=settings.dump_every,
+    )
+
+
+profiler = profiler_from_config(config.profiling)
@@ -0,0 +1,60 @@
+"""
+FastMCP server that traces the whole tool call, including serialization.
+"""
+from typing import Any, Sequence
+
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.types import ContentBlock
+
+from src.config import config
+from src.serialization import convert_result
+
+from .context import begin_request, current_trace, end_request, stage
+
+
+def content_bytes(content: Any) -> int:
+    """Size of the text carried by converted tool output."""
+    if isinstance(content, tuple):
+        # (unstructured content blocks, structured content)
+        blocks = content[0]
+    else:
+        blocks = content if isinstance(content, (list, tuple)) else [content]
+    return sum(len(getattr(block, "text", "") or "") for block in blocks)
+
+
+class TracedFastMCP(FastMCP):
+    """
+    FastMCP whose tool calls run inside a request trace.
+
+    FastMCP converts a tool's return value into MCP content after the tool
+    function returns; running that conversion here lets it be timed as the
+    ``serialize`` stage of the same request. Model results are converted by
+    src.serialization unless ``fast_serialization`` is turned off.
+    """
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> Sequence[ContentBlock] | dict[str, Any]:
+        tool = self._tool_manager.get_tool(name)
+        if tool is None:
+            return await super().call_tool(name, arguments)
+
+        context = self.get_context()
+        token = begin_request(name, arguments)
+        trace = current_trace.get()
+        try:
+            result = await tool.run(arguments, context=context, convert_result=False)
+            with stage("serialize"):
+                if config.fast_serialization:
+                    content = convert_result(tool.fn_metadata, result)
+                else:
+                    content = tool.fn_metadata.convert_result(result)
+            trace.response_bytes = content_bytes(content)
+            return content
+        except ToolError:
+            trace.error_type = trace.error_type or "ToolError"
+            raise
+        except Exception as e:
+            trace.error_type = type(e).__name__
+            raise ToolError(f"Error executing tool {name}: {e}") from e
+        finally:
+            end_request(trace, token)
@@ -0,0 +1,121 @@
+"""
+Structured log of tool calls slower than a threshold.
+
+Each slow call is written as one JSON line with the normalized arguments,
+stage timings, upstream calls, response size and cache status, so a slow
+request can be explained without reproducing it.
+"""
+import enum
+import json
+import sys
+import threading
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, TextIO
+
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+
+from src.config import SlowLogConfig, config
+
+if TYPE_CHECKING:
+    from .context import RequestTrace
+
+MAX_STRING = 200
+MAX_ITEMS = 20
+
+
+def normalize_arg(value: Any) -> Any:
+    """JSON-safe, size-bounded form of a tool argument."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (bool, int, float)) or value is None:
+        return value
+    if isinstance(value, str):
+        return value if len(value) <= MAX_STRING else value[:MAX_STRING] + "..."
+    if isinstance(value, (list, tuple, set)):
+        items = [normalize_arg(item) for item in list(value)[:MAX_ITEMS]]
+        if len(value) > MAX_ITEMS:
+            items.append(f"... {len(value) - MAX_ITEMS} more")
+        return items
+    if isinstance(value, dict):
+        return {str(key): normalize_arg(item) for key, item in sorted(value.items())}
+    return type(value).__name__
+
+
+def normalize_args(arguments: dict[str, Any]) -> dict[str, Any]:
+    """Sorted, size-bounded arguments without the MCP context or unfilled defaults."""
+    return {
+        name: normalize_arg(value)
+        for name, value in sorted(arguments.items())
+        if name != "ctx" and not isinstance(value, FieldInfo)
+    }
+
+
+def response_bytes(trace: "RequestTrace") -> int | None:
+    """Size of the serialized response, serializing a model only if needed."""
+    if trace.response_bytes is not None:
+        return trace.response_bytes
+    if isinstance(trace.result, BaseModel):
+        return len(trace.result.model_dump_json())
+    return None
+
+
+def cache_status(lookups: dict[str, list[int]]) -> str:
+    """'hit', 'miss' or 'partial' over all cache lookups of a request, 'none' without any."""
+    hits = sum(counts[0] for counts in lookups.values())
+    misses = sum(counts[1] for counts in lookups.values())
+    if hits + misses == 0:
+        return "none"
+    if misses == 0:
+        return "hit"
+    return "miss" if hits == 0 else "partial"
+
+
+class SlowRequestLog:
+    """Appends a JSON line for every request at or above the threshold."""
+
+    def __init__(self, threshold_ms: float, path: str | None = None, stream: TextIO | None = None):
+        self.threshold = threshold_ms / 1000.0
+        self.path = path
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def record(self, trace: "RequestTrace", duration: float) -> dict[str, Any] | None:
+        """Write the request if it was slow; returns the written record."""
+        if duration < self.threshold:
+            return None
+
+        entry = {
+            "ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "tool": trace.tool,
+            "duration_ms": round(duration * 1000, 3),
+            "error_type": trace.error_type,
+            "args": normalize_args(trace.arguments),
+            "stages_ms": {name: round(seconds * 1000, 3) for name, seconds in trace.stage_timings().items()},
+            "upstream_calls": len(trace.upstream),
+            "upstream": [
+                {**endpoint, "seconds": round(endpoint["seconds"], 6)} for endpoint in trace.upstream_summary()
+            ],
+            "response_bytes": response_bytes(trace),
+            "cache": cache_status(trace.cache),
+            "cache_lookups": {name: {"hits": counts[0], "misses": counts[1]} for name, counts in trace.cache.items()},
+            "trace_id": trace.trace_id if trace.sampled else None,
+        }
+        line = json.dumps(entry, default=str) + "\n"
+        with self._lock:
+            if self.path:
+                with open(self.path, "a", encoding="utf-8") as handle:
+                    handle.write(line)
+            else:
+                (self.stream or sys.stderr).write(line)
+        return entry
+
+
+def slow_log_from_config(settings: SlowLogConfig) -> SlowRequestLog | None:
+    """Build the slow-request log described by the configuration, or None if disabled."""
+    if not settings.enabled:
+        return None
+    return SlowRequestLog(settings.threshold_ms, settings.path)
+
+
+slow_log = slow_log_from_config(config.slow_log)
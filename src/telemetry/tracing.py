@@ -0,0 +1,207 @@
+"""
+Lightweight span tracing with pluggable exporters.
+
+Spans follow the OpenTelemetry data model closely enough to be exported as
+OTLP/HTTP JSON to a local collector, without depending on the OpenTelemetry
+SDK. Sampling is decided once per request, at the root span.
+"""
+import json
+import os
+import queue
+import random
+import sys
+import threading
+import urllib.request
+from dataclasses import dataclass, field
+from typing import Any, TextIO
+
+from src.config import TracingConfig, config
+
+
+@dataclass
+class Span:
+    """One timed operation within a request."""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_ns: int
+    end_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def duration(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round(self.duration * 1000, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+def new_trace_id() -> str:
+    return os.urandom(16).hex()
+
+
+def new_span_id() -> str:
+    return os.urandom(8).hex()
+
+
+class SpanExporter:
+    """Receives the finished spans of each sampled request."""
+
+    def export(self, spans: list[Span]) -> None:
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        pass
+
+
+class ConsoleSpanExporter(SpanExporter):
+    """Writes an indented span tree to stderr (stdout carries the STDIO transport)."""
+
+    def __init__(self, stream: TextIO | None = None):
+        self.stream = stream or sys.stderr
+
+    def export(self, spans: list[Span]) -> None:
+        depth = {None: -1}
+        lines = []
+        for span in sorted(spans, key=lambda span: span.start_ns):
+            depth[span.span_id] = depth.get(span.parent_id, -1) + 1
+            status = f" ! {span.error}" if span.error else ""
+            lines.append(f"[trace {span.trace_id[:8]}] {'  ' * depth[span.span_id]}{span.name} {span.duration * 1000:.1f} ms{status}")
+        print("\n".join(lines), file=self.stream, flush=True)
+
+
+class JsonFileSpanExporter(SpanExporter):
+    """Appends one JSON object per span to a file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: list[Span]) -> None:
+        payload = "".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans)
+        with self._lock, open(self.path, "a", encoding="utf-8") as handle:
+            handle.write(payload)
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class OTLPHttpSpanExporter(SpanExporter):
+    """
+    Sends spans as OTLP/HTTP JSON to a collector (``<endpoint>/v1/traces``).
+
+    Requests are posted from a background thread so tool calls never wait on
+    the collector; spans are dropped if the queue is full or the post fails.
+    """
+
+    def __init__(self, endpoint: str, service_name: str, timeout: float = 2.0, max_queue: int = 1024):
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.service_name = service_name
+        self.timeout = timeout
+        self.dropped = 0
+        self._queue: queue.Queue[list[Span] | None] = queue.Queue(maxsize=max_queue)
+        self._worker = threading.Thread(target=self._run, name="otlp-exporter", daemon=True)
+        self._worker.start()
+
+    def export(self, spans: list[Span]) -> None:
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            self.dropped += len(spans)
+
+    def shutdown(self) -> None:
+        self._queue.put(None)
+        self._worker.join(timeout=self.timeout)
+
+    def encode(self, spans: list[Span]) -> bytes:
+        body = {
+            "resourceSpans": [{
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": self.service_name}}]},
+                "scopeSpans": [{
+                    "scope": {"name": "src.telemetry"},
+                    "spans": [
+                        {
+                            "traceId": span.trace_id,
+                            "spanId": span.span_id,
+                            **({"parentSpanId": span.parent_id} if span.parent_id else {}),
+                            "name": span.name,
+                            "kind": 1,
+                            "startTimeUnixNano": str(span.start_ns),
+                            "endTimeUnixNano": str(span.end_ns),
+                            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in span.attributes.items()],
+                            "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+                        }
+                        for span in spans
+                    ],
+                }],
+            }]
+        }
+        return json.dumps(body).encode("utf-8")
+
+    def _run(self) -> None:
+        while True:
+            spans = self._queue.get()
+            if spans is None:
+                return
+            request = urllib.request.Request(
+                self.url, data=self.encode(spans), headers={"Content-Type": "application/json"}, method="POST"
+            )
+            try:
+                with urllib.request.urlopen(request, timeout=self.timeout):
+                    pass
+            except OSError:
+                self.dropped += len(spans)
+
+
+class Tracer:
+    """Sampling decision and export for request spans."""
+
+    def __init__(self, exporter: SpanExporter | None = None, sample_ratio: float = 1.0):
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+
+    def should_sample(self) -> bool:
+        return self.exporter is not None and random.random() < self.sample_ratio
+
+    def export(self, spans: list[Span]) -> None:
+        if self.exporter is not None and spans:
+            self.exporter.export(spans)
+
+    def shutdown(self) -> None:
+        if self.exporter is not None:
+            self.exporter.shutdown()
+
+
+def tracer_from_config(settings: TracingConfig) -> Tracer:
+    """Build the tracer described by the tracing configuration."""
+    if not settings.enabled:
+        return Tracer(None, 0.0)
+    if settings.exporter == "console":
+        exporter = ConsoleSpanExporter()
+    elif settings.exporter == "file":
+        exporter = JsonFileSpanExporter(settings.file_path)
+    else:
+        exporter = OTLPHttpSpanExporter(settings.otlp_endpoint, settings.service_name)
+    return Tracer(exporter, settings.sample_ratio)
+
+
+tracer = tracer_from_config(config.tracing)
@@ -0,0 +1,93 @@
+"""
+Instrumented access to yfinance tickers.
+
+yfinance resolves most Ticker attributes lazily over the network (``isin``,
+``info``, ``options``, ``history()``...), so a single tool call can fire
+several hidden requests. InstrumentedTicker records each one on the current
+request trace and in the upstream metrics.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Callable
+
+from src.lazy import lazy_import
+
+from .context import UpstreamCall, record_upstream, upstream_call
+
+pd = lazy_import("pandas", globals())
+yf = lazy_import("yfinance", globals())
+
+
+def payload_bytes(value: Any) -> int:
+    """Cheap approximation of the in-memory size of an upstream payload."""
+    if value is None:
+        return 0
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(index=True)
+        return int(usage.sum() if isinstance(usage, pd.Series) else usage)
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, tuple):
+        # Option chains come back as a namedtuple of frames
+        return sum(payload_bytes(item) for item in value)
+    if isinstance(value, (dict, list)):
+        return len(repr(value))
+    return 0
+
+
+def _outcome(value: Any) -> str:
+    if value is None:
+        return "empty"
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return "empty" if value.empty else "ok"
+    if isinstance(value, (dict, list, tuple, str)):
+        return "empty" if len(value) == 0 else "ok"
+    return "ok"
+
+
+class InstrumentedTicker:
+    """
+    Proxy for ``yf.Ticker`` that times every upstream attribute access and call.
+
+    Attribute reads (lazy properties) are recorded under the attribute name
+    when read; methods are recorded under their name when called.
+    """
+
+    __slots__ = ("symbol", "_ticker")
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        # Resolved at call time so a patched yfinance.Ticker is honoured
+        self._ticker = yf.Ticker(symbol)
+
+    def __getattr__(self, name: str) -> Any:
+        start = time.perf_counter()
+        try:
+            value = getattr(self._ticker, name)
+        except Exception as exc:
+            record_upstream(UpstreamCall(name, time.perf_counter() - start, outcome=type(exc).__name__))
+            raise
+        duration = time.perf_counter() - start
+
+        if callable(value) and not isinstance(value, (pd.DataFrame, pd.Series)):
+            # Looking up a method is free; the request happens when it is called
+            return _instrument_method(name, value)
+
+        record_upstream(UpstreamCall(name, duration, payload_bytes(value), _outcome(value)))
+        return value
+
+    def __repr__(self) -> str:
+        return f"InstrumentedTicker({self.symbol!r})"
+
+
+def _instrument_method(name: str, method: Callable) -> Callable:
+    def call_upstream(*args, **kwargs):
+        with upstream_call(name) as call:
+            result = method(*args, **kwargs)
+            call.bytes = payload_bytes(result)
+            call.outcome = _outcome(result)
+        return result
+
+    call_upstream.__name__ = name
+    return call_upstream
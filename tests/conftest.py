@@ -2,6 +2,13 @@
 Shared fixtures for MCP server tests.
 Uses in-memory session creation to avoid socket/network overhead.
 """
+import os
+
+# Build tool schemas at import instead of reading the user's schema cache
+os.environ.setdefault("YF_MCP_CACHE__SCHEMA_PATH", "")
+# Validate every response model the tools build, instead of trusting the normalized data
+os.environ.setdefault("YF_MCP_VALIDATE_MODELS", "true")
+
 import pytest
 import pytest_asyncio
 from unittest.mock import Mock, MagicMock
@@ -9,6 +16,28 @@ import pandas as pd
 from datetime import datetime, timedelta
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Reset server caches so cached upstream data never leaks between tests."""
+    from src.market_data import history_cache, indicator_cache, quote_cache, smile_cache, indicator_states
+
+    history_cache.clear()
+    indicator_cache.clear()
+    quote_cache.clear()
+    smile_cache.clear()
+    indicator_states.clear()
+    yield
+
+
+@pytest.fixture(params=[True, False], ids=["validated", "trusted"])
+def validate_models(request, monkeypatch):
+    """Run each tool test with validated and with trusted (src.models.base.construct) models."""
+    from src.config import config
+
+    monkeypatch.setattr(config, "validate_models", request.param)
+    return request.param
+
+
 @pytest.fixture
 def mock_ticker_data():
     """Mock ticker data for tests."""
@@ -132,7 +161,7 @@ def invalid_tickers():
 
 
 @pytest.fixture
-def mock_yfinance_ticker(mocker, mock_ticker_data, mock_historical_data, 
+def mock_yfinance_ticker(mocker, validate_models, mock_ticker_data, mock_historical_data, 
                          mock_news_data, mock_actions_data, mock_options_dates,
                          mock_option_chain_data):
     """
@@ -186,7 +215,7 @@ def mock_yfinance_ticker(mocker, mock_ticker_data, mock_historical_data,
             })
             
             # Mock recommendations
-            rec_dates = pd.date_range(end=datetime.now(), periods=5, freq='30D')
+            rec_dates = pd.date_range(end=pd.Timestamp.now().normalize(), periods=5, freq='30D')
             mock.recommendations = pd.DataFrame({
                 'Date': rec_dates,
                 'Firm': ['Goldman Sachs', 'Morgan Stanley', 'JP Morgan', 'Citi', 'BofA'],
@@ -0,0 +1,344 @@
+"""
+Tests for vectorized analytics helpers.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analytics import compute_price_summary, compute_indicators, align_closes, return_statistics, top_pairs
+from src.analytics.indicators import rsi, atr, vwap, ema
+from src.analytics.greeks import black_scholes_greeks, norm_cdf, years_to_expiration
+from src.analytics.volatility import SmileFit, fit_smile, interpolate_surface, otm_quotes
+from src.analytics.incremental import IncrementalIndicators, IndicatorParams, IndicatorStateStore, RollingVarianceState
+from src.models.enums import IndicatorType
+
+
+def _frame(closes, volumes=None):
+    """Build a minimal OHLCV frame from closing prices."""
+    closes = np.asarray(closes, dtype=float)
+    dates = pd.date_range("2025-01-01", periods=len(closes), freq="D")
+    return pd.DataFrame({
+        "Open": closes,
+        "High": closes + 1,
+        "Low": closes - 1,
+        "Close": closes,
+        "Volume": volumes if volumes is not None else np.full(len(closes), 1000),
+    }, index=dates)
+
+
+class TestPriceSummary:
+    """Tests for compute_price_summary."""
+
+    def test_return_and_range(self):
+        """Test period return, high and low."""
+        summary = compute_price_summary(_frame([100, 110, 90, 120]), "1d")
+
+        assert summary["bars"] == 4
+        assert summary["period_return"] == pytest.approx(0.2)
+        assert summary["high"] == 121
+        assert summary["low"] == 89
+        assert summary["average_volume"] == 1000
+
+    def test_max_drawdown(self):
+        """Test peak-to-trough drawdown uses the running peak."""
+        summary = compute_price_summary(_frame([100, 120, 90, 130, 117]), "1d")
+
+        assert summary["max_drawdown"] == pytest.approx(90 / 120 - 1)
+
+    def test_realized_volatility_annualization(self):
+        """Test volatility scales with the interval's bars per year."""
+        frame = _frame([100, 101, 99, 102, 100, 103])
+        daily = compute_price_summary(frame, "1d")["realized_volatility"]
+        weekly = compute_price_summary(frame, "1wk")["realized_volatility"]
+
+        expected = np.std(np.diff(np.log(frame["Close"])), ddof=1) * np.sqrt(252)
+        assert daily == pytest.approx(expected)
+        assert weekly == pytest.approx(daily * np.sqrt(52 / 252))
+
+    def test_single_bar_has_no_volatility(self):
+        """Test a single bar yields no volatility instead of NaN."""
+        summary = compute_price_summary(_frame([100]), "1d")
+
+        assert summary["realized_volatility"] is None
+        assert summary["max_drawdown"] == 0
+
+    def test_nan_closes_are_dropped(self):
+        """Test NaN closes are ignored."""
+        summary = compute_price_summary(_frame([100, np.nan, 110]), "1d")
+
+        assert summary["bars"] == 2
+        assert summary["period_return"] == pytest.approx(0.1)
+
+    def test_all_nan_raises(self):
+        """Test an all-NaN frame is rejected."""
+        with pytest.raises(ValueError):
+            compute_price_summary(_frame([np.nan, np.nan]), "1d")
+
+
+class TestIndicators:
+    """Tests for vectorized indicator kernels."""
+
+    def test_sma_and_ema_warm_up(self):
+        """Test moving averages are undefined until the window is filled."""
+        series = compute_indicators(_frame([1, 2, 3, 4, 5]), [IndicatorType.sma, IndicatorType.ema], "1d", window=3)
+
+        np.testing.assert_allclose(series["sma_3"], [np.nan, np.nan, 2, 3, 4])
+        assert np.isnan(series["ema_3"][:2]).all()
+        assert series["ema_3"][-1] == pytest.approx(4.0625)
+
+    def test_rsi_bounds(self):
+        """Test RSI is 100 for a monotonic rise and within bounds otherwise."""
+        rising = rsi(pd.Series(np.arange(1.0, 30.0)), 14)
+        assert rising.iloc[-1] == 100
+
+        closes = pd.Series(100 + np.sin(np.arange(60)) * 5)
+        values = rsi(closes, 14).dropna()
+        assert ((values >= 0) & (values <= 100)).all()
+
+    def test_rsi_of_flat_prices_is_neutral(self):
+        """Test RSI is 50, not 100, when prices never move."""
+        closes = pd.Series([100.0] * 30, index=pd.date_range("2025-01-01", periods=30, freq="D"))
+        state = IncrementalIndicators(IndicatorParams(rsi_period=14), "1d")
+        _, snapshot = state.advance(closes)
+
+        assert rsi(closes, 14).dropna().eq(50.0).all()
+        assert snapshot["rsi"] == 50.0
+
+    def test_macd_histogram(self):
+        """Test MACD histogram is line minus signal."""
+        series = compute_indicators(_frame(np.linspace(100, 150, 60)), [IndicatorType.macd], "1d")
+
+        np.testing.assert_allclose(series["macd_hist"], series["macd"] - series["macd_signal"])
+
+    def test_bollinger_band_symmetry(self):
+        """Test bands are symmetric around the middle band."""
+        series = compute_indicators(_frame([10, 12, 11, 13, 12, 14]), [IndicatorType.bollinger], "1d", window=3)
+
+        np.testing.assert_allclose(series["bb_upper"] - series["bb_middle"], series["bb_middle"] - series["bb_lower"])
+
+    def test_atr_constant_range(self):
+        """Test ATR equals the bar range when prices do not gap."""
+        frame = _frame([100] * 20)
+        values = atr(frame["High"], frame["Low"], frame["Close"], 14)
+
+        assert values.iloc[-1] == pytest.approx(2.0)
+
+    def test_intraday_vwap_resets_each_session(self):
+        """Test intraday VWAP is anchored to each trading day."""
+        index = pd.to_datetime(["2025-01-02 10:00", "2025-01-02 11:00", "2025-01-03 10:00"])
+        close = pd.Series([10.0, 20.0, 30.0], index=index)
+        volume = pd.Series([1.0, 1.0, 1.0], index=index)
+
+        values = vwap(close, close, close, volume, intraday=True)
+
+        np.testing.assert_allclose(values, [10, 15, 30])
+
+
+class TestIncrementalIndicators:
+    """Tests for O(1) incremental indicator state."""
+
+    @staticmethod
+    def _closes(n=80, seed=7):
+        rng = np.random.default_rng(seed)
+        values = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+        return pd.Series(values, index=pd.date_range("2025-01-01", periods=n, freq="D"))
+
+    def test_matches_vectorized_kernels(self):
+        """Test bar-by-bar state agrees with a full recomputation."""
+        closes = self._closes()
+        state = IncrementalIndicators(IndicatorParams(ema_span=10, rsi_period=14, volatility_window=20), "1d")
+
+        # Feed history in uneven refresh chunks
+        for end in (30, 31, 55, 80):
+            _, snapshot = state.advance(closes.iloc[:end])
+
+        expected_vol = np.log(closes).diff().rolling(20).std().iloc[-1] * np.sqrt(252)
+        assert snapshot["ema"] == pytest.approx(ema(closes, 10).iloc[-1])
+        assert snapshot["rsi"] == pytest.approx(rsi(closes, 14).iloc[-1])
+        assert snapshot["volatility"] == pytest.approx(expected_vol)
+        assert snapshot["close"] == pytest.approx(closes.iloc[-1])
+
+    def test_last_bar_is_not_committed(self):
+        """Test an in-progress bar can be revised on the next refresh."""
+        closes = self._closes(40)
+        state = IncrementalIndicators(IndicatorParams(ema_span=5), "1d")
+        state.advance(closes)
+
+        revised = closes.copy()
+        revised.iloc[-1] *= 1.05
+        new_bars, snapshot = state.advance(revised)
+
+        assert state.bars == 39
+        assert new_bars == 0
+        assert snapshot["ema"] == pytest.approx(ema(revised, 5).iloc[-1])
+
+    def test_only_new_bars_are_processed(self):
+        """Test refreshing with an overlapping window skips known bars."""
+        closes = self._closes(50)
+        state = IncrementalIndicators(IndicatorParams(), "1d")
+        state.advance(closes.iloc[:45])
+
+        new_bars, _ = state.advance(closes.iloc[40:])
+
+        assert new_bars == 5
+        assert state.bars == 49
+
+    def test_store_evicts_least_recently_used(self):
+        """Test the state store keeps at most max_entries states."""
+        store = IndicatorStateStore(max_entries=2)
+        params = IndicatorParams()
+        first = store.create("AAPL", "1d", params)
+        store.create("MSFT", "1d", params)
+        store.get("AAPL", "1d", params)
+        store.create("NVDA", "1d", params)
+
+        assert len(store) == 2
+        assert store.get("AAPL", "1d", params) is first
+        assert store.get("MSFT", "1d", params) is None
+        assert store.lock("AAPL", "1d", params) is store.lock("AAPL", "1d", IndicatorParams())
+
+    def test_revised_history_does_not_connect(self):
+        """Test a changed close at the last committed bar forces a rebuild."""
+        closes = self._closes(30)
+        state = IncrementalIndicators(IndicatorParams(), "1d")
+        state.advance(closes)
+
+        assert state.connects_to(closes.iloc[-5:])
+        assert not state.connects_to(closes.iloc[-5:] * 0.99)
+        assert not state.connects_to(closes.iloc[-1:])
+
+    def test_rolling_variance_matches_pandas(self):
+        """Test windowed Welford variance against pandas rolling variance."""
+        values = np.random.default_rng(3).normal(0, 1, 100)
+        state = RollingVarianceState(10)
+        for value in values:
+            state.update(value)
+
+        assert state.current == pytest.approx(np.var(values[-10:], ddof=1))
+
+
+class TestCorrelation:
+    """Tests for cross-ticker return statistics."""
+
+    def test_matches_numpy(self):
+        """Test covariance and correlation against NumPy reference implementations."""
+        rng = np.random.default_rng(11)
+        closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (120, 4)), axis=0))
+        returns = np.diff(np.log(closes), axis=0)
+
+        covariance, correlation, observations = return_statistics(closes)
+
+        assert observations == 119
+        np.testing.assert_allclose(covariance, np.cov(returns, rowvar=False))
+        np.testing.assert_allclose(correlation, np.corrcoef(returns, rowvar=False))
+
+    def test_align_daily_bars_across_time_zones(self):
+        """Test daily bars from different exchanges align on calendar date."""
+        us = _frame([100, 101, 102])
+        us.index = us.index.tz_localize("America/New_York")
+        crypto = _frame([10, 11, 12, 13])
+        crypto.index = pd.date_range("2024-12-31", periods=4, freq="D", tz="UTC")
+
+        aligned = align_closes({"AAPL": us, "BTC-USD": crypto}, "1d")
+
+        assert list(aligned.columns) == ["AAPL", "BTC-USD"]
+        assert len(aligned) == 3
+        assert aligned["BTC-USD"].tolist() == [11, 12, 13]
+
+    def test_top_pairs_by_absolute_correlation(self):
+        """Test pairs are ranked by |correlation| and exclude the diagonal."""
+        correlation = np.array([
+            [1.0, 0.2, -0.9],
+            [0.2, 1.0, 0.5],
+            [-0.9, 0.5, 1.0],
+        ])
+
+        pairs = top_pairs(correlation, 2)
+
+        assert pairs == [(0, 2, -0.9), (1, 2, 0.5)]
+        assert len(top_pairs(correlation, 10)) == 3
+
+
+class TestGreeks:
+    """Tests for vectorized Black-Scholes Greeks."""
+
+    def test_reference_values(self):
+        """Test an at-the-money call against textbook values."""
+        greeks = black_scholes_greeks(100.0, np.array([100.0]), 1.0, np.array([0.2]), True, rate=0.05)
+
+        assert greeks["delta"][0] == pytest.approx(0.6368, abs=1e-4)
+        assert greeks["gamma"][0] == pytest.approx(0.01876, abs=1e-5)
+        assert greeks["vega"][0] == pytest.approx(0.3752, abs=1e-4)
+        assert greeks["theta"][0] == pytest.approx(-6.414 / 365, abs=1e-4)
+        assert greeks["rho"][0] == pytest.approx(0.5323, abs=1e-4)
+
+    def test_put_call_parity(self):
+        """Test call and put deltas differ by the dividend discount factor."""
+        strikes = np.array([80.0, 100.0, 120.0])
+        vols = np.array([0.3, 0.25, 0.2])
+        calls = black_scholes_greeks(100.0, strikes, 0.5, vols, True, rate=0.03, dividend_yield=0.01)
+        puts = black_scholes_greeks(100.0, strikes, 0.5, vols, False, rate=0.03, dividend_yield=0.01)
+
+        np.testing.assert_allclose(calls["delta"] - puts["delta"], np.exp(-0.01 * 0.5), atol=1e-6)
+        np.testing.assert_allclose(calls["gamma"], puts["gamma"])
+
+    def test_invalid_inputs_are_nan(self):
+        """Test zero volatility or expired contracts produce NaN instead of errors."""
+        greeks = black_scholes_greeks(100.0, np.array([100.0, 100.0]), np.array([1.0, -0.1]), np.array([0.0, 0.2]), True)
+
+        assert np.isnan(greeks["delta"]).all()
+
+    def test_norm_cdf_accuracy(self):
+        """Test the CDF approximation at known quantiles."""
+        np.testing.assert_allclose(norm_cdf(np.array([0.0, 1.0, -1.96])), [0.5, 0.841345, 0.024998], atol=1e-6)
+
+    def test_years_to_expiration(self):
+        """Test expiration is measured to the 4pm New York close."""
+        from datetime import datetime
+        from zoneinfo import ZoneInfo
+
+        now = datetime(2025, 1, 2, 16, 0, tzinfo=ZoneInfo("America/New_York"))
+        assert years_to_expiration("2025-01-03", now) == pytest.approx(1 / 365)
+
+
+class TestVolatilitySurface:
+    """Tests for smile fitting and surface interpolation."""
+
+    def test_otm_quotes_filter(self):
+        """Test only out-of-the-money, plausible quotes are kept."""
+        calls = pd.DataFrame({"strike": [90.0, 110.0, 120.0], "impliedVolatility": [0.3, 0.2, 9.0]})
+        puts = pd.DataFrame({"strike": [90.0, 110.0], "impliedVolatility": [0.35, 0.25]})
+
+        log_moneyness, ivs = otm_quotes(100.0, calls, puts)
+
+        np.testing.assert_allclose(log_moneyness, np.log([0.9, 1.1]))
+        np.testing.assert_allclose(ivs, [0.35, 0.2])
+
+    def test_fit_recovers_quadratic(self):
+        """Test a noiseless quadratic smile is recovered exactly."""
+        x = np.linspace(-0.2, 0.2, 9)
+        smile = fit_smile("2025-12-19", 0.25, x, 0.2 - 0.1 * x + 0.5 * x * x)
+
+        np.testing.assert_allclose(smile.coefficients, (0.5, -0.1, 0.2), atol=1e-12)
+        assert smile.atm_iv == pytest.approx(0.2)
+        assert smile.contracts == 9
+
+    def test_fit_with_few_quotes(self):
+        """Test sparse expirations fall back to lower-degree fits."""
+        assert fit_smile("2025-12-19", 0.25, np.empty(0), np.empty(0)) is None
+        assert fit_smile("2025-12-19", 0.25, np.array([0.0]), np.array([0.3])).coefficients == (0.0, 0.0, 0.3)
+        assert fit_smile("2025-12-19", 0.25, np.array([-0.1, 0.1]), np.array([0.3, 0.2])).coefficients[0] == 0.0
+
+    def test_total_variance_interpolation(self):
+        """Test tenors interpolate total variance and extrapolate flat."""
+        smiles = [
+            SmileFit("near", 0.1, (0.0, 0.0, 0.2), 5),
+            SmileFit("far", 0.5, (0.0, 0.0, 0.3), 5),
+        ]
+
+        surface = interpolate_surface(smiles, [0.9, 1.0, 1.1], [18.25, 73.0, 365.0])
+
+        assert surface.shape == (3, 3)
+        expected_mid = np.sqrt((0.75 * 0.2**2 * 0.1 + 0.25 * 0.3**2 * 0.5) / 0.2)
+        np.testing.assert_allclose(surface[:, 1], [0.2, expected_mid, 0.3])
+        np.testing.assert_allclose(surface[:, 0], surface[:, 2])
@@ -0,0 +1,170 @@
+"""
+Tests for the TTL caches.
+"""
+import mmap
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.cache import SharedTTLCache, TTLCache
+from src.history_store import MappedHistoryCache, covers
+
+
+def test_ttl_cache_expires_and_counts_lookups():
+    cache = TTLCache("test", ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=-1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+class TestSharedTTLCache:
+    """Entries shared between processes through SQLite."""
+
+    def test_entries_are_visible_to_other_instances(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        writer = SharedTTLCache("history", ttl=60, path=path)
+        reader = SharedTTLCache("history", ttl=60, path=path)
+        frame = pd.DataFrame({"Close": [1.0, 2.0]}, index=pd.date_range("2025-01-01", periods=2))
+
+        writer.set(("AAPL", "1y", "1d"), frame)
+        shared = reader.get(("AAPL", "1y", "1d"))
+
+        pd.testing.assert_frame_equal(shared, frame)
+        assert reader.hits == 1 and len(reader) == 1
+        assert SharedTTLCache("quotes", ttl=60, path=path).get(("AAPL", "1y", "1d")) is None
+
+    def test_expired_and_cleared_entries_are_misses(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        writer = SharedTTLCache("quotes", ttl=0.05, path=path)
+        writer.set("AAPL", 150.0)
+        writer.set("MSFT", 380.0, ttl=60)
+        time.sleep(0.1)
+
+        reader = SharedTTLCache("quotes", ttl=60, path=path)
+        assert reader.get("AAPL") is None
+        assert reader.get("MSFT") == 380.0
+
+        writer.clear()
+        assert SharedTTLCache("quotes", ttl=60, path=path).get("MSFT") is None
+
+    def test_prunes_beyond_max_entries(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        cache = SharedTTLCache("quotes", ttl=60, path=path, max_entries=4)
+        for i in range(SharedTTLCache.PRUNE_EVERY):
+            cache.set(f"T{i}", float(i))
+
+        rows = cache._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        assert rows == 4
+
+    def test_unreadable_file_degrades_to_local_cache(self, tmp_path):
+        cache = SharedTTLCache("quotes", ttl=60, path=str(tmp_path / "missing" / "cache.sqlite3"))
+        cache.set("AAPL", 150.0)
+
+        assert cache.get("AAPL") == 150.0
+        assert cache.get("MSFT") is None
+
+
+def is_mapped(array: np.ndarray) -> bool:
+    base = array
+    while isinstance(base, np.ndarray):
+        base = base.base
+    return isinstance(base, mmap.mmap)
+
+
+def bars(periods: int = 300, freq: str = "B") -> pd.DataFrame:
+    index = pd.date_range(end="2025-10-24 09:30", periods=periods, freq=freq, tz="America/New_York", name="Date")
+    close = np.linspace(100.0, 130.0, periods)
+    return pd.DataFrame({"Close": close, "Volume": np.arange(periods, dtype=np.int64)}, index=index)
+
+
+class TestMappedHistoryCache:
+    """History shared between processes as memory-mapped arrays."""
+
+    def test_other_instances_map_the_stored_arrays(self, tmp_path):
+        frame = bars()
+        MappedHistoryCache("history", ttl=60, path=str(tmp_path)).set(("AAPL", "1y", "1d"), frame)
+        reader = MappedHistoryCache("history", ttl=60, path=str(tmp_path))
+        mapped = reader.get(("AAPL", "1y", "1d"))
+
+        pd.testing.assert_frame_equal(mapped, frame, check_freq=False)
+        assert is_mapped(mapped["Close"].to_numpy()) and is_mapped(mapped["Volume"].to_numpy())
+        assert not mapped["Volume"].to_numpy().flags.writeable
+        assert reader.hits == 1 and len(reader) == 1
+        assert reader.get(("AAPL", "1y", "1wk")) is None and reader.get(("MSFT", "1y", "1d")) is None
+
+    def test_shorter_periods_are_sliced_from_longer_ones(self, tmp_path):
+        frame = bars()
+        MappedHistoryCache("history", ttl=60, path=str(tmp_path)).set(("AAPL", "1y", "1d"), frame)
+        reader = MappedHistoryCache("history", ttl=60, path=str(tmp_path))
+
+        month = reader.get(("AAPL", "1mo", "1d"))
+        pd.testing.assert_frame_equal(month, frame[frame.index >= frame.index[-1] - pd.DateOffset(months=1)], check_freq=False)
+        assert len(reader.get(("AAPL", "5d", "1d"))) == 5
+        assert reader.get(("AAPL", "ytd", "1d")).index[0] == pd.Timestamp("2025-01-01 09:30", tz="America/New_York")
+        assert reader.get(("AAPL", "2y", "1d")) is None
+        assert covers("max", "10y") and covers("1y", "ytd") and not covers("ytd", "6mo")
+
+    def test_narrower_periods_keep_the_wider_entry(self, tmp_path):
+        frame = bars()
+        writer = MappedHistoryCache("history", ttl=60, path=str(tmp_path))
+        writer.set(("AAPL", "1y", "1d"), frame)
+        writer.set(("AAPL", "5d", "1d"), frame.iloc[-5:])
+
+        reader = MappedHistoryCache("history", ttl=60, path=str(tmp_path))
+        assert len(reader.get(("AAPL", "1y", "1d"))) == len(frame)
+        assert len(reader.get(("AAPL", "5d", "1d"))) == 5
+
+        writer.set(("AAPL", "max", "1d"), frame)
+        writer.set(("AAPL", "max", "1d"), frame.iloc[1:])
+        assert len(MappedHistoryCache("history", ttl=60, path=str(tmp_path)).get(("AAPL", "max", "1d"))) == len(frame) - 1
+
+    def test_prune_keeps_unpublished_newer_generations(self, tmp_path):
+        cache = MappedHistoryCache("history", ttl=60, path=str(tmp_path))
+        cache.set(("AAPL", "1y", "1d"), bars())
+        directory = next(tmp_path.iterdir())
+        pending = directory / f"{time.time_ns() + 10**9:020d}-pending.0.npy"
+        np.save(pending, np.arange(3))
+
+        cache.set(("AAPL", "1y", "1d"), bars())
+        generations = {file.name.split(".", 1)[0] for file in directory.iterdir() if file.name != "meta.json"}
+        assert pending.exists() and len(generations) == 2
+
+    def test_intraday_sessions(self, tmp_path):
+        frame = bars(periods=24 * 20, freq="h")
+        cache = MappedHistoryCache("history", ttl=60, path=str(tmp_path))
+        cache.set(("AAPL", "1mo", "1h"), frame)
+
+        day = MappedHistoryCache("history", ttl=60, path=str(tmp_path)).get(("AAPL", "1d", "1h"))
+        assert day.index.normalize().nunique() == 1 and day.index[-1] == frame.index[-1]
+
+    def test_expired_cleared_and_unmappable_entries(self, tmp_path):
+        MappedHistoryCache("history", ttl=-1, path=str(tmp_path)).set(("AAPL", "1y", "1d"), bars())
+        assert MappedHistoryCache("history", ttl=60, path=str(tmp_path)).get(("AAPL", "1y", "1d")) is None
+
+        cache = MappedHistoryCache("history", ttl=60, path=str(tmp_path))
+        cache.set(("AAPL", "1y", "1d"), bars())
+        cache.clear()
+        assert not any(tmp_path.iterdir())
+
+        labelled = bars().assign(Note="x")
+        cache.set(("MSFT", "1y", "1d"), labelled)
+        assert cache.get(("MSFT", "1y", "1d")) is labelled
+        assert MappedHistoryCache("history", ttl=60, path=str(tmp_path)).get(("MSFT", "1y", "1d")) is None
+
+    @pytest.mark.asyncio
+    async def test_historical_prices_served_from_the_store(self, tmp_path, monkeypatch, mock_yfinance_ticker):
+        import src.market_data
+        from src.server import get_historical_stock_prices
+
+        monkeypatch.setattr(src.market_data, "history_cache", MappedHistoryCache("history", ttl=60, path=str(tmp_path)))
+        fetched = await get_historical_stock_prices(ticker="AAPL", period="1mo", interval="1d")
+        monkeypatch.setattr(src.market_data, "history_cache", MappedHistoryCache("history", ttl=60, path=str(tmp_path)))
+        mapped = await get_historical_stock_prices(ticker="AAPL", period="1mo", interval="1d")
+
+        assert mapped.model_dump(mode="json") == fetched.model_dump(mode="json")
+        assert src.market_data.history_cache.hits == 1
@@ -0,0 +1,79 @@
+"""
+Tests for negotiated response compression.
+"""
+import gzip
+import zlib
+
+import pytest
+
+from src.compression import CompressionMiddleware, negotiate
+
+PAYLOAD = b'{"strike": 100.0, "bid": 1.25, "ask": 1.3}\n' * 200
+
+
+def body_app(chunks: list[bytes], content_type: bytes = b"application/json"):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", content_type)]})
+        for i, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": i < len(chunks) - 1})
+
+    return app
+
+
+async def request(app, accept: str = "gzip", method: str = "POST") -> tuple[dict, list[bytes]]:
+    scope = {"type": "http", "method": method, "path": "/mcp", "headers": [(b"accept-encoding", accept.encode())]}
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    await CompressionMiddleware(app, minimum_size=1024, encodings=["zstd", "br", "gzip"])(scope, receive, send)
+    headers = {name.decode(): value.decode() for name, value in messages[0]["headers"]}
+    return headers, [message["body"] for message in messages[1:]]
+
+
+def test_negotiate_honours_quality_and_preference():
+    assert negotiate("gzip, br", ["zstd", "br", "gzip"]) == "br"
+    assert negotiate("gzip;q=1.0, br;q=0.5", ["br", "gzip"]) == "gzip"
+    assert negotiate("*;q=0.1", ["gzip"]) == "gzip"
+    assert negotiate("gzip;q=0, identity", ["gzip"]) is None
+    assert negotiate("", ["gzip"]) is None
+
+
+@pytest.mark.asyncio
+async def test_large_response_is_compressed():
+    headers, bodies = await request(body_app([PAYLOAD]))
+
+    assert headers["content-encoding"] == "gzip"
+    assert headers["vary"] == "Accept-Encoding"
+    assert gzip.decompress(b"".join(bodies)) == PAYLOAD
+    assert len(b"".join(bodies)) < len(PAYLOAD) / 10
+
+
+@pytest.mark.asyncio
+async def test_small_and_unaccepted_responses_pass_through():
+    small = b'{"price": 150.0}'
+    headers, bodies = await request(body_app([small]))
+    assert "content-encoding" not in headers and bodies == [small]
+
+    headers, bodies = await request(body_app([PAYLOAD]), accept="identity")
+    assert "content-encoding" not in headers and bodies == [PAYLOAD]
+
+
+@pytest.mark.asyncio
+async def test_event_stream_chunks_are_flushed_individually():
+    log = b'event: message\ndata: {"method": "notifications/message"}\n\n'
+    events = [log, b"event: message\ndata: " + PAYLOAD + b"\n\n", b": ping\n\n"]
+    headers, bodies = await request(body_app(events, b"text/event-stream"))
+
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    assert headers["content-encoding"] == "gzip"
+    # The small log event waits for the threshold, then each body is readable before the stream ends
+    assert decompressor.decompress(bodies[0]) == events[0] + events[1]
+    assert decompressor.decompress(bodies[1]) == events[2]
+
+    headers, bodies = await request(body_app(events, b"text/event-stream"), method="GET")
+    assert "content-encoding" not in headers and bodies == events
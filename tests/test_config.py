@@ -197,3 +197,33 @@ class TestRateLimitingConfig:
         
         assert config.enable_rate_limit is True
         assert config.requests_per_minute == 120
+
+
+class TestHTTPServerOptions:
+    """Tests for the uvicorn options derived from HTTPConfig."""
+
+    def test_tuning_options_reach_uvicorn(self, monkeypatch):
+        """Test every tuning option is passed on to uvicorn."""
+        from src import http_app
+
+        http = HTTPConfig(host="127.0.0.1", port=3100, loop="asyncio", http_parser="h11", keep_alive_timeout=30,
+                          backlog=512, max_connections=200, graceful_shutdown_timeout=10)
+        monkeypatch.setattr(http_app.config, "http", http)
+
+        options = http_app.server_options()
+
+        assert options["loop"] == "asyncio" and options["http"] == "h11"
+        assert options["timeout_keep_alive"] == 30
+        assert options["backlog"] == 512
+        assert options["limit_concurrency"] == 200
+        assert options["timeout_graceful_shutdown"] == 10
+
+    def test_missing_optional_package_is_reported(self, monkeypatch):
+        """Test asking for uvloop without it installed fails with a clear error."""
+        from src import http_app
+
+        monkeypatch.setattr(http_app.config, "http", HTTPConfig(loop="uvloop"))
+        monkeypatch.setattr(http_app.importlib.util, "find_spec", lambda name: None)
+
+        with pytest.raises(RuntimeError, match="performance"):
+            http_app.server_options()
@@ -0,0 +1,73 @@
+"""
+Tests for streaming dataset exports.
+"""
+import pytest
+
+from src.export import DatasetWriter, export_path
+
+
+def test_export_path_stays_in_directory(tmp_path):
+    assert export_path(str(tmp_path), "prices", "history", "parquet") == tmp_path / "prices.parquet"
+    assert export_path(str(tmp_path), "prices.arrow", "history", "arrow") == tmp_path / "prices.arrow"
+    assert export_path(str(tmp_path), None, "options", "arrow").name.startswith("options-")
+    assert export_path(str(tmp_path), None, "options", "arrow") != export_path(str(tmp_path), None, "options", "arrow")
+    for name in ("../prices", "/tmp/prices", ".hidden", "a/b"):
+        with pytest.raises(ValueError):
+            export_path(str(tmp_path), name, "history", "parquet")
+
+
+def test_writer_emits_full_row_groups_and_discards_failed_exports(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    schema = pa.schema([("ticker", pa.string()), ("close", pa.float64())])
+
+    def table(ticker, rows):
+        return pa.table({"ticker": [ticker] * rows, "close": [float(i) for i in range(rows)]}, schema=schema)
+
+    with DatasetWriter(tmp_path / "prices.arrow", schema, "arrow", row_group_size=4) as writer:
+        for ticker, rows in (("AAPL", 3), ("MSFT", 6), ("GOOGL", 0), ("NVDA", 2)):
+            writer.write(table(ticker, rows))
+            assert writer._pending_rows < 4
+        writer.close()
+
+    reader = pa.ipc.open_file(tmp_path / "prices.arrow")
+    assert [reader.get_batch(i).num_rows for i in range(reader.num_record_batches)] == [4, 4, 3]
+    assert reader.read_all().column("ticker").to_pylist() == ["AAPL"] * 3 + ["MSFT"] * 6 + ["NVDA"] * 2
+
+    with pytest.raises(RuntimeError):
+        with DatasetWriter(tmp_path / "failed.parquet", schema, "parquet", row_group_size=4) as writer:
+            writer.write(table("AAPL", 5))
+            raise RuntimeError("upstream failed")
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["prices.arrow"]
+
+
+def test_concurrent_writers_of_one_file_conflict(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    schema = pa.schema([("close", pa.float64())])
+
+    with DatasetWriter(tmp_path / "prices.parquet", schema, "parquet", row_group_size=4) as writer:
+        with pytest.raises(FileExistsError):
+            DatasetWriter(tmp_path / "prices.parquet", schema, "parquet", row_group_size=4)
+        writer.write(pa.table({"close": [1.0, 2.0]}, schema=schema))
+        writer.close()
+
+    assert pytest.importorskip("pyarrow.parquet").read_table(tmp_path / "prices.parquet").column("close").to_pylist() == [1.0, 2.0]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["prices.parquet"]
+
+
+def test_existing_files_are_never_replaced(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    schema = pa.schema([("close", pa.float64())])
+    (tmp_path / "kept.parquet").write_bytes(b"user data")
+
+    with pytest.raises(FileExistsError):
+        DatasetWriter(tmp_path / "kept.parquet", schema, "parquet", row_group_size=4)
+
+    # A file of the same name that appears while writing survives close(), and abort() only drops the partial
+    with pytest.raises(FileExistsError):
+        with DatasetWriter(tmp_path / "late.parquet", schema, "parquet", row_group_size=4) as writer:
+            writer.write(pa.table({"close": [1.0]}, schema=schema))
+            (tmp_path / "late.parquet").write_bytes(b"user data")
+            writer.close()
+
+    assert (tmp_path / "kept.parquet").read_bytes() == (tmp_path / "late.parquet").read_bytes() == b"user data"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["kept.parquet", "late.parquet"]
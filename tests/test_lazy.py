@@ -0,0 +1,44 @@
+"""
+Tests for deferred imports.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+from src import lazy
+from src.lazy import LazyModule, lazy_import, pending, warm_up
+
+
+def test_placeholder_rebinds_on_first_use(monkeypatch):
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    monkeypatch.setattr(lazy, "_lazy_modules", {})
+    namespace = {}
+    namespace["colorsys"] = lazy_import("colorsys", namespace)
+
+    assert isinstance(namespace["colorsys"], LazyModule)
+    assert pending() == ["colorsys"]
+
+    assert namespace["colorsys"].rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert namespace["colorsys"] is sys.modules["colorsys"]
+    assert pending() == []
+
+
+def test_warm_up_imports_pending_modules(monkeypatch):
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    monkeypatch.setattr(lazy, "_lazy_modules", {})
+    namespace = {}
+    namespace["colorsys"] = lazy_import("colorsys", namespace)
+
+    timings = warm_up()
+
+    assert list(timings) == ["colorsys"]
+    assert namespace["colorsys"] is sys.modules["colorsys"]
+    assert lazy_import("colorsys", {}) is sys.modules["colorsys"]
+
+
+def test_server_import_defers_heavy_libraries():
+    script = "import sys, src.server; print(sorted({'numpy', 'pandas', 'yfinance'} & set(sys.modules)))"
+    completed = subprocess.run(
+        [sys.executable, "-c", script], cwd=Path(__file__).parent.parent, capture_output=True, text=True, check=True
+    )
+    assert completed.stdout.strip() == "[]"
@@ -355,3 +355,19 @@ class TestModelValidation:
         # Invalid port (too high)
         with pytest.raises(ValidationError):
             HTTPConfig(port=70000)
+
+
+class TestConstruct:
+    """Tests for building models from trusted values without validation."""
+
+    def test_matches_validated_model(self):
+        """Test a constructed model equals and serializes like a validated one."""
+        from src.models.base import construct
+
+        values = dict(date="2025-10-25", open=150.0, high=155.0, low=149.0, close=154.0, volume=1000000, adj_close=None)
+        validated = HistoricalPricePoint(**values)
+        constructed = construct(HistoricalPricePoint, dict(values))
+
+        assert constructed == validated
+        assert constructed.model_dump(by_alias=True) == validated.model_dump(by_alias=True)
+        assert HistoricalPriceResponse(ticker="AAPL", period="1d", interval="1d", data_points=[constructed], count=1).data_points[0] is constructed
@@ -0,0 +1,118 @@
+"""
+Tests for the Yahoo Finance record/replay layer.
+"""
+import json
+import time
+
+import pytest
+
+from src.config import UpstreamConfig
+from src.replay import (
+    Archive,
+    ArchiveWriter,
+    Exchange,
+    RecordingSession,
+    ReplaySession,
+    StandIn,
+    read_exchanges,
+    replay_url,
+    request_key,
+    session_from_config,
+)
+
+CHART_URL = "https://query2.finance.yahoo.com/v8/finance/chart/AAPL"
+
+
+def chart_exchange(close: float = 150.0) -> Exchange:
+    body = json.dumps({"chart": {"result": [{"meta": {"symbol": "AAPL"}, "close": [close]}], "error": None}})
+    return Exchange.create("GET", f"{CHART_URL}?range=5d&interval=1d", 200, "application/json", body.encode())
+
+
+@pytest.fixture
+def standin():
+    server = StandIn(Archive([chart_exchange()]))
+    url = server.start()
+    yield server, url
+    server.shutdown()
+
+
+class TestArchive:
+    """Request matching and archive files."""
+
+    def test_request_key_ignores_volatile_params(self):
+        assert request_key("get", f"{CHART_URL}?interval=1d&range=5d&crumb=abc&period1=1") == request_key(
+            "GET", f"{CHART_URL}?range=5d&interval=1d"
+        )
+        assert request_key("GET", f"{CHART_URL}?range=5d") != request_key("GET", f"{CHART_URL}?range=1y")
+
+    def test_repeated_requests_replay_in_order(self):
+        archive = Archive([chart_exchange(1.0), chart_exchange(2.0)])
+        bodies = [archive.lookup("GET", f"{CHART_URL}?range=5d&interval=1d").body for _ in range(3)]
+
+        assert ["1.0" in body for body in bodies] == [True, False, True]
+        assert archive.lookup("GET", f"{CHART_URL}?range=1y&interval=1d") is None
+
+    def test_gzip_round_trip_with_binary_body(self, tmp_path):
+        path = tmp_path / "yahoo.jsonl.gz"
+        writer = ArchiveWriter(path)
+        writer.write(chart_exchange())
+        writer.write(Exchange.create("GET", "https://example.com/logo.png", 200, "image/png", b"\x89PNG\xff\x00"))
+
+        exchanges = list(read_exchanges(path))
+
+        assert writer.count == 2
+        assert exchanges[0] == chart_exchange()
+        assert exchanges[1].binary and exchanges[1].content == b"\x89PNG\xff\x00"
+
+
+class TestStandIn:
+    """Replay policy and the HTTP server."""
+
+    def test_respond_hit_miss_and_handshake(self):
+        server = StandIn(Archive([chart_exchange()]))
+
+        status, content_type, body = server.respond("GET", "/query2.finance.yahoo.com/v8/finance/chart/AAPL?interval=1d&range=5d&crumb=x")
+        assert (status, content_type) == (200, "application/json")
+        assert json.loads(body)["chart"]["result"][0]["meta"]["symbol"] == "AAPL"
+
+        assert server.respond("GET", "/query1.finance.yahoo.com/v1/test/getcrumb")[2] == b"replay-crumb"
+        assert server.respond("GET", "/query2.finance.yahoo.com/v8/finance/chart/MSFT?range=5d")[0] == 404
+        assert server.stats == {"requests": 3, "hits": 1, "synthetic": 1, "misses": 1}
+
+    def test_error_injection(self):
+        server = StandIn(Archive([chart_exchange()]), error_rate=1.0, error_statuses=(429,), seed=1)
+
+        status, _, body = server.respond("GET", "/query2.finance.yahoo.com/v8/finance/chart/AAPL?range=5d&interval=1d")
+
+        assert status == 429 and b"Too Many Requests" in body
+        assert server.stats["injected_errors"] == 1
+
+    def test_replay_session_reaches_standin(self, standin):
+        server, url = standin
+        server.latency_ms = 50
+        session = ReplaySession(url)
+
+        start = time.perf_counter()
+        response = session.get(CHART_URL, params={"range": "5d", "interval": "1d", "crumb": "x"})
+
+        assert response.status_code == 200
+        assert response.json()["chart"]["result"][0]["close"] == [150.0]
+        assert time.perf_counter() - start >= 0.05
+        assert replay_url(url, CHART_URL) == f"{url}/query2.finance.yahoo.com/v8/finance/chart/AAPL"
+
+    def test_recording_session_archives_exchanges(self, standin, tmp_path):
+        _, url = standin
+        session = RecordingSession(ArchiveWriter(tmp_path / "recorded.jsonl"))
+
+        session.get(f"{url}/query2.finance.yahoo.com/v8/finance/chart/AAPL", params={"range": "5d", "interval": "1d", "crumb": "secret"})
+
+        [exchange] = read_exchanges(tmp_path / "recorded.jsonl")
+        assert exchange.status == 200
+        assert "crumb" not in exchange.url
+        assert exchange.content == chart_exchange().content
+
+
+def test_session_from_config():
+    assert session_from_config(UpstreamConfig()) is None
+    session = session_from_config(UpstreamConfig(mode="replay", replay_url="http://127.0.0.1:9999"))
+    assert isinstance(session, ReplaySession) and session.base_url == "http://127.0.0.1:9999"
@@ -0,0 +1,81 @@
+"""
+Tests for the on-disk tool schema cache.
+"""
+import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.memory import create_connected_server_and_client_session
+from pydantic import BaseModel
+
+from src.schema_cache import SchemaCache, install_schema_cache
+
+
+class Quote(BaseModel):
+    ticker: str
+    price: float
+
+
+def build_server(path, fingerprint="v1") -> FastMCP:
+    server = FastMCP("test")
+    manager = install_schema_cache(server, path)
+    manager.cache.fingerprint = fingerprint
+    manager.cached = manager.cache.load() or {}
+
+    @server.tool()
+    async def get_quote(ticker: str, scale: float = 1.0) -> Quote:
+        """Latest quote."""
+        return Quote(ticker=ticker, price=100.0 * scale)
+
+    @server.tool()
+    async def ping() -> str:
+        """Liveness check."""
+        return "pong"
+
+    return server
+
+
+@pytest.mark.asyncio
+async def test_cached_definitions_match_built_ones(tmp_path):
+    path = tmp_path / "schemas.json"
+    cold = build_server(path)
+    built = await cold.list_tools()
+
+    warm = build_server(path)
+    assert set(warm._tool_manager._pending) == {"get_quote", "ping"}
+    assert await warm.list_tools() == built
+    assert warm._tool_manager._pending  # answering tools/list builds nothing
+
+
+@pytest.mark.asyncio
+async def test_deferred_tool_is_built_on_first_call(tmp_path):
+    path = tmp_path / "schemas.json"
+    await build_server(path).list_tools()
+    server = build_server(path)
+
+    async with create_connected_server_and_client_session(server._mcp_server) as client:
+        listed = await client.list_tools()
+        result = await client.call_tool("get_quote", {"ticker": "AAPL", "scale": 2})
+
+    assert [tool.name for tool in listed.tools] == ["get_quote", "ping"]
+    assert result.structuredContent == {"ticker": "AAPL", "price": 200.0}
+    assert set(server._tool_manager._pending) == {"ping"}
+
+
+@pytest.mark.asyncio
+async def test_stale_cache_is_rebuilt(tmp_path):
+    path = tmp_path / "schemas.json"
+    await build_server(path, fingerprint="v1").list_tools()
+
+    server = build_server(path, fingerprint="v2")
+    assert not server._tool_manager._pending
+    await server.list_tools()
+
+    assert SchemaCache(path, fingerprint="v2").load().keys() == {"get_quote", "ping"}
+    assert SchemaCache(path, fingerprint="v1").load() is None
+
+
+def test_install_after_registration_fails(tmp_path):
+    server = FastMCP("test")
+    server.add_tool(lambda: "pong", name="ping")
+
+    with pytest.raises(RuntimeError):
+        install_schema_cache(server, tmp_path / "schemas.json")
@@ -0,0 +1,68 @@
+"""
+Tests for the fast structured result conversion.
+"""
+import json
+import math
+from datetime import date, datetime, timezone
+
+import pydantic_core
+from mcp.server.fastmcp.utilities.func_metadata import func_metadata
+from pydantic import BaseModel
+
+from src.serialization import convert_result
+
+
+class Bar(BaseModel):
+    day: date
+    close: float | None
+    extras: dict
+
+
+class Series(BaseModel):
+    updated: datetime
+    bars: list[Bar]
+
+
+class Failure(BaseModel):
+    error: str
+
+
+def series() -> Series:
+    return Series(
+        updated=datetime(2025, 10, 24, 20, 0, tzinfo=timezone.utc),
+        bars=[
+            Bar(day=date(2025, 10, 23), close=math.nan, extras={"high": math.inf, "volume": 10}),
+            Bar(day=date(2025, 10, 24), close=262.82, extras={"low": -math.inf}),
+        ],
+    )
+
+
+def test_matches_fastmcp_conversion_with_nan_and_datetimes():
+    def tool() -> Series: ...
+
+    metadata = func_metadata(tool)
+    content, structured = convert_result(metadata, series())
+    expected_content, expected = metadata.convert_result(series())
+
+    # FastMCP keeps NaN floats in the dict until the transport writes them as null
+    assert structured == pydantic_core.from_json(pydantic_core.to_json(expected, inf_nan_mode="null"))
+    assert structured["bars"][0]["close"] is None and structured["bars"][0]["extras"]["high"] is None
+    assert structured["updated"] == "2025-10-24T20:00:00Z"
+    assert json.loads(content[0].text) == json.loads(expected_content[0].text)
+
+
+def test_union_results_are_wrapped():
+    def tool() -> Series | Failure: ...
+
+    metadata = func_metadata(tool)
+    content, structured = convert_result(metadata, Failure(error="not found"))
+
+    assert structured == metadata.convert_result(Failure(error="not found"))[1] == {"result": {"error": "not found"}}
+    assert content[0].text == '{"error":"not found"}'
+
+
+def test_results_without_output_schema_use_fastmcp_conversion():
+    def tool(): ...
+
+    metadata = func_metadata(tool)
+    assert convert_result(metadata, Failure(error="not found")) == metadata.convert_result(Failure(error="not found"))
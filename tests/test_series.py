@@ -0,0 +1,120 @@
+"""
+Tests for the array-backed price series.
+"""
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import series
+from src.models import HistoricalPricePoint, HistoricalPriceResponse
+from src.models.base import construct
+from src.series import PriceSeries, format_dates
+
+
+def legacy_rows(frame: pd.DataFrame) -> list[dict]:
+    """Normalization the tool did per record before PriceSeries."""
+    def value(rec, name, cast=float):
+        return cast(rec[name]) if rec.get(name) and not pd.isna(rec[name]) else None
+
+    return [
+        dict(
+            date=str(rec["Date"]),
+            open=value(rec, "Open"),
+            high=value(rec, "High"),
+            low=value(rec, "Low"),
+            close=value(rec, "Close"),
+            volume=value(rec, "Volume", int),
+            adj_close=value(rec, "Adj Close"),
+        )
+        for rec in frame.reset_index(names="Date").to_dict(orient="records")
+    ]
+
+
+def frame(index: pd.DatetimeIndex, adj_close: bool = True) -> pd.DataFrame:
+    rows = len(index)
+    close = np.linspace(100.0, 200.0, rows)
+    close[1], close[2] = np.nan, 0.0
+    data = {
+        "Open": close - 1,
+        "High": close + 2,
+        "Low": close - 2,
+        "Close": close,
+        "Volume": np.where(np.arange(rows) % 7 == 0, 0, np.arange(rows) * 1000),
+    }
+    if adj_close:
+        data["Adj Close"] = close * 0.99
+    return pd.DataFrame(data, index=index)
+
+
+@pytest.mark.parametrize("index", [
+    pd.date_range("2024-03-01", periods=400, freq="D", tz="America/New_York", name="Date"),
+    pd.date_range("2024-11-01 09:30", periods=300, freq="15min", tz="Asia/Kolkata"),
+    pd.date_range("2024-01-01", periods=50, freq="B"),
+    pd.DatetimeIndex(["2024-01-02 09:30:00.250", "2024-01-02 09:30:01", "2024-01-02 09:30:02"], tz="UTC"),
+])
+def test_rows_match_per_record_normalization(monkeypatch, index):
+    monkeypatch.setattr(series, "CHUNK_ROWS", 64)
+    for adj_close in (True, False):
+        bars = frame(index, adj_close)
+        assert list(PriceSeries.from_frame(bars).rows()) == legacy_rows(bars)
+
+
+def test_format_dates_matches_timestamp_str():
+    index = pd.DatetimeIndex(["1999-12-31 23:00", "2024-03-10 12:00", pd.NaT], tz="Europe/Paris")
+    assert format_dates(index) == [str(value) for value in index]
+    assert format_dates(pd.Index(["a", "b"])) == ["a", "b"]
+
+
+def test_float_volume_with_gaps():
+    bars = frame(pd.date_range("2024-01-01", periods=5, freq="D"))
+    bars["Volume"] = [1.0, np.nan, 0.0, 3.7, 4.0]
+    assert [row["volume"] for row in PriceSeries.from_frame(bars).rows()] == [1, None, None, 3, 4]
+
+
+def test_response_reads_and_writes_like_a_list():
+    bars = frame(pd.date_range("2024-01-01", periods=10, freq="D", tz="UTC"))
+    points = PriceSeries.from_frame(bars)
+    validated = HistoricalPriceResponse(
+        ticker="AAPL", period="1mo", interval="1d",
+        data_points=[HistoricalPricePoint(**row) for row in legacy_rows(bars)], count=10,
+    )
+    trusted = construct(HistoricalPriceResponse, {**validated.__dict__, "data_points": points})
+
+    assert len(points) == 10 and points[-1] == validated.data_points[-1]
+    assert list(points[2:4]) == validated.data_points[2:4]
+    assert json.loads(trusted.model_dump_json(by_alias=True)) == json.loads(validated.model_dump_json(by_alias=True))
+    assert trusted.model_dump(mode="json", by_alias=True) == validated.model_dump(mode="json", by_alias=True)
+    assert trusted.model_dump(mode="json", by_alias=True)["data_points"][0]["Adj Close"] == pytest.approx(99.0)
+
+
+def test_python_dump_is_plain_dicts(recwarn):
+    bars = frame(pd.date_range("2024-01-01", periods=10, freq="D", tz="UTC"))
+    validated = HistoricalPriceResponse(
+        ticker="AAPL", period="1mo", interval="1d",
+        data_points=[HistoricalPricePoint(**row) for row in legacy_rows(bars)], count=10,
+    )
+    trusted = construct(HistoricalPriceResponse, {**validated.__dict__, "data_points": PriceSeries.from_frame(bars)})
+
+    dumped = trusted.model_dump()
+    assert isinstance(dumped["data_points"], list)
+    assert all(type(point) is dict for point in dumped["data_points"])
+    assert dumped == validated.model_dump()
+    assert trusted.model_dump(by_alias=True, exclude_none=True) == validated.model_dump(by_alias=True, exclude_none=True)
+    assert trusted == validated and trusted.model_copy() == validated
+    assert not [warning for warning in recwarn if "serializ" in str(warning.message)]
+
+
+def test_field_accepts_series_and_its_own_dump():
+    bars = frame(pd.date_range("2024-01-01", periods=10, freq="D", tz="UTC"))
+    points = PriceSeries.from_frame(bars)
+    response = HistoricalPriceResponse(ticker="AAPL", period="1mo", interval="1d", data_points=points, count=10)
+
+    assert response.data_points is points
+    assert HistoricalPriceResponse.model_validate(response.model_dump()) == response
+    assert HistoricalPriceResponse.model_validate_json(response.model_dump_json()) == response
+    assert response.model_copy(deep=True) == response
+    assert points.index(points[3]) == 3 and points[3] in points
+    schema = HistoricalPriceResponse.model_json_schema(mode="serialization")["properties"]["data_points"]
+    assert schema["type"] == "array" and schema["items"] == {"$ref": "#/$defs/HistoricalPricePoint"}
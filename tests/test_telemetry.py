@@ -0,0 +1,344 @@
+"""
+Tests for metrics, request traces and the /metrics endpoint.
+"""
+import io
+import json
+
+import pytest
+from mcp.shared.memory import create_connected_server_and_client_session
+from starlette.testclient import TestClient
+
+from src.telemetry import (
+    ConsoleSpanExporter,
+    InstrumentedTicker,
+    JsonFileSpanExporter,
+    MetricsRegistry,
+    OTLPHttpSpanExporter,
+    Profiler,
+    SlowRequestLog,
+    SpanExporter,
+    Tracer,
+    profiling,
+    slowlog,
+    tracing,
+    current_trace,
+    instrumented,
+    note_error,
+    upstream_call,
+)
+from src.telemetry.metrics import tool_errors, tool_requests, upstream_bytes, upstream_duration, upstream_errors
+from src.models import TickerValidationError
+
+
+class TestMetricsRegistry:
+    """Tests for the Prometheus text renderer."""
+
+    def test_counter_and_histogram_format(self):
+        """Test samples follow the exposition format with cumulative buckets."""
+        registry = MetricsRegistry()
+        calls = registry.counter("calls_total", "Calls.", ("tool",))
+        latency = registry.histogram("latency_seconds", "Latency.", ("tool",), buckets=(0.1, 1.0))
+
+        calls.inc(tool="a")
+        calls.inc(2, tool="a")
+        latency.observe(0.05, tool="a")
+        latency.observe(0.5, tool="a")
+
+        text = registry.render()
+        assert "# TYPE calls_total counter" in text
+        assert 'calls_total{tool="a"} 3' in text
+        assert 'latency_seconds_bucket{tool="a",le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{tool="a",le="1"} 2' in text
+        assert 'latency_seconds_bucket{tool="a",le="+Inf"} 2' in text
+        assert 'latency_seconds_count{tool="a"} 2' in text
+
+    def test_label_validation(self):
+        """Test observations must supply exactly the declared labels."""
+        calls = MetricsRegistry().counter("calls_total", "Calls.", ("tool",))
+
+        with pytest.raises(ValueError):
+            calls.inc(endpoint="x")
+
+    def test_gauge_callback_and_escaping(self):
+        """Test callback gauges are read at render time and label values escaped."""
+        registry = MetricsRegistry()
+        registry.gauge_callback("depth", "Depth.", lambda: {('q"1',): 4}, ("queue",))
+
+        assert 'depth{queue="q\\"1"} 4' in registry.render()
+
+
+class TestInstrumented:
+    """Tests for the tool decorator and request trace."""
+
+    @pytest.mark.asyncio
+    async def test_counts_calls_and_error_types(self):
+        """Test successes, noted exceptions and validation errors are classified."""
+        @instrumented
+        async def probe_tool(fail: str = ""):
+            if fail == "raise":
+                try:
+                    raise KeyError("boom")
+                except KeyError as e:
+                    note_error(e)
+                    return TickerValidationError(error="Internal error", ticker="X")
+            if fail == "invalid":
+                return TickerValidationError(error="bad", ticker="X")
+            return "ok"
+
+        before = tool_requests.value(tool="probe_tool")
+        assert await probe_tool() == "ok"
+        await probe_tool(fail="raise")
+        await probe_tool(fail="invalid")
+
+        assert tool_requests.value(tool="probe_tool") == before + 3
+        assert tool_errors.value(tool="probe_tool", type="KeyError") >= 1
+        assert tool_errors.value(tool="probe_tool", type="validation") >= 1
+
+    @pytest.mark.asyncio
+    async def test_upstream_calls_attach_to_trace(self):
+        """Test upstream timings land on the active trace and the endpoint histogram."""
+        seen = []
+
+        @instrumented
+        async def traced_tool():
+            with upstream_call("probe"):
+                pass
+            seen.extend(current_trace.get().upstream)
+
+        before = upstream_duration.count(endpoint="probe")
+        await traced_tool()
+
+        assert [call.endpoint for call in seen] == ["probe"]
+        assert seen[0].ok
+        assert upstream_duration.count(endpoint="probe") == before + 1
+        assert current_trace.get() is None
+
+
+class TestInstrumentedTicker:
+    """Tests for per-call yfinance instrumentation."""
+
+    @pytest.mark.asyncio
+    async def test_records_lazy_attributes_and_calls(self, mock_yfinance_ticker):
+        """Test property reads and method calls are recorded with bytes and outcome."""
+        traces = []
+
+        @instrumented
+        async def probe_upstream():
+            company = InstrumentedTicker("AAPL")
+            assert company.isin is not None
+            assert company.info["shortName"] == "Apple Inc."
+            company.history(period="1mo", interval="1d")
+            traces.append(current_trace.get())
+
+        before = upstream_bytes.value(endpoint="history")
+        await probe_upstream()
+
+        calls = traces[0].upstream
+        assert [call.endpoint for call in calls] == ["isin", "info", "history"]
+        assert all(call.outcome == "ok" for call in calls)
+        assert calls[2].bytes > 0
+        assert upstream_bytes.value(endpoint="history") == before + calls[2].bytes
+        assert {entry["endpoint"] for entry in traces[0].upstream_summary()} == {"isin", "info", "history"}
+
+    def test_failures_and_empty_payloads(self, mocker):
+        """Test raised exceptions and empty results are reported as outcomes."""
+        from unittest.mock import MagicMock
+
+        ticker = MagicMock()
+        ticker.news = []
+        ticker.history.side_effect = ConnectionError("rate limited")
+        mocker.patch("yfinance.Ticker", return_value=ticker)
+        before = upstream_errors.value(endpoint="history")
+
+        company = InstrumentedTicker("AAPL")
+        assert company.news == []
+        with pytest.raises(ConnectionError):
+            company.history(period="1d")
+
+        assert upstream_errors.value(endpoint="history") == before + 1
+
+
+class CollectingExporter(SpanExporter):
+    """Keeps exported spans in memory."""
+
+    def __init__(self):
+        self.batches = []
+
+    def export(self, spans):
+        self.batches.append(spans)
+
+
+class TestTracing:
+    """Tests for stage spans, sampling and exporters."""
+
+    @pytest.mark.asyncio
+    async def test_protocol_call_spans_every_stage(self, mock_yfinance_ticker, monkeypatch):
+        """Test a tool call through the MCP server yields one trace with all stages."""
+        from src.server import mcp
+
+        exporter = CollectingExporter()
+        monkeypatch.setattr(tracing, "tracer", Tracer(exporter, sample_ratio=1.0))
+
+        async with create_connected_server_and_client_session(mcp._mcp_server) as client:
+            result = await client.call_tool("get_price_summary", {"ticker": "AAPL", "period": "1mo"})
+
+        assert not result.isError
+        assert len(exporter.batches) == 1
+        spans = {span.name: span for span in exporter.batches[0]}
+        assert {"tool.get_price_summary", "validate", "execute", "serialize", "yfinance.history"} <= set(spans)
+        root = spans["tool.get_price_summary"]
+        assert root.parent_id is None
+        assert len({span.trace_id for span in spans.values()}) == 1
+        assert spans["yfinance.history"].parent_id == spans["execute"].span_id
+        assert spans["serialize"].parent_id == root.span_id
+
+    @pytest.mark.asyncio
+    async def test_unsampled_calls_export_nothing(self, mock_yfinance_ticker, monkeypatch):
+        """Test a zero sample ratio keeps stage timings but exports no spans."""
+        from src.server import get_price_summary
+
+        exporter = CollectingExporter()
+        monkeypatch.setattr(tracing, "tracer", Tracer(exporter, sample_ratio=0.0))
+
+        await get_price_summary(ticker="AAPL", period="1mo", interval="1d")
+
+        assert exporter.batches == []
+
+    def test_file_and_console_exporters(self, tmp_path):
+        """Test spans are written as JSON lines and as an indented tree."""
+        from src.telemetry import Span
+
+        spans = [
+            Span("tool.x", "t" * 32, "a" * 16, None, 0, 2_000_000),
+            Span("execute", "t" * 32, "b" * 16, "a" * 16, 0, 1_000_000, error="KeyError"),
+        ]
+        path = tmp_path / "spans.jsonl"
+        JsonFileSpanExporter(str(path)).export(spans)
+        stream = io.StringIO()
+        ConsoleSpanExporter(stream).export(spans)
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["name"] for line in lines] == ["tool.x", "execute"]
+        assert lines[1]["duration_ms"] == 1.0
+        assert "  execute 1.0 ms ! KeyError" in stream.getvalue()
+
+    def test_otlp_encoding(self):
+        """Test spans are encoded as OTLP/HTTP JSON."""
+        from src.telemetry import Span
+
+        exporter = OTLPHttpSpanExporter("http://127.0.0.1:9", "svc", timeout=0.1)
+        body = json.loads(exporter.encode([Span("tool.x", "t" * 32, "a" * 16, None, 1, 2, {"upstream.calls": 2})]))
+        exporter.shutdown()
+
+        resource = body["resourceSpans"][0]
+        assert resource["resource"]["attributes"][0]["value"] == {"stringValue": "svc"}
+        span = resource["scopeSpans"][0]["spans"][0]
+        assert span["startTimeUnixNano"] == "1"
+        assert span["attributes"] == [{"key": "upstream.calls", "value": {"intValue": "2"}}]
+        assert "parentSpanId" not in span
+
+
+class TestProfiling:
+    """Tests for sampled cProfile and tracemalloc capture."""
+
+    @pytest.mark.asyncio
+    async def test_aggregated_profiles_and_memory_snapshots(self, mock_yfinance_ticker, monkeypatch, tmp_path):
+        """Test sampled calls aggregate per tool and large-payload tools snapshot memory."""
+        import pstats
+        from src.server import get_historical_stock_prices
+
+        profiler = Profiler(str(tmp_path), sample_ratio=1.0, memory_tools=("get_historical_stock_prices",), dump_every=2)
+        monkeypatch.setattr(profiling, "profiler", profiler)
+
+        for _ in range(2):
+            await get_historical_stock_prices(ticker="AAPL", period="1mo", interval="1d")
+
+        assert profiler.samples == {"get_historical_stock_prices": 2}
+        stats = pstats.Stats(str(tmp_path / "get_historical_stock_prices.prof"))
+        assert any(name == "get_historical_stock_prices" for _, _, name in stats.stats)
+        snapshots = list(tmp_path.glob("get_historical_stock_prices-*.mem.txt"))
+        assert len(snapshots) == 2
+        assert snapshots[0].read_text().startswith("# get_historical_stock_prices current=")
+
+    def test_unsampled_calls_are_not_profiled(self, tmp_path):
+        """Test a zero sample ratio records nothing."""
+        profiler = Profiler(str(tmp_path), sample_ratio=0.0)
+
+        with profiler.profile("get_stock_info"):
+            sum(range(1000))
+
+        assert profiler.samples == {}
+        assert profiler.dump() == []
+
+
+class TestSlowRequestLog:
+    """Tests for the JSON-lines slow-request log."""
+
+    @pytest.mark.asyncio
+    async def test_direct_calls_log_stages_and_cache_status(self, mock_yfinance_ticker, monkeypatch):
+        """Test slow calls record args, stage timings, upstream calls, size and cache status."""
+        from src.server import get_price_summary
+
+        stream = io.StringIO()
+        monkeypatch.setattr(slowlog, "slow_log", SlowRequestLog(0, stream=stream))
+
+        await get_price_summary(ticker="AAPL", period="1mo", interval="1d")
+        await get_price_summary(ticker="AAPL", period="1mo", interval="1d")
+
+        first, second = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert first["tool"] == "get_price_summary"
+        assert first["args"] == {"interval": "1d", "period": "1mo", "ticker": "AAPL"}
+        assert set(first["stages_ms"]) == {"validate", "fetch", "convert", "serialize"}
+        assert first["upstream_calls"] == 2
+        assert first["cache"] == "miss"
+        assert second["cache"] == "hit"
+        assert second["upstream_calls"] == 0
+        assert first["response_bytes"] > 0
+
+    @pytest.mark.asyncio
+    async def test_protocol_calls_measure_serialized_response(self, mock_yfinance_ticker, monkeypatch):
+        """Test calls through the server log the size of the converted content."""
+        from src.server import mcp
+
+        stream = io.StringIO()
+        monkeypatch.setattr(slowlog, "slow_log", SlowRequestLog(0, stream=stream))
+
+        async with create_connected_server_and_client_session(mcp._mcp_server) as client:
+            await client.call_tool("get_correlation_matrix", {"tickers": ["AAPL", "MSFT"] + [f"T{i}" for i in range(30)]})
+
+        entries = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [entry["tool"] for entry in entries] == ["get_correlation_matrix"]
+        assert entries[0]["args"]["tickers"][-1] == "... 12 more"
+        assert entries[0]["stages_ms"]["serialize"] > 0
+        assert entries[0]["response_bytes"] > 0
+
+    def test_fast_calls_are_skipped(self):
+        """Test calls under the threshold are not written."""
+        from src.telemetry import RequestTrace
+
+        stream = io.StringIO()
+        assert SlowRequestLog(1000, stream=stream).record(RequestTrace("get_stock_info"), 0.5) is None
+        assert stream.getvalue() == ""
+
+
+class TestMetricsEndpoint:
+    """Tests for the /metrics route on the HTTP app."""
+
+    @pytest.mark.asyncio
+    async def test_scrape_after_tool_call(self, mock_yfinance_ticker, monkeypatch):
+        """Test tool and cache metrics are exported in Prometheus format."""
+        from src.server import mcp, get_price_summary
+
+        await get_price_summary(ticker="AAPL", period="1mo", interval="1d")
+        # A session manager runs once; each parametrized run builds the app with its own
+        monkeypatch.setattr(mcp, "_session_manager", None)
+
+        with TestClient(mcp.streamable_http_app()) as client:
+            response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'yf_mcp_tool_requests_total{tool="get_price_summary"}' in response.text
+        assert 'yf_mcp_upstream_duration_seconds_count{endpoint="history"}' in response.text
+        assert 'yf_mcp_cache_hit_ratio{cache="history"}' in response.text
+        assert "yf_mcp_fetch_queue_depth 0" in response.text
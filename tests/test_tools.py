@@ -5,6 +5,7 @@ Tests all 9 core tools with mocked yfinance data.
 import pytest
 from src.models import (
     HistoricalPriceResponse,
+    PriceSummaryResponse,
     StockInfoResponse,
     NewsListResponse,
     StockActionsResponse,
@@ -13,9 +14,14 @@ from src.models import (
     OptionExpirationDatesResponse,
     OptionChainResponse,
     RecommendationsResponse,
+    TechnicalIndicatorsResponse,
+    IndicatorSnapshotResponse,
+    CorrelationMatrixResponse,
+    IVSurfaceResponse,
+    ExportDatasetResponse,
     TickerValidationError
 )
-from src.models.enums import FinancialType, HolderType, RecommendationType
+from src.models.enums import FinancialType, HolderType, RecommendationType, IndicatorType
 
 
 class TestGetHistoricalStockPrices:
@@ -290,6 +296,52 @@ class TestGetOptionChain:
         assert isinstance(result, OptionChainResponse)
         assert result.option_type == "puts"
 
+    @pytest.mark.asyncio
+    async def test_greeks_only_when_requested(self, mock_yfinance_ticker, mock_options_dates):
+        """Test Greeks are computed from the cached quote only on request."""
+        from src.server import get_option_chain
+
+        plain = await get_option_chain(
+            ticker="AAPL", expiration_date=mock_options_dates[0], option_type="calls"
+        )
+        with_greeks = await get_option_chain(
+            ticker="AAPL", expiration_date=mock_options_dates[0], option_type="calls", include_greeks=True
+        )
+
+        assert plain.contracts[0].delta is None
+        assert plain.underlying_price is None
+        assert with_greeks.underlying_price == 150.25
+        for contract in with_greeks.contracts:
+            assert 0 < contract.delta < 1
+            assert contract.gamma > 0
+            assert contract.theta < 0
+            assert contract.vega > 0
+
+    @pytest.mark.asyncio
+    async def test_strike_filters(self, mock_yfinance_ticker, mock_options_dates):
+        """Test strike, moneyness and open interest filters drop contracts before conversion."""
+        from src.server import get_option_chain
+
+        by_strike = await get_option_chain(
+            ticker="AAPL", expiration_date=mock_options_dates[0], option_type="calls", min_strike=152.0
+        )
+        by_moneyness = await get_option_chain(
+            ticker="AAPL", expiration_date=mock_options_dates[0], option_type="calls", moneyness_range=0.01
+        )
+        by_interest = await get_option_chain(
+            ticker="AAPL", expiration_date=mock_options_dates[0], option_type="calls", min_open_interest=4000
+        )
+        none_left = await get_option_chain(
+            ticker="AAPL", expiration_date=mock_options_dates[0], option_type="calls",
+            max_strike=100.0, include_greeks=True
+        )
+
+        assert [c.strike for c in by_strike.contracts] == [155.0]
+        assert [c.strike for c in by_moneyness.contracts] == [150.0]
+        assert by_moneyness.underlying_price == 150.25
+        assert [c.open_interest for c in by_interest.contracts] == [5000]
+        assert none_left.count == 0
+
 
 class TestGetRecommendations:
     """Tests for get_recommendations tool."""
@@ -324,6 +376,361 @@ class TestGetRecommendations:
         assert result.recommendation_type == "upgrades_downgrades"
 
 
+class TestGetPriceSummary:
+    """Tests for get_price_summary tool."""
+
+    @pytest.mark.asyncio
+    async def test_valid_ticker_returns_summary(self, mock_yfinance_ticker, mock_historical_data):
+        """Verify valid ticker returns PriceSummaryResponse."""
+        from src.server import get_price_summary
+
+        result = await get_price_summary(ticker="AAPL", period="5d", interval="1d")
+
+        assert isinstance(result, PriceSummaryResponse)
+        assert result.ticker == "AAPL"
+        assert result.bars == len(mock_historical_data)
+        assert result.first_close == 149.0
+        assert result.last_close == 151.5
+        assert result.high == 153.0
+        assert result.low == 147.0
+        assert result.period_return == pytest.approx(151.5 / 149.0 - 1)
+        assert result.realized_volatility is not None
+        assert result.max_drawdown <= 0
+
+    @pytest.mark.asyncio
+    async def test_invalid_ticker_returns_error(self, mock_yfinance_ticker):
+        """Verify invalid ticker returns TickerValidationError."""
+        from src.server import get_price_summary
+
+        result = await get_price_summary(ticker="INVALID123", period="1mo", interval="1d")
+
+        assert isinstance(result, TickerValidationError)
+        assert result.ticker == "INVALID123"
+
+
+class TestGetTechnicalIndicators:
+    """Tests for get_technical_indicators tool."""
+
+    @staticmethod
+    def _params(**overrides):
+        params = dict(
+            ticker="AAPL", period="1y", interval="1d", window=3, rsi_period=2,
+            macd_fast=2, macd_slow=3, macd_signal=2, bollinger_std=2.0, atr_period=2, limit=100,
+        )
+        params.update(overrides)
+        return params
+
+    @pytest.mark.asyncio
+    async def test_valid_ticker_returns_indicators(self, mock_yfinance_ticker, mock_historical_data):
+        """Verify indicator series are aligned with the fetched bars."""
+        from src.server import get_technical_indicators
+
+        result = await get_technical_indicators(
+            indicators=[IndicatorType.sma, IndicatorType.macd, IndicatorType.vwap],
+            **self._params()
+        )
+
+        assert isinstance(result, TechnicalIndicatorsResponse)
+        assert result.count == len(mock_historical_data)
+        assert set(result.indicators) == {"sma_3", "macd", "macd_signal", "macd_hist", "vwap"}
+        assert result.indicators["sma_3"][:2] == [None, None]
+        assert result.indicators["sma_3"][2] == pytest.approx(150.0)
+        assert all(len(values) == result.count for values in result.indicators.values())
+
+    @pytest.mark.asyncio
+    async def test_limit_returns_most_recent_bars(self, mock_yfinance_ticker):
+        """Verify limit trims the output, not the computation."""
+        from src.server import get_technical_indicators
+
+        result = await get_technical_indicators(indicators=[IndicatorType.sma], **self._params(limit=2))
+
+        assert result.count == 2
+        assert result.indicators["sma_3"] == pytest.approx([151.0, 151.5])
+
+    @pytest.mark.asyncio
+    async def test_results_are_memoized(self, mock_yfinance_ticker):
+        """Verify repeated queries with the same parameters skip the upstream fetch."""
+        from src.server import get_technical_indicators
+
+        await get_technical_indicators(indicators=[IndicatorType.rsi], **self._params())
+        await get_technical_indicators(indicators=[IndicatorType.rsi], **self._params(limit=1))
+
+        assert mock_yfinance_ticker.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_macd_spans_are_checked(self, mock_yfinance_ticker):
+        """Verify a fast span that is not shorter than the slow one is rejected before fetching."""
+        from src.server import get_technical_indicators
+
+        result = await get_technical_indicators(indicators=[IndicatorType.macd], **self._params(macd_fast=26, macd_slow=26))
+
+        assert isinstance(result, TickerValidationError)
+        assert "macd_fast" in result.error
+        assert mock_yfinance_ticker.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_invalid_ticker_returns_error(self, mock_yfinance_ticker):
+        """Verify invalid ticker returns TickerValidationError."""
+        from src.server import get_technical_indicators
+
+        result = await get_technical_indicators(indicators=[IndicatorType.ema], **self._params(ticker="INVALID123"))
+
+        assert isinstance(result, TickerValidationError)
+        assert "not found" in result.error.lower()
+
+
+class TestGetIndicatorSnapshot:
+    """Tests for get_indicator_snapshot tool."""
+
+    @pytest.mark.asyncio
+    async def test_watchlist_snapshot(self, mock_yfinance_ticker):
+        """Verify each valid ticker gets a snapshot and invalid ones are reported."""
+        from src.server import get_indicator_snapshot
+
+        result = await get_indicator_snapshot(
+            tickers=["AAPL", "MSFT", "INVALID123"], interval="1d", ema_span=3, rsi_period=2, volatility_window=2
+        )
+
+        assert isinstance(result, IndicatorSnapshotResponse)
+        assert result.count == 2
+        assert [snap.ticker for snap in result.snapshots] == ["AAPL", "MSFT"]
+        assert result.snapshots[0].new_bars == 5
+        assert result.snapshots[0].close == 151.5
+        assert result.snapshots[0].ema is not None
+        assert [error.ticker for error in result.errors] == ["INVALID123"]
+
+    @pytest.mark.asyncio
+    async def test_refresh_only_processes_new_bars(self, mock_yfinance_ticker):
+        """Verify a second refresh reuses the stored state."""
+        from src.server import get_indicator_snapshot
+
+        params = dict(tickers=["AAPL"], interval="1d", ema_span=3, rsi_period=2, volatility_window=2)
+        first = await get_indicator_snapshot(**params)
+        second = await get_indicator_snapshot(**params)
+
+        assert first.snapshots[0].new_bars == 5
+        assert second.snapshots[0].new_bars == 0
+        assert second.snapshots[0].ema == pytest.approx(first.snapshots[0].ema)
+
+
+class TestGetCorrelationMatrix:
+    """Tests for get_correlation_matrix tool."""
+
+    @pytest.mark.asyncio
+    async def test_full_matrix(self, mock_yfinance_ticker):
+        """Verify matrices cover valid tickers and failures are reported."""
+        from src.server import get_correlation_matrix
+
+        result = await get_correlation_matrix(
+            tickers=["AAPL", "MSFT", "INVALID123"], period="1y", interval="1d", top_k=0
+        )
+
+        assert isinstance(result, CorrelationMatrixResponse)
+        assert result.tickers == ["AAPL", "MSFT"]
+        assert result.observations == 4
+        assert result.correlation == [pytest.approx([1.0, 1.0])] * 2
+        assert len(result.covariance) == 2
+        assert result.top_pairs is None
+        assert [error.ticker for error in result.errors] == ["INVALID123"]
+
+    @pytest.mark.asyncio
+    async def test_top_k_pairs(self, mock_yfinance_ticker):
+        """Verify top_k returns pairs instead of matrices."""
+        from src.server import get_correlation_matrix
+
+        result = await get_correlation_matrix(tickers=["AAPL", "MSFT"], period="1y", interval="1d", top_k=5)
+
+        assert result.correlation is None
+        assert len(result.top_pairs) == 1
+        assert result.top_pairs[0].ticker_a == "AAPL"
+        assert result.top_pairs[0].correlation == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_requires_two_valid_tickers(self, mock_yfinance_ticker):
+        """Verify a single valid ticker returns an error."""
+        from src.server import get_correlation_matrix
+
+        result = await get_correlation_matrix(tickers=["AAPL", "NOTREAL"], period="1y", interval="1d", top_k=0)
+
+        assert isinstance(result, TickerValidationError)
+
+    @pytest.mark.asyncio
+    async def test_memory_budget(self, mock_yfinance_ticker, monkeypatch):
+        """Verify requests over the memory budget are rejected."""
+        from src.config import config
+        from src.server import get_correlation_matrix
+
+        monkeypatch.setattr(config.analytics, "memory_budget_mb", 1e-6)
+        result = await get_correlation_matrix(tickers=["AAPL", "MSFT"], period="1y", interval="1d", top_k=0)
+
+        assert isinstance(result, TickerValidationError)
+        assert "memory budget" in result.error
+
+
+class TestTrustedConstruction:
+    """Tools build the same models with and without validation."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("tool, arguments", [
+        ("get_historical_stock_prices", {"ticker": "AAPL", "period": "1mo", "interval": "1d"}),
+        ("get_yahoo_finance_news", {"ticker": "AAPL"}),
+        ("get_stock_actions", {"ticker": "AAPL"}),
+        ("get_option_chain", {"ticker": "AAPL", "option_type": "calls"}),
+        ("get_recommendations", {"ticker": "AAPL", "recommendation_type": RecommendationType.recommendations}),
+        ("get_recommendations", {"ticker": "AAPL", "recommendation_type": RecommendationType.upgrades_downgrades, "months_back": 12}),
+    ])
+    async def test_trusted_models_match_validated(self, mock_yfinance_ticker, mock_options_dates, monkeypatch, tool, arguments):
+        """Test skipping validation changes nothing in the response."""
+        import src.server
+        from src.config import config
+
+        function = getattr(src.server, tool)
+        if tool == "get_option_chain":
+            arguments = {**arguments, "expiration_date": mock_options_dates[0]}
+        monkeypatch.setattr(config, "validate_models", False)
+        trusted = await function(**arguments)
+        monkeypatch.setattr(config, "validate_models", True)
+        validated = await function(**arguments)
+
+        assert not isinstance(trusted, TickerValidationError)
+        assert trusted.model_dump(by_alias=True) == validated.model_dump(by_alias=True)
+        assert trusted.model_dump(mode="json", by_alias=True) == validated.model_dump(mode="json", by_alias=True)
+
+
+    @pytest.mark.asyncio
+    async def test_rows_missing_required_fields_are_reported(self, mock_yfinance_ticker):
+        """Test untitled articles and undated recommendations return an error, not a partial list."""
+        import src.server
+
+        create = mock_yfinance_ticker.side_effect
+
+        def untitled(ticker):
+            company = create(ticker)
+            company.news = [*company.news, {"content": {"contentType": "STORY", "title": None}}]
+            # yfinance's recommendations frame has no Date column
+            company.recommendations = company.recommendations.drop(columns="Date")
+            return company
+
+        mock_yfinance_ticker.side_effect = untitled
+        news = await src.server.get_yahoo_finance_news(ticker="AAPL")
+        recommendations = await src.server.get_recommendations(
+            ticker="AAPL", recommendation_type=RecommendationType.recommendations, months_back=12
+        )
+
+        assert isinstance(news, TickerValidationError) and "1 news articles" in news.error
+        assert isinstance(recommendations, TickerValidationError) and "5 recommendations" in recommendations.error
+
+
+class TestGetIVSurface:
+    """Tests for get_iv_surface tool."""
+
+    @pytest.mark.asyncio
+    async def test_surface_grid(self, mock_yfinance_ticker, mock_options_dates):
+        """Verify the surface covers the grid and term structure covers every expiration."""
+        from src.server import get_iv_surface
+
+        result = await get_iv_surface(
+            ticker="AAPL", max_expirations=8, moneyness=[1.1, 0.9, 1.0], tenor_days=[30, 60]
+        )
+
+        assert isinstance(result, IVSurfaceResponse)
+        assert result.underlying_price == 150.25
+        assert result.moneyness == [0.9, 1.0, 1.1]
+        assert len(result.implied_volatility) == 2
+        assert all(len(row) == 3 for row in result.implied_volatility)
+        assert [point.expiration_date for point in result.term_structure] == mock_options_dates
+        assert 0.25 < result.term_structure[0].atm_iv < 0.28
+
+    @pytest.mark.asyncio
+    async def test_smiles_are_cached(self, mock_yfinance_ticker):
+        """Verify re-gridding reuses the fitted smiles."""
+        from src.server import get_iv_surface
+
+        await get_iv_surface(ticker="AAPL", max_expirations=2, moneyness=[1.0], tenor_days=[30])
+        calls = mock_yfinance_ticker.call_count
+        result = await get_iv_surface(ticker="AAPL", max_expirations=2, moneyness=[0.95, 1.05], tenor_days=[45])
+
+        assert mock_yfinance_ticker.call_count == calls
+        assert len(result.term_structure) == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_ticker(self, mock_yfinance_ticker):
+        """Verify unknown tickers return an error."""
+        from src.server import get_iv_surface
+
+        result = await get_iv_surface(ticker="INVALID123", max_expirations=8, moneyness=[1.0], tenor_days=[30])
+
+        assert isinstance(result, TickerValidationError)
+
+
+class TestExportDataset:
+    """Tests for export_dataset tool."""
+
+    @staticmethod
+    async def export(tmp_path, monkeypatch, tickers, dataset, file_format="parquet", file_name="export"):
+        from src.config import config
+        from src.server import export_dataset
+
+        monkeypatch.setattr(config.export, "directory", str(tmp_path))
+        monkeypatch.setattr(config.export, "row_group_size", 4)
+        return await export_dataset(
+            tickers=tickers, dataset=dataset, file_format=file_format, period="1mo", interval="1d",
+            financial_type=FinancialType.income_stmt, max_expirations=2, file_name=file_name
+        )
+
+    @pytest.mark.asyncio
+    async def test_history_to_parquet(self, mock_yfinance_ticker, tmp_path, monkeypatch):
+        """Verify bars of every valid ticker are written in row groups and bad tickers are reported."""
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        result = await self.export(tmp_path, monkeypatch, ["AAPL", "MSFT", "INVALID123"], "history")
+
+        assert isinstance(result, ExportDatasetResponse)
+        assert result.path == str(tmp_path / "export.parquet") and result.uri.startswith("file://")
+        assert result.tickers == ["AAPL", "MSFT"]
+        assert [error.ticker for error in result.errors] == ["INVALID123"]
+        table = pq.read_table(result.path)
+        assert table.num_rows == result.rows == 10
+        assert pq.ParquetFile(result.path).num_row_groups == result.row_groups == 3
+        assert table.column("ticker").to_pylist() == ["AAPL"] * 5 + ["MSFT"] * 5
+        assert table.column("close").to_pylist()[:5] == [149.0, 150.0, 151.0, 152.0, 151.5]
+        assert list(tmp_path.iterdir()) == [tmp_path / "export.parquet"]
+
+    @pytest.mark.asyncio
+    async def test_statements_and_chains_to_arrow(self, mock_yfinance_ticker, mock_option_chain_data, tmp_path, monkeypatch):
+        """Verify statements are written in long form and chains with both sides of each expiration."""
+        pa = pytest.importorskip("pyarrow")
+
+        statements = await self.export(tmp_path, monkeypatch, ["AAPL"], "financials", "arrow", "statements")
+        chains = await self.export(tmp_path, monkeypatch, ["AAPL"], "options", "arrow", "chains.arrow")
+
+        table = pa.ipc.open_file(statements.path).read_all()
+        assert statements.path.endswith("statements.arrow") and table.num_rows == 6
+        assert sorted(set(table.column("item").to_pylist())) == ["Net Income", "Revenue"]
+        table = pa.ipc.open_file(chains.path).read_all()
+        assert chains.path.endswith("chains.arrow") and table.num_rows == 2 * 2 * len(mock_option_chain_data)
+        assert table.column("option_type").to_pylist().count("puts") == 2 * len(mock_option_chain_data)
+
+    @pytest.mark.asyncio
+    async def test_invalid_requests(self, mock_yfinance_ticker, tmp_path, monkeypatch):
+        """Verify unsafe file names and exports without data return errors and leave no file."""
+        pytest.importorskip("pyarrow")
+
+        assert isinstance(await self.export(tmp_path, monkeypatch, ["AAPL"], "history", file_name="../escape"), TickerValidationError)
+        assert isinstance(await self.export(tmp_path, monkeypatch, ["INVALID123"], "history"), TickerValidationError)
+        assert not any(tmp_path.iterdir())
+
+        (tmp_path / "busy.parquet.partial").touch()
+        busy = await self.export(tmp_path, monkeypatch, ["AAPL"], "history", file_name="busy")
+        assert isinstance(busy, TickerValidationError) and "already in progress" in busy.error
+        assert [path.name for path in tmp_path.iterdir()] == ["busy.parquet.partial"]
+
+        (tmp_path / "kept.parquet").write_bytes(b"user data")
+        kept = await self.export(tmp_path, monkeypatch, ["AAPL"], "history", file_name="kept")
+        assert isinstance(kept, TickerValidationError) and "already exists" in kept.error
+        assert (tmp_path / "kept.parquet").read_bytes() == b"user data"
+
+
 class TestErrorHandling:
     """Tests for error handling across all tools."""
 
@@ -336,6 +743,30 @@ class TestErrorHandling:
         
         assert isinstance(result, TickerValidationError)
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("tool, arguments", [
+        ("get_historical_stock_prices", {}),
+        ("get_price_summary", {}),
+        ("get_technical_indicators", TestGetTechnicalIndicators._params(indicators=[IndicatorType.sma])),
+    ])
+    async def test_history_is_fetched_off_the_event_loop(self, mock_yfinance_ticker, monkeypatch, tool, arguments):
+        """Verify history tools run the blocking fetch on the fetch executor."""
+        import threading
+        import src.server as server
+
+        original, threads = server.fetch_history, []
+
+        def fetch_history(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(server, "fetch_history", fetch_history)
+        arguments = {"ticker": "AAPL", "period": "1mo", "interval": "1d", **arguments}
+
+        await getattr(server, tool)(**arguments)
+
+        assert threads and all(name.startswith("yf-fetch") for name in threads)
+
     @pytest.mark.asyncio
     async def test_special_characters_in_ticker(self, mock_yfinance_ticker):
         """Test handling of special characters."""